@@ -2,7 +2,14 @@ from contextlib import asynccontextmanager
 import os
 from fastapi import FastAPI
 from services.database import create_db_and_tables
-from utils.get_env import get_app_data_directory_env
+from services.icon_finder_service import ICON_FINDER_SERVICE
+from services.libreoffice_pool import LIBREOFFICE_POOL
+from services.llm_client_registry import LLM_CLIENT_REGISTRY
+from services.process_pool_service import PROCESS_POOL_SERVICE
+from services.stock_image_session_pool import STOCK_IMAGE_SESSION_POOL
+from services.warmup_service import WARMUP_SERVICE
+from utils.get_env import get_app_data_directory_env, get_startup_warmup_env
+from utils.parsers import parse_bool_or_none
 
 @asynccontextmanager
 async def app_lifespan(_: FastAPI):
@@ -17,5 +24,16 @@ async def app_lifespan(_: FastAPI):
 
     os.makedirs(app_data_dir, exist_ok=True)
     await create_db_and_tables()
+    await STOCK_IMAGE_SESSION_POOL.start()
+    if parse_bool_or_none(get_startup_warmup_env()):
+        WARMUP_SERVICE.start()
     # Model availability check removed as we only use Gemini now.
     yield
+    await WARMUP_SERVICE.stop()
+    await STOCK_IMAGE_SESSION_POOL.close()
+    LLM_CLIENT_REGISTRY.clear()
+    PROCESS_POOL_SERVICE.shutdown()
+    if LIBREOFFICE_POOL.is_initialized():
+        LIBREOFFICE_POOL.shutdown()
+    if ICON_FINDER_SERVICE.is_initialized():
+        ICON_FINDER_SERVICE.save_query_cache()
@@ -7,6 +7,7 @@ from api.v1.ppt.router import API_V1_PPT_ROUTER
 from api.v1.webhook.router import API_V1_WEBHOOK_ROUTER
 from api.v1.mock.router import API_V1_MOCK_ROUTER
 from api.v1.user_config.router import USER_CONFIG_ROUTER as user_config_router
+from api.v1.health.router import HEALTH_ROUTER
 from api.firebase_auth_middleware import FirebaseAuthMiddleware
 
 
@@ -17,6 +18,7 @@ app.include_router(API_V1_PPT_ROUTER)
 app.include_router(API_V1_WEBHOOK_ROUTER)
 app.include_router(API_V1_MOCK_ROUTER)
 app.include_router(user_config_router, prefix="/api/v1")
+app.include_router(HEALTH_ROUTER)
 
 # Mount static files directories
 app.mount("/app_data", StaticFiles(directory="../app_data"), name="app_data")
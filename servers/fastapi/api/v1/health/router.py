@@ -0,0 +1,18 @@
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from services.warmup_service import WARMUP_SERVICE
+
+HEALTH_ROUTER = APIRouter(prefix="/health", tags=["Health"])
+
+
+@HEALTH_ROUTER.get("")
+async def get_health():
+    return {"status": "ok"}
+
+
+@HEALTH_ROUTER.get("/ready")
+async def get_readiness():
+    """Returns 503 until the startup warm-up is done."""
+    status = WARMUP_SERVICE.get_status()
+    return JSONResponse(status, status_code=200 if status["ready"] else 503)
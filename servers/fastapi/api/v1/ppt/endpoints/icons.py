@@ -1,10 +1,11 @@
 from typing import List
 from fastapi import APIRouter
-from services.icon_finder_service import ICON_FINDER_SERVICE
+from services.icon_finder_service import get_icon_finder_service
 
 ICONS_ROUTER = APIRouter(prefix="/icons", tags=["Icons"])
 
 
 @ICONS_ROUTER.get("/search", response_model=List[str])
 async def search_icons(query: str, limit: int = 20):
-    return await ICON_FINDER_SERVICE.search_icons(query, limit)
+    icon_finder_service = await get_icon_finder_service()
+    return await icon_finder_service.search_icons(query, limit)
@@ -19,6 +19,7 @@ from models.sse_response import (
 from services.temp_file_service import TEMP_FILE_SERVICE
 from services.database import get_async_session
 from services.documents_loader import DocumentsLoader
+from utils.document_context import get_document_context
 from utils.llm_calls.generate_presentation_outlines import generate_ppt_outline
 from utils.ppt_utils import get_presentation_title_from_outlines
 
@@ -47,7 +48,15 @@ async def stream_outlines(
             await documents_loader.load_documents(temp_dir)
             documents = documents_loader.documents
             if documents:
-                additional_context = "\n\n".join(documents)
+                document_context = await get_document_context(documents)
+                additional_context = document_context.text
+                yield SSEStatusResponse(
+                    status=(
+                        f"Using ~{document_context.tokens} of "
+                        f"~{document_context.document_tokens} document tokens"
+                    ),
+                    tokens=document_context.get_token_estimates(),
+                ).to_string()
 
         presentation_outlines_text = ""
 
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import shutil
 import tempfile
@@ -6,7 +7,7 @@ from typing import List, Optional
 from fastapi import APIRouter, UploadFile, File, HTTPException
 from pydantic import BaseModel
 
-from services.documents_loader import DocumentsLoader
+from services.pdf_renderer import iter_pdf_page_images
 from utils.asset_directory_utils import get_images_directory
 import uuid
 from constants.documents import PDF_MIME_TYPES
@@ -26,6 +27,27 @@ class PdfSlidesResponse(BaseModel):
     total_slides: int
 
 
+def _save_screenshot(
+    screenshot_path: str,
+    presentation_images_dir: str,
+    presentation_id: uuid.UUID,
+    slide_number: int,
+) -> str:
+    """Copies the screenshot to the presentation images and returns its url."""
+    screenshot_filename = f"slide_{slide_number}.png"
+    permanent_screenshot_path = os.path.join(
+        presentation_images_dir, screenshot_filename
+    )
+
+    if os.path.exists(screenshot_path) and os.path.getsize(screenshot_path) > 0:
+        # Use shutil.copy2 instead of os.rename to handle cross-device moves
+        shutil.copy2(screenshot_path, permanent_screenshot_path)
+        return f"/app_data/images/{presentation_id}/{screenshot_filename}"
+
+    # Fallback if screenshot generation failed or file is empty placeholder
+    return "/static/images/placeholder.jpg"
+
+
 @PDF_SLIDES_ROUTER.post("/process", response_model=PdfSlidesResponse)
 async def process_pdf_slides(
     pdf_file: UploadFile = File(..., description="PDF file to process")
@@ -35,7 +57,7 @@ async def process_pdf_slides(
 
     This endpoint:
     1. Validates the uploaded PDF file
-    2. Uses ImageMagick to convert PDF pages to PNG images
+    2. Renders the PDF pages to PNG images in parallel
     3. Returns screenshot URLs for each slide/page
 
     Note: Font installation is not needed since PDFs already have fonts embedded.
@@ -67,43 +89,30 @@ async def process_pdf_slides(
                 pdf_content = await pdf_file.read()
                 f.write(pdf_content)
 
-            # Generate screenshots from PDF using ImageMagick
-            screenshot_paths = await DocumentsLoader.get_page_images_from_pdf_async(
-                pdf_path, temp_dir
-            )
-            print(f"Generated {len(screenshot_paths)} PDF screenshots")
-
-            # Move screenshots to images directory and generate URLs
             images_dir = get_images_directory()
             presentation_id = uuid.uuid4()
             presentation_images_dir = os.path.join(images_dir, str(presentation_id))
             os.makedirs(presentation_images_dir, exist_ok=True)
 
-            slides_data = []
-
-            for i, screenshot_path in enumerate(screenshot_paths, 1):
-                # Move screenshot to permanent location
-                screenshot_filename = f"slide_{i}.png"
-                permanent_screenshot_path = os.path.join(
-                    presentation_images_dir, screenshot_filename
+            # Pages are rendered in parallel, each screenshot is copied to the
+            # images directory as soon as its page is done
+            screenshot_urls = {}
+            async for page_number, screenshot_path in iter_pdf_page_images(
+                pdf_path, temp_dir
+            ):
+                screenshot_urls[page_number] = await asyncio.to_thread(
+                    _save_screenshot,
+                    screenshot_path,
+                    presentation_images_dir,
+                    presentation_id,
+                    page_number,
                 )
+            print(f"Generated {len(screenshot_urls)} PDF screenshots")
 
-                if (
-                    os.path.exists(screenshot_path)
-                    and os.path.getsize(screenshot_path) > 0
-                ):
-                    # Use shutil.copy2 instead of os.rename to handle cross-device moves
-                    shutil.copy2(screenshot_path, permanent_screenshot_path)
-                    screenshot_url = (
-                        f"/app_data/images/{presentation_id}/{screenshot_filename}"
-                    )
-                else:
-                    # Fallback if screenshot generation failed or file is empty placeholder
-                    screenshot_url = "/static/images/placeholder.jpg"
-
-                slides_data.append(
-                    PdfSlideData(slide_number=i, screenshot_url=screenshot_url)
-                )
+            slides_data = [
+                PdfSlideData(slide_number=i, screenshot_url=screenshot_urls[i])
+                for i in sorted(screenshot_urls)
+            ]
 
             return PdfSlidesResponse(
                 success=True, slides=slides_data, total_slides=len(slides_data)
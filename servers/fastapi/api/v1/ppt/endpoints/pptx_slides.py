@@ -13,6 +13,7 @@ import xml.etree.ElementTree as ET
 import re
 
 from services.documents_loader import DocumentsLoader
+from services.libreoffice_pool import LIBREOFFICE_POOL
 from utils.asset_directory_utils import get_images_directory
 import uuid
 from constants.documents import POWERPOINT_TYPES
@@ -338,14 +339,12 @@ async def process_pptx_slides(
             # Convert PPTX to PDF
             pdf_path = await _convert_pptx_to_pdf(pptx_path, temp_dir)
 
-            # Generate screenshots using LibreOffice
-            screenshot_paths = await DocumentsLoader.get_page_images_from_pdf_async(
-                pdf_path, temp_dir
+            # Render the screenshots while fonts are analyzed across all slides
+            screenshot_paths, font_analysis = await asyncio.gather(
+                DocumentsLoader.get_page_images_from_pdf_async(pdf_path, temp_dir),
+                analyze_fonts_in_all_slides(slide_xmls),
             )
             print(f"Screenshot paths: {screenshot_paths}")
-
-            # Analyze fonts across all slides
-            font_analysis = await analyze_fonts_in_all_slides(slide_xmls)
             print(
                 f"Font analysis completed: {len(font_analysis.internally_supported_fonts)} supported, {len(font_analysis.not_supported_fonts)} not supported"
             )
@@ -544,59 +543,16 @@ def _extract_slide_xmls(pptx_path: str, temp_dir: str) -> List[str]:
 
 
 async def _convert_pptx_to_pdf(pptx_path: str, temp_dir: str) -> str:
-    """Converts a PPTX file to a PDF using LibreOffice."""
-
-    # Find the LibreOffice executable
-    possible_paths = [
-        "libreoffice",  # Common on Linux
-        "/Applications/LibreOffice.app/Contents/MacOS/soffice",  # macOS
-    ]
-    
-    libreoffice_path = None
-    for path in possible_paths:
-        if shutil.which(path):
-            libreoffice_path = path
-            break
-
-    if not libreoffice_path:
-        raise Exception(
-            "LibreOffice not found. Please ensure it is installed and in your system's PATH, "
-            "or that it's in the standard macOS Applications folder."
-        )
-
-    pdf_path = ""
+    """Converts a PPTX file to a PDF with the pooled LibreOffice workers."""
     try:
-        print(f"Attempting to convert PPTX to PDF using: {libreoffice_path}")
-        # Step 1: Convert PPTX to PDF using LibreOffice
-        process = await asyncio.create_subprocess_exec(
-            libreoffice_path,
-            "--headless",
-            "--convert-to",
-            "pdf",
-            "--outdir",
-            temp_dir,
-            pptx_path,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
-
-        stdout, stderr = await process.communicate()
-
-        if process.returncode != 0:
-            raise Exception(f"LibreOffice conversion failed: {stderr.decode().strip()}")
-
-        # Find the generated PDF file (LibreOffice uses original filename)
-        pdf_files = [f for f in os.listdir(temp_dir) if f.endswith(".pdf")]
-        if not pdf_files:
-            raise Exception("LibreOffice failed to generate PDF file")
-
-        actual_pdf_path = os.path.join(temp_dir, pdf_files[0])
-        print(f"Generated PDF: {actual_pdf_path}")
-        return actual_pdf_path
+        print(f"Attempting to convert PPTX to PDF: {pptx_path}")
+        pdf_path = await LIBREOFFICE_POOL.convert_async(pptx_path, temp_dir)
+        print(f"Generated PDF: {pdf_path}")
+        return pdf_path
 
     except Exception as e:
         # Re-raise the specific exceptions we've already handled
-        if "timed out" in str(e) or "failed:" in str(e):
+        if "timed out" in str(e) or "failed:" in str(e) or "not found" in str(e):
             raise
         # Handle any other unexpected exceptions
         raise Exception(f"Screenshot generation failed: {str(e)}")
@@ -7,7 +7,15 @@ import random
 import traceback
 from typing import Annotated, List, Literal, Optional, Tuple
 import dirtyjson
-from fastapi import APIRouter, BackgroundTasks, Body, Depends, HTTPException, Path
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Body,
+    Depends,
+    HTTPException,
+    Path,
+    Query,
+)
 from fastapi.responses import StreamingResponse
 from sqlalchemy import delete
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -32,11 +40,16 @@ from models.presentation_with_slides import (
 )
 from models.sql.template import TemplateModel
 
+from services.document_passage_index import (
+    get_slide_document_contexts,
+    get_slide_document_contexts_from_files,
+)
 from services.documents_loader import DocumentsLoader
 from services.webhook_service import WebhookService
 from utils.get_layout_by_name import get_layout_by_name
 from services.image_generation_service import ImageGenerationService
 from utils.dict_utils import deep_update
+from utils.document_context import get_document_context
 from utils.export_utils import export_presentation
 from utils.llm_calls.generate_presentation_outlines import generate_ppt_outline
 from models.sql.slide import SlideModel
@@ -64,6 +77,7 @@ from utils.ppt_utils import (
 from utils.process_slides import (
     process_slide_add_placeholder_assets,
     process_slide_and_fetch_assets,
+    process_slides_and_fetch_icons,
 )
 import uuid
 
@@ -257,8 +271,15 @@ async def prepare_presentation(
 
 @PRESENTATION_ROUTER.get("/stream/{id}", response_model=PresentationWithSlides)
 async def stream_presentation(
-    id: uuid.UUID, sql_session: AsyncSession = Depends(get_async_session)
+    id: uuid.UUID,
+    out_of_order: bool = False,
+    sql_session: AsyncSession = Depends(get_async_session),
 ):
+    """
+    Streams slides as they are generated. Slides are generated concurrently and
+    emitted in slide order, unless out_of_order is set, in which case each slide
+    is emitted as soon as it is ready and its chunk is tagged with its index.
+    """
     presentation = await sql_session.get(PresentationModel, id)
     if not presentation:
         raise HTTPException(status_code=404, detail="Presentation not found")
@@ -283,56 +304,85 @@ async def stream_presentation(
         # These tasks will be gathered and awaited after all slides are generated
         async_assets_generation_tasks = []
 
+        # Source document passages for each slide, before anything is streamed
+        slide_document_contexts = await get_slide_document_contexts_from_files(
+            presentation.file_paths, [each.content for each in outline.slides]
+        )
+
         slides: List[SlideModel] = []
         yield SSEResponse(
             event="response",
             data=json.dumps({"type": "chunk", "chunk": '{ "slides": [ '}),
         ).to_string()
-        for i, slide_layout_index in enumerate(structure.slides):
-            slide_layout = layout.slides[slide_layout_index]
 
-            try:
-                slide_content = await get_slide_content_from_type_and_outline(
-                    slide_layout,
-                    outline.slides[i],
-                    presentation.language,
-                    presentation.tone,
-                    presentation.verbosity,
-                    presentation.instructions,
+        async def generate_slide_content(i: int) -> Tuple[int, dict]:
+            slide_content = await get_slide_content_from_type_and_outline(
+                layout.slides[structure.slides[i]],
+                outline.slides[i],
+                presentation.language,
+                presentation.tone,
+                presentation.verbosity,
+                presentation.instructions,
+                slide_document_contexts[i],
+            )
+            return i, slide_content
+
+        # Concurrency is bounded by SLIDE_CONTENT_LIMITER
+        content_tasks = [
+            asyncio.create_task(generate_slide_content(i))
+            for i in range(len(structure.slides))
+        ]
+
+        try:
+            for next_content in (
+                asyncio.as_completed(content_tasks) if out_of_order else content_tasks
+            ):
+                try:
+                    i, slide_content = await next_content
+                except HTTPException as e:
+                    yield SSEErrorResponse(detail=e.detail).to_string()
+                    return
+
+                slide = SlideModel(
+                    presentation=id,
+                    layout_group=layout.name,
+                    layout=layout.slides[structure.slides[i]].id,
+                    index=i,
+                    speaker_note=slide_content.get("__speaker_note__", ""),
+                    content=slide_content,
                 )
-            except HTTPException as e:
-                yield SSEErrorResponse(detail=e.detail).to_string()
-                return
+                slides.append(slide)
 
-            slide = SlideModel(
-                presentation=id,
-                layout_group=layout.name,
-                layout=slide_layout.id,
-                index=i,
-                speaker_note=slide_content.get("__speaker_note__", ""),
-                content=slide_content,
-            )
-            slides.append(slide)
+                # This will mutate slide and add placeholder assets
+                process_slide_add_placeholder_assets(slide)
 
-            # This will mutate slide and add placeholder assets
-            process_slide_add_placeholder_assets(slide)
+                # This will mutate slide, icons are fetched for all slides at once
+                async_assets_generation_tasks.append(
+                    process_slide_and_fetch_assets(
+                        image_generation_service, slide, fetch_icons=False
+                    )
+                )
 
-            # This will mutate slide
-            async_assets_generation_tasks.append(
-                process_slide_and_fetch_assets(image_generation_service, slide)
-            )
+                chunk = {"type": "chunk", "chunk": slide.model_dump_json()}
+                if out_of_order:
+                    chunk["index"] = i
+                yield SSEResponse(event="response", data=json.dumps(chunk)).to_string()
+        finally:
+            # Client disconnected or a slide failed, stop generating the rest
+            for task in content_tasks:
+                task.cancel()
 
-            yield SSEResponse(
-                event="response",
-                data=json.dumps({"type": "chunk", "chunk": slide.model_dump_json()}),
-            ).to_string()
+        slides.sort(key=lambda slide: slide.index)
 
         yield SSEResponse(
             event="response",
             data=json.dumps({"type": "chunk", "chunk": " ] }"}),
         ).to_string()
 
-        generated_assets_lists = await asyncio.gather(*async_assets_generation_tasks)
+        generated_assets_lists, _ = await asyncio.gather(
+            asyncio.gather(*async_assets_generation_tasks),
+            process_slides_and_fetch_icons(slides),
+        )
         generated_assets = []
         for assets_list in generated_assets_lists:
             generated_assets.extend(assets_list)
@@ -405,10 +455,17 @@ async def update_presentation(
 async def export_presentation_as_pptx(
     pptx_model: Annotated[
         PptxPresentationModel, Body(description="Presentation model to export")
-    ]
+    ],
+    image_dpi: Annotated[
+        Optional[int],
+        Query(
+            gt=0,
+            description="Resample pictures to their box size at this resolution",
+        ),
+    ] = None,
 ):
     temp_dir = TEMP_FILE_SERVICE.create_temp_dir()
-    pptx_creator = PptxPresentationCreator(pptx_model, temp_dir)
+    pptx_creator = PptxPresentationCreator(pptx_model, temp_dir, image_dpi=image_dpi)
     await pptx_creator.create_ppt()
 
     export_directory = get_exports_directory()
@@ -430,6 +487,13 @@ async def export_presentation_as_pptx_or_pdf(
     export_as: Annotated[
         Literal["pptx", "pdf"], Body(description="Format to export the presentation as")
     ] = "pptx",
+    image_dpi: Annotated[
+        Optional[int],
+        Body(
+            gt=0,
+            description="Resample PPTX pictures to their box size at this resolution",
+        ),
+    ] = None,
     sql_session: AsyncSession = Depends(get_async_session),
 ):
     presentation = await sql_session.get(PresentationModel, id)
@@ -441,6 +505,7 @@ async def export_presentation_as_pptx_or_pdf(
         id,
         presentation.title or str(uuid.uuid4()),
         export_as,
+        image_dpi,
     )
 
     return PresentationPathAndEditPath(
@@ -505,6 +570,7 @@ async def generate_presentation_handler(
             using_slides_markdown = True
             request.n_slides = len(request.slides_markdown)
 
+        documents = []
         if not using_slides_markdown:
             additional_context = ""
 
@@ -520,7 +586,13 @@ async def generate_presentation_handler(
                 await documents_loader.load_documents()
                 documents = documents_loader.documents
                 if documents:
-                    additional_context = "\n\n".join(documents)
+                    document_context = await get_document_context(documents)
+                    additional_context = document_context.text
+                    if document_context.trimmed:
+                        print(
+                            f"Documents context trimmed to ~{document_context.tokens} "
+                            f"of ~{document_context.document_tokens} tokens"
+                        )
 
             # Finding number of slides to generate by considering table of contents
             n_slides_to_generate = request.n_slides
@@ -678,64 +750,69 @@ async def generate_presentation_handler(
         image_generation_service = ImageGenerationService(get_images_directory())
         async_assets_generation_tasks = []
 
-        # 7. Generate slide content concurrently (batched), then build slides and fetch assets
-        slides: List[SlideModel] = []
-
+        # 7. Generate slide content concurrently, then build slides and fetch assets
         slide_layout_indices = presentation_structure.slides
         slide_layouts = [layout_model.slides[idx] for idx in slide_layout_indices]
 
-        # Schedule slide content generation and asset fetching in batches of 10
-        batch_size = 10
-        for start in range(0, len(slide_layouts), batch_size):
-            end = min(start + batch_size, len(slide_layouts))
-
-            print(f"Generating slides from {start} to {end}")
-
-            # Generate contents for this batch concurrently
-            content_tasks = [
-                get_slide_content_from_type_and_outline(
-                    slide_layouts[i],
-                    presentation_outlines.slides[i],
-                    request.language,
-                    request.tone.value,
-                    request.verbosity.value,
-                    request.instructions,
-                )
-                for i in range(start, end)
-            ]
-            batch_contents: List[dict] = await asyncio.gather(*content_tasks)
-
-            # Build slides for this batch
-            batch_slides: List[SlideModel] = []
-            for offset, slide_content in enumerate(batch_contents):
-                i = start + offset
-                slide_layout = slide_layouts[i]
-                slide = SlideModel(
-                    presentation=presentation_id,
-                    layout_group=layout_model.name,
-                    layout=slide_layout.id,
-                    index=i,
-                    speaker_note=slide_content.get("__speaker_note__"),
-                    content=slide_content,
+        slide_document_contexts = await get_slide_document_contexts(
+            documents, [each.content for each in presentation_outlines.slides]
+        )
+
+        # Concurrency is bounded by SLIDE_CONTENT_LIMITER, which is shared by all
+        # presentations in this process and adapts to provider rate limits
+        async def generate_slide(i: int) -> SlideModel:
+            slide_content = await get_slide_content_from_type_and_outline(
+                slide_layouts[i],
+                presentation_outlines.slides[i],
+                request.language,
+                request.tone.value,
+                request.verbosity.value,
+                request.instructions,
+                slide_document_contexts[i],
+            )
+            slide = SlideModel(
+                presentation=presentation_id,
+                layout_group=layout_model.name,
+                layout=slide_layouts[i].id,
+                index=i,
+                speaker_note=slide_content.get("__speaker_note__"),
+                content=slide_content,
+            )
+
+            # Start fetching images right away so it overlaps with remaining
+            # slides, icons are fetched for all slides at once
+            async_assets_generation_tasks.append(
+                asyncio.create_task(
+                    process_slide_and_fetch_assets(
+                        image_generation_service, slide, fetch_icons=False
+                    )
                 )
-                slides.append(slide)
-                batch_slides.append(slide)
+            )
+            return slide
 
-            # Start asset fetch tasks for just-generated slides so they run while next batch is processed
-            asset_tasks = [
-                process_slide_and_fetch_assets(image_generation_service, slide)
-                for slide in batch_slides
-            ]
-            async_assets_generation_tasks.extend(asset_tasks)
+        print(f"Generating {len(slide_layouts)} slides")
+        slide_tasks = [
+            asyncio.create_task(generate_slide(i)) for i in range(len(slide_layouts))
+        ]
+        try:
+            slides: List[SlideModel] = await asyncio.gather(*slide_tasks)
 
-        if async_status:
-            async_status.message = "Fetching assets for slides"
-            async_status.updated_at = datetime.now()
-            sql_session.add(async_status)
-            await sql_session.commit()
+            if async_status:
+                async_status.message = "Fetching assets for slides"
+                async_status.updated_at = datetime.now()
+                sql_session.add(async_status)
+                await sql_session.commit()
 
-        # Run all asset tasks concurrently while batches may still be generating content
-        generated_assets_list = await asyncio.gather(*async_assets_generation_tasks)
+            # Wait for asset tasks, most of them already ran while content was
+            # generating
+            generated_assets_list, _ = await asyncio.gather(
+                asyncio.gather(*async_assets_generation_tasks),
+                process_slides_and_fetch_icons(slides),
+            )
+        finally:
+            # A slide or its assets failed, stop generating the rest
+            for task in slide_tasks + async_assets_generation_tasks:
+                task.cancel()
         generated_assets = []
         for assets_list in generated_assets_list:
             generated_assets.extend(assets_list)
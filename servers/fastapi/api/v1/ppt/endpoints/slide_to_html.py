@@ -11,7 +11,7 @@ from utils.asset_directory_utils import get_images_directory
 from services.database import get_async_session
 from models.sql.presentation_layout_code import PresentationLayoutCodeModel
 from utils.user_config import get_user_config
-import google.generativeai as genai
+from utils.lazy_proxy import lazy_import
 from PIL import Image
 import mimetypes
 
@@ -22,6 +22,10 @@ from .prompts import (
 )
 from models.sql.template import TemplateModel
 
+# The legacy Gemini SDK takes over a second to import and only these
+# endpoints use it
+genai = lazy_import("google.generativeai")
+
 
 # Create separate routers for each functionality
 SLIDE_TO_HTML_ROUTER = APIRouter(prefix="/slide-to-html", tags=["slide-to-html"])
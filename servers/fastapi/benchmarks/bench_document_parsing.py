@@ -0,0 +1,158 @@
+"""
+Benchmark: parsing a batch of uploaded documents with DocumentsLoader.
+
+"inline" parses the files one by one with a DoclingService on the event loop,
+as DocumentsLoader used to; "pool" loads them through DocumentsLoader, which
+parses them in parallel in the document parsing process pool. A probe task
+measures how late the event loop wakes it up. The pool is warmed up with one
+batch first, so worker spawn and converter start-up are reported separately.
+"cached" loads the batch twice more with the parsed documents cache enabled,
+the second load is served from the cache.
+
+Without --files, 2 DOCX, 2 PPTX and 1 image-only PDF are generated. Parsing
+PDFs needs the docling layout models, files that fail to parse are reported
+and left out.
+
+Usage (from servers/fastapi):
+    python -m benchmarks.bench_document_parsing --workers 2
+    python -m benchmarks.bench_document_parsing --files a.pdf b.docx c.pptx
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from typing import List
+
+import docx
+import pptx
+from PIL import Image, ImageDraw
+
+from services.document_parsing import parse_document_to_markdown
+from services.documents_loader import DocumentsLoader
+from services.parsed_document_cache import get_parsed_document_cache
+from services.process_pool_service import PROCESS_POOL_SERVICE
+
+PROBE_INTERVAL = 0.01
+
+LOREM = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 4
+
+
+def write_synthetic_documents(directory: str, sections: int) -> List[str]:
+    paths = []
+    for index in range(2):
+        document = docx.Document()
+        for section in range(sections):
+            document.add_heading(f"Section {section + 1}", 1)
+            for _ in range(5):
+                document.add_paragraph(LOREM)
+        path = os.path.join(directory, f"report_{index}.docx")
+        document.save(path)
+        paths.append(path)
+
+    for index in range(2):
+        presentation = pptx.Presentation()
+        for section in range(sections):
+            slide = presentation.slides.add_slide(presentation.slide_layouts[1])
+            slide.shapes.title.text = f"Slide {section + 1}"
+            slide.placeholders[1].text = LOREM
+        path = os.path.join(directory, f"deck_{index}.pptx")
+        presentation.save(path)
+        paths.append(path)
+
+    pages = []
+    for page in range(min(sections, 10)):
+        image = Image.new("RGB", (1240, 1754), "white")
+        ImageDraw.Draw(image).text((100, 100), f"Page {page + 1}\n{LOREM}", "black")
+        pages.append(image)
+    path = os.path.join(directory, "scan.pdf")
+    pages[0].save(path, save_all=True, append_images=pages[1:])
+    paths.append(path)
+
+    return paths
+
+
+def get_parsable_files(file_paths: List[str]) -> List[str]:
+    parsable = []
+    for file_path in file_paths:
+        try:
+            parse_document_to_markdown(file_path)
+            parsable.append(file_path)
+        except Exception as e:
+            print(f"Skipping {os.path.basename(file_path)}: {str(e)[:120]}")
+    return parsable
+
+
+async def probe(lags: list, stop: asyncio.Event):
+    while not stop.is_set():
+        due = time.perf_counter() + PROBE_INTERVAL
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append(time.perf_counter() - due)
+
+
+async def parse_inline(file_paths: List[str]):
+    for file_path in file_paths:
+        parse_document_to_markdown(file_path)
+
+
+async def parse_pool(file_paths: List[str]):
+    await DocumentsLoader(file_paths).load_documents()
+
+
+async def run(parse, file_paths: List[str]):
+    lags = []
+    stop = asyncio.Event()
+    probe_task = asyncio.create_task(probe(lags, stop))
+    await asyncio.sleep(PROBE_INTERVAL * 2)
+
+    started = time.perf_counter()
+    await parse(file_paths)
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await probe_task
+    return elapsed, lags
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", nargs="+")
+    parser.add_argument("--sections", type=int, default=40)
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args()
+
+    os.environ["DOCUMENT_PARSING_WORKERS"] = str(args.workers)
+    os.environ["PARSED_DOCUMENT_CACHE_MAX_SIZE_MB"] = "0"
+    with tempfile.TemporaryDirectory() as work_dir:
+        os.environ["APP_DATA_DIRECTORY"] = work_dir
+        file_paths = args.files or write_synthetic_documents(work_dir, args.sections)
+        # Also loads the in-process converter used by "inline"
+        file_paths = get_parsable_files(file_paths)
+        if not file_paths:
+            return
+
+        print(f"{len(file_paths)} files, {args.workers} parsing workers")
+        elapsed, _ = asyncio.run(run(parse_pool, file_paths))
+        print(f"  pool cold start (spawn + converters) {elapsed:6.2f}s")
+
+        for name, parse in [("inline", parse_inline), ("pool", parse_pool)]:
+            elapsed, lags = asyncio.run(run(parse, file_paths))
+            print(
+                f"{name:>6} | parse {elapsed:6.2f}s | loop lag "
+                f"p50 {statistics.median(lags) * 1000:7.1f}ms "
+                f"max {max(lags) * 1000:7.1f}ms"
+            )
+
+        os.environ["PARSED_DOCUMENT_CACHE_MAX_SIZE_MB"] = "256"
+        for name in ["miss", "hit"]:
+            elapsed, _ = asyncio.run(run(parse_pool, file_paths))
+            print(f"cached | {name:>4} {elapsed * 1000:9.1f}ms")
+        print(f"  {get_parsed_document_cache().get_stats()}")
+
+    PROCESS_POOL_SERVICE.shutdown()
+
+
+if __name__ == "__main__":
+    main()
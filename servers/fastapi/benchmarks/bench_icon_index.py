@@ -0,0 +1,80 @@
+"""
+Micro-benchmark: top-k icon search in Chroma's HNSW index vs NumpyIconIndex.
+
+Both indexes hold the same synthetic 384-d (MiniLM sized) normalized
+embeddings, queries are given as embeddings so only the index search is
+timed. Recall is the share of Chroma's results the exact NumPy search also
+returns.
+
+Usage (from servers/fastapi):
+    python -m benchmarks.bench_icon_index --icons 1500 --limit 20
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from services.icon_index import ChromaIconIndex, NumpyIconIndex
+
+
+def best_of(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--icons", type=int, default=1500)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--queries", type=int, nargs="+", default=[1, 100])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    import chromadb
+    from chromadb.config import Settings
+
+    rng = np.random.default_rng(0)
+    ids = [f"icon-{i}-bold" for i in range(args.icons)]
+    embeddings = rng.normal(size=(args.icons, 384)).astype(np.float32)
+
+    collection = chromadb.EphemeralClient(
+        settings=Settings(anonymized_telemetry=False)
+    ).create_collection(
+        "icons", embedding_function=None, metadata={"hnsw:space": "cosine"}
+    )
+    collection.add(ids=ids, embeddings=embeddings)
+    indexes = {
+        "chroma": ChromaIconIndex(collection),
+        "numpy": NumpyIconIndex(ids, embeddings),
+    }
+
+    print(f"{args.icons} icons, top {args.limit}")
+    for n in args.queries:
+        queries = rng.normal(size=(n, 384)).astype(np.float32)
+        timings = {
+            name: best_of(lambda: index.search(queries, args.limit), args.repeat)
+            for name, index in indexes.items()
+        }
+        chroma_results = indexes["chroma"].search(queries, args.limit)
+        numpy_results = indexes["numpy"].search(queries, args.limit)
+        recall = np.mean(
+            [
+                len(set(a) & set(b)) / args.limit
+                for a, b in zip(chroma_results, numpy_results)
+            ]
+        )
+        print(
+            f"{n:>4} queries | chroma {timings['chroma'] * 1e6:9.0f}us | "
+            f"numpy {timings['numpy'] * 1e6:8.0f}us | "
+            f"x{timings['chroma'] / timings['numpy']:6.1f} | "
+            f"chroma recall {recall:.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark: resolving icon queries one by one vs in one batch.
+
+"single" gathers one search_icons call per query, as the generation pipelines
+used to do for every __icon_query__; "batch" resolves the same queries with
+one search_icons_many call, both with the query cache off; "cached" repeats
+the batch with warm query cache. Needs the MiniLM model (downloaded to
+chroma/models on first use) and assets/icons.json.
+
+Usage (from servers/fastapi):
+    python -m benchmarks.bench_icon_search --queries 1 100
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from services.icon_finder_service import ICON_FINDER_SERVICE
+
+ICON_QUERIES = [
+    "chart", "growth", "team", "target", "money", "rocket", "shield", "globe",
+    "calendar", "clock", "lightbulb", "handshake", "trophy", "user", "mail",
+    "phone", "cloud", "lock", "search", "settings", "star", "heart", "book",
+    "graduation", "truck", "factory", "leaf", "energy", "water", "medical",
+]
+
+
+def get_queries(n: int):
+    # Distinct queries, so no deduplication happens in the batch
+    return [
+        f"{ICON_QUERIES[i % len(ICON_QUERIES)]} {i // len(ICON_QUERIES)}"
+        for i in range(n)
+    ]
+
+
+async def search_single(queries):
+    return await asyncio.gather(
+        *[ICON_FINDER_SERVICE.search_icons(query) for query in queries]
+    )
+
+
+async def search_batch(queries):
+    return await ICON_FINDER_SERVICE.search_icons_many(queries)
+
+
+def best_of(search, queries, repeat: int):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        asyncio.run(search(queries))
+        timings.append(time.perf_counter() - started)
+    return min(timings), statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--queries", type=int, nargs="+", default=[1, 100])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    query_cache = ICON_FINDER_SERVICE.query_cache
+    ICON_FINDER_SERVICE.query_cache = None
+
+    # Warm up the ONNX session
+    asyncio.run(search_batch(get_queries(4)))
+
+    for n in args.queries:
+        queries = get_queries(n)
+        for name, search in [
+            ("single", search_single),
+            ("batch", search_batch),
+            ("cached", search_batch),
+        ]:
+            if name == "cached":
+                if not query_cache:
+                    continue
+                ICON_FINDER_SERVICE.query_cache = query_cache
+                asyncio.run(search_batch(queries))
+            best, median = best_of(search, queries, args.repeat)
+            print(
+                f"{n:>4} queries | {name:>6} | best {best * 1000:8.1f}ms | "
+                f"median {median * 1000:8.1f}ms | "
+                f"{best * 1000 / n:6.2f}ms per query"
+            )
+        ICON_FINDER_SERVICE.query_cache = None
+
+
+if __name__ == "__main__":
+    main()
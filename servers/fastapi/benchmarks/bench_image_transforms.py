@@ -0,0 +1,118 @@
+"""
+Micro-benchmark: legacy PIL picture pipeline vs the vectorized transform_image.
+
+Each case runs the transforms PptxPresentationCreator applies to a picture on
+a square RGBA source of the given size, targeting a 1280x720 box (or a 400px
+square for the circle avatar). The legacy pipeline is the chain of
+round_image_corners, fit_image/clip_image, round_image_corners,
+create_circle_image, invert_image and set_image_opacity.
+
+Usage (from servers/fastapi):
+    python -m benchmarks.bench_image_transforms --sizes 1024 2048 4096
+"""
+
+import argparse
+import time
+
+import numpy as np
+from PIL import Image
+
+from models.pptx_models import PptxObjectFitEnum, PptxObjectFitModel
+from utils.image_utils import (
+    clip_image,
+    create_circle_image,
+    fit_image,
+    invert_image,
+    round_image_corners,
+    set_image_opacity,
+    transform_image,
+)
+
+CASES = {
+    "cover + radius": dict(
+        width=1280,
+        height=720,
+        object_fit=PptxObjectFitModel(fit=PptxObjectFitEnum.COVER),
+        border_radius=[24, 24, 24, 24],
+    ),
+    "contain + radius + opacity": dict(
+        width=1280,
+        height=720,
+        object_fit=PptxObjectFitModel(fit=PptxObjectFitEnum.CONTAIN),
+        border_radius=[24, 24, 24, 24],
+        opacity=0.4,
+    ),
+    "clip + circle": dict(width=400, height=400, clip=True, circle=True),
+    "clip + invert + opacity": dict(
+        width=1280, height=720, clip=True, invert=True, opacity=0.4
+    ),
+}
+
+
+def legacy_transform(
+    image,
+    width,
+    height,
+    clip=False,
+    object_fit=None,
+    border_radius=None,
+    circle=False,
+    invert=False,
+    opacity=None,
+):
+    image = image.convert("RGBA")
+    if border_radius:
+        image = round_image_corners(image, border_radius)
+    if object_fit:
+        image = fit_image(image, width, height, object_fit)
+    elif clip:
+        image = clip_image(image, width, height)
+    if border_radius:
+        image = round_image_corners(image, border_radius)
+    if circle:
+        image = create_circle_image(image)
+    if invert:
+        image = invert_image(image)
+    if opacity:
+        image = set_image_opacity(image, opacity)
+    return image
+
+
+def best_of(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1024, 2048, 4096])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        pixels = np.random.default_rng(size).integers(
+            0, 256, (size, size, 4), dtype=np.uint8
+        )
+        image = Image.fromarray(pixels, "RGBA")
+        for name, kwargs in CASES.items():
+            legacy = best_of(lambda: legacy_transform(image, **kwargs), args.repeat)
+            vectorized = best_of(
+                lambda: transform_image(image, **kwargs), args.repeat
+            )
+            identical = np.array_equal(
+                np.asarray(legacy_transform(image, **kwargs)),
+                np.asarray(transform_image(image, **kwargs)),
+            )
+            print(
+                f"{size:>5}px | {name:<27} | legacy {legacy * 1000:8.1f}ms | "
+                f"vectorized {vectorized * 1000:7.1f}ms | "
+                f"x{legacy / vectorized:5.1f} | identical {identical}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark: import time of the API modules, the bulk of worker boot time.
+
+Imports the modules in a fresh interpreter with -X importtime, reports the
+wall-clock time over --repeat runs and the slowest top level packages by
+cumulative import time from the last run. A package includes the packages
+it imports first, e.g. transformers under docling. Module level side effects
+(like building singletons) are included in the numbers.
+
+Usage (from servers/fastapi):
+    python -m benchmarks.bench_import_time --modules api.v1.ppt.router api.lifespan
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+
+def profile_imports(modules, env) -> tuple:
+    code = "; ".join(f"import {module}" for module in modules)
+    started = time.perf_counter()
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    elapsed = time.perf_counter() - started
+    if process.returncode != 0:
+        raise RuntimeError(process.stderr.strip().splitlines()[-1])
+
+    # "import time: self [us] | cumulative | imported package", each package
+    # root is listed once, when it is first imported
+    packages = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        name = name.strip()
+        if "." not in name:
+            packages[name] = int(cumulative)
+    return elapsed, packages
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--modules", nargs="+", default=["api.v1.ppt.router", "api.lifespan"]
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    env = dict(os.environ, PYTHONPATH=os.getcwd())
+    timings = []
+    for _ in range(args.repeat):
+        elapsed, packages = profile_imports(args.modules, env)
+        timings.append(elapsed)
+
+    print(f"import {' '.join(args.modules)}")
+    print(
+        f"wall time: best {min(timings):.2f}s | "
+        f"median {statistics.median(timings):.2f}s"
+    )
+    print("slowest top level imports (cumulative):")
+    for name, cumulative in sorted(packages.items(), key=lambda x: -x[1])[: args.top]:
+        print(f"  {name:<24} {cumulative / 1e6:6.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Benchmark: converting PPTX uploads to PDF with LibreOffice.
+
+"legacy" starts a fresh `soffice --headless --convert-to pdf` for every
+deck, as the PPTX slides endpoint used to; "pool" converts them with
+LIBREOFFICE_POOL. Workers keep a soffice listening and convert over its
+socket when the UNO bindings (python3-uno) can be imported, otherwise each
+job still starts soffice, in the worker's own profile. The pool is warmed
+up first, as the startup warm-up does with LIBREOFFICE_PREWARM=true. Decks
+are converted --concurrency at a time; the legacy runs share one profile,
+so concurrent ones may fail.
+
+Needs LibreOffice installed. Without --files, decks of --slides slides are
+generated with python-pptx.
+
+Usage (from servers/fastapi):
+    python -m benchmarks.bench_libreoffice_pool --decks 8 --concurrency 2
+    python -m benchmarks.bench_libreoffice_pool --files a.pptx b.pptx
+"""
+
+import argparse
+import asyncio
+import os
+import subprocess
+import tempfile
+import time
+from typing import List
+
+from pptx import Presentation
+from pptx.util import Pt
+
+from services.libreoffice_pool import (
+    LIBREOFFICE_POOL,
+    find_libreoffice_path,
+    load_uno,
+)
+
+
+def write_deck(path: str, slides: int):
+    presentation = Presentation()
+    for slide_number in range(1, slides + 1):
+        slide = presentation.slides.add_slide(presentation.slide_layouts[1])
+        slide.shapes.title.text = f"Slide {slide_number}"
+        body = slide.placeholders[1].text_frame
+        for line in range(5):
+            paragraph = body.add_paragraph()
+            paragraph.text = f"Bullet {line + 1} of slide {slide_number}"
+            paragraph.font.size = Pt(18)
+    presentation.save(path)
+
+
+async def convert_legacy(libreoffice_path: str, deck_path: str, output_directory: str):
+    process = await asyncio.create_subprocess_exec(
+        libreoffice_path,
+        "--headless",
+        "--convert-to",
+        "pdf",
+        "--outdir",
+        output_directory,
+        deck_path,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    await process.communicate()
+    if process.returncode != 0:
+        raise Exception("LibreOffice conversion failed")
+
+
+async def run(name: str, convert, deck_paths: List[str], concurrency: int):
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    failures = 0
+
+    async def convert_one(deck_path: str):
+        nonlocal failures
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await convert(deck_path, tempfile.mkdtemp())
+                latencies.append(time.perf_counter() - started)
+            except Exception:
+                failures += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*[convert_one(deck_path) for deck_path in deck_paths])
+    total = time.perf_counter() - started
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] if latencies else 0
+    print(
+        f"{name:>6} | total {total:6.2f}s | p50 per deck {p50:5.2f}s | "
+        f"{failures} failed"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", nargs="*")
+    parser.add_argument("--decks", type=int, default=8)
+    parser.add_argument("--slides", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=2)
+    args = parser.parse_args()
+
+    libreoffice_path = find_libreoffice_path()
+    if not libreoffice_path:
+        print("LibreOffice not found, nothing to benchmark")
+        return
+
+    work_dir = tempfile.mkdtemp()
+    deck_paths = args.files
+    if not deck_paths:
+        deck_paths = []
+        for index in range(args.decks):
+            deck_path = os.path.join(work_dir, f"deck_{index}.pptx")
+            write_deck(deck_path, args.slides)
+            deck_paths.append(deck_path)
+
+    print(
+        f"{len(deck_paths)} decks, {args.concurrency} at a time, "
+        f"{LIBREOFFICE_POOL.size} workers, "
+        f"{'UNO socket' if load_uno() else 'process per job'}"
+    )
+
+    asyncio.run(
+        run(
+            "legacy",
+            lambda deck_path, output_directory: convert_legacy(
+                libreoffice_path, deck_path, output_directory
+            ),
+            deck_paths,
+            args.concurrency,
+        )
+    )
+
+    started = time.perf_counter()
+    LIBREOFFICE_POOL.warm_up()
+    print(f"  pool warm-up {time.perf_counter() - started:6.2f}s")
+    asyncio.run(
+        run("pool", LIBREOFFICE_POOL.convert_async, deck_paths, args.concurrency)
+    )
+    LIBREOFFICE_POOL.shutdown()
+
+
+if __name__ == "__main__":
+    main()
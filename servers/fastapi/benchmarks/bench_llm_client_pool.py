@@ -0,0 +1,104 @@
+"""
+Benchmark: TCP connections opened while generating slide content.
+
+Generates content for a 20-slide deck (batches of 10, like
+generate_presentation_handler) against a local fake Gemini HTTP server and
+counts the distinct connections the server sees, first with a new
+genai.Client per call and then with the pooled LLM_CLIENT_REGISTRY.
+
+Usage (from servers/fastapi):
+    python -m benchmarks.bench_llm_client_pool --slides 20
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from unittest.mock import patch
+
+os.environ.setdefault("LLM", "google")
+os.environ.setdefault("GOOGLE_API_KEY", "benchmark")
+
+from google import genai
+from google.genai.types import HttpOptions
+
+from benchmarks.fakes import FakeGeminiHttpServer
+from models.presentation_layout import SlideLayoutModel
+from models.presentation_outline_model import SlideOutlineModel
+from services.llm_client_registry import LLM_CLIENT_REGISTRY
+from utils.llm_calls.generate_slide_content import (
+    get_slide_content_from_type_and_outline,
+)
+
+GENAI_CLIENT = genai.Client
+
+SLIDE_LAYOUT = SlideLayoutModel(
+    id="benchmark",
+    json_schema={
+        "type": "object",
+        "properties": {"title": {"type": "string"}, "body": {"type": "string"}},
+        "required": ["title", "body"],
+    },
+)
+
+
+async def generate_deck(n_slides: int, batch_size: int = 10):
+    for start in range(0, n_slides, batch_size):
+        await asyncio.gather(
+            *[
+                get_slide_content_from_type_and_outline(
+                    SLIDE_LAYOUT,
+                    SlideOutlineModel(content=f"Slide {i}"),
+                    "English",
+                )
+                for i in range(start, min(start + batch_size, n_slides))
+            ]
+        )
+
+
+def run(name: str, server: FakeGeminiHttpServer, n_slides: int):
+    server.reset()
+    LLM_CLIENT_REGISTRY.clear()
+
+    def local_client(*args, **kwargs):
+        return GENAI_CLIENT(
+            *args, **kwargs, http_options=HttpOptions(base_url=server.base_url)
+        )
+
+    with patch("services.llm_client.genai.Client", local_client):
+        if name == "per-call":
+            with patch.object(
+                LLM_CLIENT_REGISTRY,
+                "get_client",
+                lambda provider, factory: factory(os.environ["GOOGLE_API_KEY"], None),
+            ):
+                started = time.perf_counter()
+                asyncio.run(generate_deck(n_slides))
+        else:
+            started = time.perf_counter()
+            asyncio.run(generate_deck(n_slides))
+        total = time.perf_counter() - started
+
+    print(
+        f"{name:>9} | {server.requests:3d} requests | "
+        f"{len(server.connections):3d} connections | {total:5.2f}s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--slides", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    server = FakeGeminiHttpServer(args.latency).start()
+    try:
+        for name in ("per-call", "pooled"):
+            run(name, server, args.slides)
+        print(f"registry stats: {LLM_CLIENT_REGISTRY.get_stats()}")
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Benchmark: event loop responsiveness while outlines are streaming.
+
+Runs N concurrent /outlines/stream/{id} requests against a fake Gemini stream
+that blocks between chunks (like the synchronous google-genai iterator) and
+measures the latency of a trivial probe endpoint served by the same app.
+
+Compares the previous iterator_to_async (next() on the event loop thread) with
+the current thread-backed implementation.
+
+Usage (from servers/fastapi):
+    python -m benchmarks.bench_outline_streaming --streams 8 --chunk-delay 0.05
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+import uuid
+from contextlib import contextmanager
+from unittest.mock import patch
+
+os.environ.setdefault("LLM", "google")
+os.environ.setdefault("GOOGLE_API_KEY", "benchmark")
+os.environ.setdefault("TEMP_DIRECTORY", "/tmp/presenton-benchmarks")
+
+import httpx
+from fastapi import FastAPI
+
+from api.v1.ppt.endpoints.outlines import OUTLINES_ROUTER
+from benchmarks.fakes import FakeAsyncSession, FakeGeminiClient
+from models.sql.presentation import PresentationModel
+from services.database import get_async_session
+from services.llm_client import LLMClient
+
+
+def legacy_iterator_to_async(func):
+    async def wrapper(*args, **kwargs):
+        for item in func(*args, **kwargs):
+            yield item
+            await asyncio.sleep(0)
+
+    return wrapper
+
+
+@contextmanager
+def implementation(name: str):
+    if name == "legacy":
+        with patch("services.llm_client.iterator_to_async", legacy_iterator_to_async):
+            yield
+    else:
+        yield
+
+
+def build_app(n_streams: int):
+    presentations = {}
+    for _ in range(n_streams):
+        presentation = PresentationModel(
+            id=uuid.uuid4(), content="Benchmark", n_slides=5, language="English"
+        )
+        presentations[presentation.id] = presentation
+
+    app = FastAPI()
+    app.include_router(OUTLINES_ROUTER)
+    app.dependency_overrides[get_async_session] = lambda: FakeAsyncSession(
+        presentations
+    )
+
+    @app.get("/probe")
+    async def probe():
+        return {"ok": True}
+
+    return app, list(presentations.keys())
+
+
+async def run_once(n_streams: int, chunk_delay: float, n_chunks: int):
+    app, ids = build_app(n_streams)
+    transport = httpx.ASGITransport(app=app)
+    probe_latencies = []
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        started = time.perf_counter()
+        streams = [
+            asyncio.create_task(client.get(f"/outlines/stream/{each}", timeout=None))
+            for each in ids
+        ]
+
+        # A probe is due every 10ms, its latency is measured from when it was due
+        # so time spent waiting for a blocked event loop is included
+        while not all(each.done() for each in streams):
+            probe_due = time.perf_counter() + 0.01
+            await asyncio.sleep(0.01)
+            await client.get("/probe")
+            probe_latencies.append(time.perf_counter() - probe_due)
+
+        responses = await asyncio.gather(*streams)
+        total = time.perf_counter() - started
+
+    assert all(each.status_code == 200 for each in responses)
+    return total, probe_latencies
+
+
+def report(name: str, total: float, latencies: list):
+    latencies_ms = sorted(each * 1000 for each in latencies)
+    p99 = latencies_ms[max(0, int(len(latencies_ms) * 0.99) - 1)]
+    print(
+        f"{name:>8} | wall {total:6.2f}s | probes {len(latencies_ms):4d} | "
+        f"p50 {statistics.median(latencies_ms):7.2f}ms | "
+        f"p99 {p99:7.2f}ms | max {latencies_ms[-1]:7.2f}ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--streams", type=int, default=8)
+    parser.add_argument("--chunk-delay", type=float, default=0.05)
+    parser.add_argument("--chunks", type=int, default=20)
+    args = parser.parse_args()
+
+    fake_client = FakeGeminiClient(args.chunk_delay, args.chunks)
+    print(
+        f"{args.streams} concurrent outline streams, "
+        f"{args.chunks} chunks every {args.chunk_delay * 1000:.0f}ms"
+    )
+    with patch.object(LLMClient, "_get_client", lambda self: fake_client):
+        for name in ("legacy", "current"):
+            with implementation(name):
+                total, latencies = asyncio.run(
+                    run_once(args.streams, args.chunk_delay, args.chunks)
+                )
+            report(name, total, latencies)
+
+
+if __name__ == "__main__":
+    main()
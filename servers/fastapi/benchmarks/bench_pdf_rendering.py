@@ -0,0 +1,141 @@
+"""
+Benchmark: rendering the pages of a PDF deck to slide screenshots.
+
+Writes a synthetic vector PDF (text and filled shapes on 16:9 pages) and
+renders every page. "legacy" renders the pages one by one with pdfplumber's
+page.to_image, as DocumentsLoader used to; "pool" renders them with
+iter_pdf_page_images, in batches across the PDF rendering process pool. Time
+to the first page is reported as well, callers can use each page as soon as
+it is yielded. The pool is warmed up first, so worker spawn is not measured.
+
+Usage (from servers/fastapi):
+    python -m benchmarks.bench_pdf_rendering --pages 60 --workers 4
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+import pdfplumber
+
+from services.pdf_renderer import iter_pdf_page_images
+from services.process_pool_service import PROCESS_POOL_SERVICE
+
+PAGE_WIDTH = 960
+PAGE_HEIGHT = 540
+
+
+def page_content_stream(page_number: int) -> bytes:
+    commands = []
+    for row in range(12):
+        shade = (row * 20 + page_number * 7) % 255 / 255
+        commands.append(
+            f"{shade:.2f} 0.4 {1 - shade:.2f} rg "
+            f"{40 + row * 70} 40 60 {80 + row * 25} re f"
+        )
+    commands.append("0 0 0 rg BT /F1 36 Tf 60 470 Td")
+    commands.append(f"(Slide {page_number} title) Tj ET")
+    for line in range(14):
+        commands.append(
+            f"BT /F1 14 Tf 60 {430 - line * 26} Td "
+            f"(Bullet {line + 1} lorem ipsum dolor sit amet consectetur) Tj ET"
+        )
+    return "\n".join(commands).encode("ascii")
+
+
+def write_synthetic_pdf(path: str, pages: int):
+    """Writes a minimal PDF with one content stream per page."""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # Pages, once the page objects are numbered
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    page_ids = []
+    for page_number in range(1, pages + 1):
+        content = page_content_stream(page_number)
+        objects.append(
+            b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream"
+        )
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>"
+            % (PAGE_WIDTH, PAGE_HEIGHT, len(objects))
+        )
+        page_ids.append(len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % page_id for page_id in page_ids),
+        len(page_ids),
+    )
+
+    data = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, obj in enumerate(objects, 1):
+        offsets.append(len(data))
+        data += b"%d 0 obj\n" % number + obj + b"\nendobj\n"
+    xref = len(data)
+    data += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        data += b"%010d 00000 n \n" % offset
+    data += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def render_legacy(pdf_path: str, output_directory: str, dpi: int):
+    with pdfplumber.open(pdf_path) as pdf:
+        for page in pdf.pages:
+            image = page.to_image(resolution=dpi)
+            image.save(
+                os.path.join(output_directory, f"page_{page.page_number}.png")
+            )
+
+
+async def render_pool(pdf_path: str, output_directory: str, dpi: int):
+    started = time.perf_counter()
+    first_page = None
+    pages = 0
+    async for _ in iter_pdf_page_images(pdf_path, output_directory, dpi):
+        if first_page is None:
+            first_page = time.perf_counter() - started
+        pages += 1
+    return first_page, pages
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=60)
+    parser.add_argument("--dpi", type=int, default=150)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    os.environ["PDF_RENDERING_WORKERS"] = str(args.workers)
+    with tempfile.TemporaryDirectory() as work_dir:
+        pdf_path = os.path.join(work_dir, "deck.pdf")
+        write_synthetic_pdf(pdf_path, args.pages)
+        print(f"{args.pages} pages at {args.dpi} DPI, {args.workers} workers")
+
+        asyncio.run(render_pool(pdf_path, tempfile.mkdtemp(dir=work_dir), args.dpi))
+
+        started = time.perf_counter()
+        render_legacy(pdf_path, tempfile.mkdtemp(dir=work_dir), args.dpi)
+        print(f"legacy | all pages {time.perf_counter() - started:6.2f}s")
+
+        started = time.perf_counter()
+        first_page, pages = asyncio.run(
+            render_pool(pdf_path, tempfile.mkdtemp(dir=work_dir), args.dpi)
+        )
+        print(
+            f"  pool | all pages {time.perf_counter() - started:6.2f}s | "
+            f"first page {first_page:5.2f}s | {pages} pages"
+        )
+
+    PROCESS_POOL_SERVICE.shutdown()
+
+
+if __name__ == "__main__":
+    main()
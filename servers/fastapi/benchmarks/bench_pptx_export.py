@@ -0,0 +1,100 @@
+"""
+Benchmark: event loop stall and wall-clock time of a PPTX export.
+
+Builds a synthetic deck (three transformed pictures, text and an autoshape per
+slide, 1024px source photos) and exports it while a probe task measures how
+late the event loop wakes it up. "inline" runs assembly and picture transforms
+on the event loop as the creator used to; "pool" uses create_ppt, which
+renders pictures in parallel and assembles the deck in the export process pool.
+
+Usage (from servers/fastapi):
+    python -m benchmarks.bench_pptx_export --slides 50 --workers 4
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+from services.pptx_presentation_creator import PptxPresentationCreator
+from services.process_pool_service import PROCESS_POOL_SERVICE
+from tests.fakes import synthetic_pptx_model, write_synthetic_images
+
+PROBE_INTERVAL = 0.01
+
+
+async def probe(lags: list, stop: asyncio.Event):
+    while not stop.is_set():
+        due = time.perf_counter() + PROBE_INTERVAL
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append(time.perf_counter() - due)
+
+
+async def export_inline(pptx_creator: PptxPresentationCreator, path: str):
+    await pptx_creator.fetch_network_assets()
+    pptx_creator.add_slides()
+    pptx_creator.save(path)
+
+
+async def export_pool(pptx_creator: PptxPresentationCreator, path: str):
+    await pptx_creator.create_ppt()
+    pptx_creator.save(path)
+
+
+async def run(export, model_factory, work_dir: str):
+    lags = []
+    stop = asyncio.Event()
+    probe_task = asyncio.create_task(probe(lags, stop))
+    await asyncio.sleep(PROBE_INTERVAL * 2)
+
+    temp_dir = tempfile.mkdtemp(dir=work_dir)
+    started = time.perf_counter()
+    await export(
+        PptxPresentationCreator(model_factory(), temp_dir),
+        os.path.join(temp_dir, "deck.pptx"),
+    )
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await probe_task
+    return elapsed, lags
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--slides", type=int, default=50)
+    parser.add_argument("--image-size", type=int, default=1024)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    os.environ["PPTX_EXPORT_WORKERS"] = str(args.workers)
+    with tempfile.TemporaryDirectory() as work_dir:
+        print(f"Writing {args.slides * 3} synthetic {args.image_size}px images...")
+        image_paths = write_synthetic_images(
+            work_dir, args.slides * 3, args.image_size
+        )
+
+        def model_factory():
+            return synthetic_pptx_model(args.slides, image_paths)
+
+        # Warm up the worker processes so spawn cost is not measured
+        asyncio.run(
+            run(export_pool, lambda: synthetic_pptx_model(1, image_paths), work_dir)
+        )
+
+        print(f"{args.slides} slides, {args.workers} export workers")
+        for name, export in [("inline", export_inline), ("pool", export_pool)]:
+            elapsed, lags = asyncio.run(run(export, model_factory, work_dir))
+            print(
+                f"{name:>6} | export {elapsed:6.2f}s | loop lag "
+                f"p50 {statistics.median(lags) * 1000:7.1f}ms "
+                f"max {max(lags) * 1000:7.1f}ms"
+            )
+
+    PROCESS_POOL_SERVICE.shutdown()
+
+
+if __name__ == "__main__":
+    main()
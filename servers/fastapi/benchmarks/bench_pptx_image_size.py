@@ -0,0 +1,108 @@
+"""
+Benchmark: PPTX size and export time with pictures resampled to their boxes.
+
+Every slide holds a full-size 2048px stock photo shown as a 400x300pt
+thumbnail (embedded untransformed), a 1024px generated image clipped into a
+480x400pt box and a transparent 800px logo in a 96pt square. Exports run with
+pictures at native resolution and resampled at each --dpis value.
+
+Usage (from servers/fastapi):
+    python -m benchmarks.bench_pptx_image_size --slides 30 --dpis 96 150
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from PIL import Image
+
+from models.pptx_models import (
+    PptxPictureBoxModel,
+    PptxPictureModel,
+    PptxPositionModel,
+    PptxPresentationModel,
+    PptxSlideModel,
+)
+from services.pptx_presentation_creator import PptxPresentationCreator
+from tests.fakes import write_synthetic_images
+from services.process_pool_service import PROCESS_POOL_SERVICE
+
+
+def picture(path: str, left: int, width: int, height: int, clip: bool):
+    return PptxPictureBoxModel(
+        position=PptxPositionModel(left=left, top=160, width=width, height=height),
+        picture=PptxPictureModel(is_network=False, path=path),
+        clip=clip,
+    )
+
+
+def deck_model(n_slides: int, photos, generated, logo_path: str):
+    return PptxPresentationModel(
+        slides=[
+            PptxSlideModel(
+                shapes=[
+                    picture(photos[i % len(photos)], 80, 400, 300, clip=False),
+                    picture(generated[i % len(generated)], 700, 480, 400, clip=True),
+                    picture(logo_path, 1160, 96, 96, clip=True),
+                ]
+            )
+            for i in range(n_slides)
+        ]
+    )
+
+
+async def export(model, work_dir: str, image_dpi):
+    temp_dir = tempfile.mkdtemp(dir=work_dir)
+    pptx_path = os.path.join(temp_dir, "deck.pptx")
+    pptx_creator = PptxPresentationCreator(model, temp_dir, image_dpi=image_dpi)
+    await pptx_creator.create_ppt()
+    pptx_creator.save(pptx_path)
+    return os.path.getsize(pptx_path)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--slides", type=int, default=30)
+    parser.add_argument("--dpis", type=int, nargs="+", default=[96, 150])
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    os.environ["PPTX_EXPORT_WORKERS"] = str(args.workers)
+    # Measure rendering, not the transformed pictures cache
+    os.environ["PICTURE_TRANSFORM_CACHE_MAX_SIZE_MB"] = "0"
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        print(f"Writing synthetic images for {args.slides} slides...")
+        photos = []
+        for path in write_synthetic_images(work_dir, args.slides, 2048):
+            # Stock photos come as JPEG
+            photo_path = f"{os.path.splitext(path)[0]}.jpg"
+            Image.open(path).save(photo_path, quality=90)
+            os.remove(path)
+            photos.append(photo_path)
+        generated = write_synthetic_images(work_dir, args.slides, 1024)
+        logo_path = os.path.join(work_dir, "logo.png")
+        logo = Image.new("RGBA", (800, 800), (0, 0, 0, 0))
+        logo.paste((30, 64, 175, 255), (200, 200, 600, 600))
+        logo.save(logo_path)
+
+        print(f"{args.slides} slides, {args.workers} export workers")
+        baseline = None
+        for image_dpi in [None, *args.dpis]:
+            model = deck_model(args.slides, photos, generated, logo_path)
+            started = time.perf_counter()
+            size = asyncio.run(export(model, work_dir, image_dpi))
+            elapsed = time.perf_counter() - started
+            baseline = baseline or size
+            print(
+                f"{str(image_dpi or 'native'):>6} dpi | export {elapsed:6.2f}s | "
+                f"deck {size / 1024 / 1024:6.1f}MB | x{baseline / size:4.1f} smaller"
+            )
+
+    PROCESS_POOL_SERVICE.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Benchmark: ScoreBasedChunker on a large markdown document.
+
+Generates a document with the given number of lines and headings and times
+get_n_chunks end to end. "legacy" locates the heading lines with the nested
+loop over every line and every heading and re-joins line lists for each
+chunk, as get_chunks_from_headings used to; "single pass" is the current
+chunker. Both must return the same chunks.
+
+Usage (from servers/fastapi):
+    python -m benchmarks.bench_score_based_chunker --lines 200000 --headings 5000
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from typing import List
+
+from models.document_chunk import DocumentChunk
+from services.score_based_chunker import ScoreBasedChunker
+
+
+class LegacyScoreBasedChunker(ScoreBasedChunker):
+    def extract_headings(self, text: str) -> List[str]:
+        headings = []
+        for line in text.split("\n"):
+            line = line.strip()
+            if line.startswith("#"):
+                headings.append(line)
+        return headings
+
+    def get_chunks_from_headings(
+        self, text, headings, heading_scores, top_k=10, heading_offsets=None
+    ) -> List[DocumentChunk]:
+        selected_indices = self.select_heading_indices(heading_scores, top_k)
+
+        lines = text.split("\n")
+        heading_positions = {}
+        for i, line in enumerate(lines):
+            line_stripped = line.strip()
+            if line_stripped.startswith("#"):
+                for heading_idx, heading in enumerate(headings):
+                    if (
+                        heading == line_stripped
+                        and heading_idx not in heading_positions
+                    ):
+                        heading_positions[heading_idx] = i
+                        break
+
+        chunks = []
+        for i, heading_idx in enumerate(selected_indices):
+            if heading_idx not in heading_positions:
+                continue
+            heading_line_idx = heading_positions[heading_idx]
+            content_end = len(lines)
+            if i + 1 < len(selected_indices):
+                next_heading_idx = selected_indices[i + 1]
+                if next_heading_idx in heading_positions:
+                    content_end = heading_positions[next_heading_idx]
+            chunks.append(
+                DocumentChunk(
+                    heading=headings[heading_idx],
+                    content="\n".join(
+                        lines[heading_line_idx + 1 : content_end]
+                    ).strip(),
+                    heading_index=heading_idx,
+                    score=heading_scores[heading_idx],
+                )
+            )
+        return chunks
+
+    async def get_n_chunks(self, text: str, n: int) -> List[DocumentChunk]:
+        headings = await asyncio.to_thread(self.extract_headings, text)
+        heading_scores = await asyncio.to_thread(self.score_headings, headings)
+        return await asyncio.to_thread(
+            self.get_chunks_from_headings, text, headings, heading_scores, n
+        )
+
+
+def synthetic_markdown(n_lines: int, n_headings: int) -> str:
+    rng = random.Random(n_lines)
+    heading_lines = set(rng.sample(range(n_lines), n_headings))
+    lines = []
+    for i in range(n_lines):
+        if i in heading_lines:
+            lines.append(f"{'#' * rng.randint(1, 4)} Section {i}")
+        else:
+            lines.append(f"Line {i} of the report body, lorem ipsum dolor sit amet.")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--lines", type=int, default=200_000)
+    parser.add_argument("--headings", type=int, default=5_000)
+    parser.add_argument("--chunks", type=int, default=20)
+    args = parser.parse_args()
+
+    text = synthetic_markdown(args.lines, args.headings)
+    print(
+        f"{args.lines} lines, {args.headings} headings, "
+        f"{len(text) / 1024 / 1024:.1f}MB, top {args.chunks} chunks"
+    )
+
+    results = {}
+    for name, chunker in [
+        ("legacy", LegacyScoreBasedChunker()),
+        ("single pass", ScoreBasedChunker()),
+    ]:
+        started = time.perf_counter()
+        results[name] = asyncio.run(chunker.get_n_chunks(text, args.chunks))
+        print(f"{name:>11} | {time.perf_counter() - started:8.3f}s")
+
+    print(f"identical chunks: {results['legacy'] == results['single pass']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Benchmark: deck wall-clock time with fixed batches vs the adaptive scheduler.
+
+Generates slide content for one or more concurrent decks against a fake
+Gemini provider with randomised latency and an optional concurrency quota
+(requests above it get 429 RESOURCE_EXHAUSTED). Compares the previous
+fixed batches of 10 with SLIDE_CONTENT_LIMITER, which keeps calls in flight
+continuously and is shared by all decks.
+
+Usage (from servers/fastapi):
+    python -m benchmarks.bench_slide_scheduler --slides 30 --decks 2 --quota 12
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+os.environ.setdefault("LLM", "google")
+os.environ.setdefault("GOOGLE_API_KEY", "benchmark")
+
+from benchmarks.fakes import FakeQuotaGeminiClient
+from models.presentation_layout import SlideLayoutModel
+from models.presentation_outline_model import SlideOutlineModel
+from services.llm_client import LLMClient
+from services.llm_concurrency_limiter import AdaptiveConcurrencyLimiter
+from utils.llm_calls.generate_slide_content import (
+    get_slide_content_from_type_and_outline,
+)
+
+SLIDE_LAYOUT = SlideLayoutModel(
+    id="benchmark",
+    json_schema={
+        "type": "object",
+        "properties": {"title": {"type": "string"}, "body": {"type": "string"}},
+        "required": ["title", "body"],
+    },
+)
+
+
+def generate_content(i: int):
+    return get_slide_content_from_type_and_outline(
+        SLIDE_LAYOUT, SlideOutlineModel(content=f"Slide {i}"), "English"
+    )
+
+
+async def fixed_batches(n_slides: int, batch_size: int = 10):
+    for start in range(0, n_slides, batch_size):
+        await asyncio.gather(
+            *[
+                generate_content(i)
+                for i in range(start, min(start + batch_size, n_slides))
+            ]
+        )
+
+
+async def scheduler(n_slides: int):
+    await asyncio.gather(*[generate_content(i) for i in range(n_slides)])
+
+
+class PassThroughLimiter:
+    async def run(self, func):
+        return await func()
+
+
+async def run_decks(strategy, n_decks: int, n_slides: int):
+    # Don't let the default executor size (cpu count based) cap concurrency
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(64))
+
+    async def timed_deck():
+        started = time.perf_counter()
+        try:
+            await strategy(n_slides)
+            return time.perf_counter() - started, None
+        except Exception as e:
+            return time.perf_counter() - started, e
+
+    return await asyncio.gather(*[timed_deck() for _ in range(n_decks)])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--slides", type=int, default=30)
+    parser.add_argument("--decks", type=int, default=2)
+    parser.add_argument("--min-latency", type=float, default=0.2)
+    parser.add_argument("--max-latency", type=float, default=2.0)
+    parser.add_argument("--quota", type=int, default=None)
+    args = parser.parse_args()
+
+    print(
+        f"{args.decks} deck(s) x {args.slides} slides, latency "
+        f"{args.min_latency}-{args.max_latency}s, quota {args.quota or 'none'}"
+    )
+    runs = [
+        ("batches", fixed_batches, PassThroughLimiter()),
+        (
+            "adaptive",
+            scheduler,
+            AdaptiveConcurrencyLimiter(max_limit=10, retry_backoff=0.2),
+        ),
+    ]
+    for name, strategy, limiter in runs:
+        fake_client = FakeQuotaGeminiClient(
+            args.min_latency, args.max_latency, args.quota
+        )
+        with patch.object(LLMClient, "_get_client", lambda self: fake_client), patch(
+            "utils.llm_calls.generate_slide_content.SLIDE_CONTENT_LIMITER", limiter
+        ):
+            results = asyncio.run(run_decks(strategy, args.decks, args.slides))
+
+        times = ", ".join(f"{each:5.2f}s" for each, _ in results)
+        failed = sum(1 for _, error in results if error)
+        print(
+            f"{name:>8} | decks {times} | failed decks {failed} | "
+            f"calls {fake_client.models.calls} | 429s {fake_client.models.rate_limited}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Benchmark: per-request overhead of UserConfigEnvUpdateMiddleware.
+
+Serves a trivial endpoint through the middleware with httpx's in-process ASGI
+transport and reports the request rate with a passthrough middleware, with the legacy
+update (user config file parsed and every env variable pushed on each request)
+and with the cached update, against a user config file in a temp directory.
+The update calls alone are also timed, outside of the request path.
+
+Usage (from servers/fastapi):
+    python -m benchmarks.bench_user_config_middleware --requests 2000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+import timeit
+
+import httpx
+from fastapi import FastAPI
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from api.middlewares import UserConfigEnvUpdateMiddleware
+from services.llm_client_registry import LLM_CLIENT_REGISTRY
+from utils import user_config as user_config_utils
+from utils.user_config import (
+    get_user_config,
+    invalidate_user_config_cache,
+    update_env_with_user_config,
+)
+
+
+def legacy_update_env_with_user_config():
+    # The update the middleware used to run on every request
+    user_config_utils.invalidate_user_config_cache()
+    for _, set_env, value in user_config_utils._get_user_config_env_values(
+        get_user_config()
+    ):
+        if value:
+            set_env(value)
+    LLM_CLIENT_REGISTRY.invalidate_stale()
+
+
+class PassthroughMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        return await call_next(request)
+
+
+class LegacyUserConfigEnvUpdateMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        legacy_update_env_with_user_config()
+        return await call_next(request)
+
+
+def create_app(middleware) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(middleware)
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    return app
+
+
+async def measure(app: FastAPI, requests: int, repeat: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(50):
+            await client.get("/ping")
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            for _ in range(requests):
+                await client.get("/ping")
+            timings.append(time.perf_counter() - started)
+        return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        path = os.path.join(work_dir, "user_config.json")
+        with open(path, "w") as f:
+            json.dump(
+                {
+                    "LLM": "openai",
+                    "OPENAI_API_KEY": "sk-bench",
+                    "OPENAI_MODEL": "gpt-4.1",
+                    "IMAGE_PROVIDER": "pexels",
+                    "PEXELS_API_KEY": "pexels-bench",
+                    "TOOL_CALLS": True,
+                    "WEB_GROUNDING": False,
+                },
+                f,
+            )
+        os.environ["USER_CONFIG_PATH"] = path
+        os.environ["CAN_CHANGE_KEYS"] = "true"
+        invalidate_user_config_cache()
+
+        # Overhead is measured over the passthrough middleware
+        baseline = None
+        for name, middleware in [
+            ("passthrough", PassthroughMiddleware),
+            ("legacy", LegacyUserConfigEnvUpdateMiddleware),
+            ("cached", UserConfigEnvUpdateMiddleware),
+        ]:
+            elapsed = asyncio.run(
+                measure(create_app(middleware), args.requests, args.repeat)
+            )
+            per_request = elapsed / args.requests
+            if baseline is None:
+                baseline = per_request
+            print(
+                f"{name:>11} | {args.requests / elapsed:8.0f} req/s | "
+                f"{per_request * 1e6:7.1f}us/request | "
+                f"middleware overhead {(per_request - baseline) * 1e6:7.1f}us"
+            )
+
+        for name, update in [
+            ("legacy", legacy_update_env_with_user_config),
+            ("cached", update_env_with_user_config),
+        ]:
+            elapsed = min(timeit.repeat(update, number=args.requests, repeat=5))
+            print(f"{name:>11} | update {elapsed / args.requests * 1e6:7.1f}us/call")
+
+
+if __name__ == "__main__":
+    main()
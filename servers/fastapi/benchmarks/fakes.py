@@ -0,0 +1,202 @@
+"""
+Local stand-ins for external providers used by the benchmarks.
+
+Nothing in here talks to the network, latencies are simulated with blocking
+sleeps so that the event loop behaviour of the real code paths can be measured.
+"""
+
+import asyncio
+import json
+import random
+import threading
+import time
+from types import SimpleNamespace
+from typing import Iterator, List, Optional
+
+
+def text_event(text: str):
+    part = SimpleNamespace(text=text, function_call=None)
+    return SimpleNamespace(
+        usage_metadata=None,
+        candidates=[SimpleNamespace(content=SimpleNamespace(parts=[part]))],
+    )
+
+
+def outline_json_chunks(n_slides: int, n_chunks: int) -> List[str]:
+    outline = {
+        "slides": [
+            {"content": f"# Slide {i + 1}\n" + "Lorem ipsum dolor sit amet. " * 5}
+            for i in range(n_slides)
+        ]
+    }
+    text = json.dumps(outline)
+    size = max(1, len(text) // n_chunks)
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+class FakeGeminiModels:
+    def __init__(self, chunk_delay: float, n_chunks: int):
+        self.chunk_delay = chunk_delay
+        self.n_chunks = n_chunks
+
+    def generate_content_stream(self, model, contents, config) -> Iterator:
+        # Blocking between chunks, exactly like the synchronous google-genai client
+        for chunk in outline_json_chunks(5, self.n_chunks):
+            time.sleep(self.chunk_delay)
+            yield text_event(chunk)
+
+
+class FakeGeminiClient:
+    """Mimics the subset of google.genai.Client used by LLMClient."""
+
+    def __init__(self, chunk_delay: float = 0.05, n_chunks: int = 20):
+        self.models = FakeGeminiModels(chunk_delay, n_chunks)
+
+
+class FakeQuotaGeminiModels:
+    def __init__(self, min_latency: float, max_latency: float, quota: Optional[int]):
+        self.min_latency = min_latency
+        self.max_latency = max_latency
+        self.quota = quota
+        self.in_flight = 0
+        self.calls = 0
+        self.rate_limited = 0
+        self._lock = threading.Lock()
+
+    def generate_content(self, model, contents, config):
+        from google.genai.errors import ClientError
+
+        with self._lock:
+            self.calls += 1
+            if self.quota is not None and self.in_flight >= self.quota:
+                self.rate_limited += 1
+                raise ClientError(
+                    429,
+                    {
+                        "error": {
+                            "code": 429,
+                            "message": "Quota exceeded (fake)",
+                            "status": "RESOURCE_EXHAUSTED",
+                        }
+                    },
+                )
+            self.in_flight += 1
+        try:
+            time.sleep(random.uniform(self.min_latency, self.max_latency))
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+        return text_event(json.dumps({"title": "Fake slide", "body": "Fake body"}))
+
+
+class FakeQuotaGeminiClient:
+    """
+    Gemini client with randomised latency that answers 429 RESOURCE_EXHAUSTED
+    while more than quota requests are in flight.
+    """
+
+    def __init__(
+        self,
+        min_latency: float = 0.2,
+        max_latency: float = 2.0,
+        quota: Optional[int] = None,
+    ):
+        self.models = FakeQuotaGeminiModels(min_latency, max_latency, quota)
+
+
+class FakeAsyncSession:
+    """In-memory replacement for the AsyncSession dependency."""
+
+    def __init__(self, objects: Optional[dict] = None):
+        self.objects = objects or {}
+
+    async def get(self, _model, id):
+        return self.objects.get(id)
+
+    def add(self, obj):
+        self.objects[getattr(obj, "id", id(obj))] = obj
+
+    def add_all(self, objs):
+        for each in objs:
+            self.add(each)
+
+    async def execute(self, *args, **kwargs):
+        return None
+
+    async def commit(self):
+        await asyncio.sleep(0)
+
+
+class FakeGeminiHttpServer:
+    """
+    Minimal HTTP server speaking enough of the Gemini REST API for
+    generateContent, running on its own event loop thread. Counts the distinct
+    TCP connections clients open against it.
+    """
+
+    def __init__(self, latency: float = 0.05):
+        self.latency = latency
+        self.connections = set()
+        self.requests = 0
+        self._loop = None
+        self._thread = None
+        self._runner = None
+        self.base_url = None
+
+    async def _generate_content(self, request):
+        from aiohttp import web
+
+        self.connections.add(id(request.transport))
+        self.requests += 1
+        await asyncio.sleep(self.latency)
+        return web.json_response(
+            {
+                "candidates": [
+                    {
+                        "content": {
+                            "role": "model",
+                            "parts": [
+                                {"text": json.dumps({"title": "Fake", "body": "Fake"})}
+                            ],
+                        }
+                    }
+                ]
+            }
+        )
+
+    def start(self):
+        import threading
+        from aiohttp import web
+
+        started = threading.Event()
+
+        async def serve():
+            app = web.Application()
+            app.router.add_post(
+                "/{version}/models/{model}:generateContent", self._generate_content
+            )
+            self._runner = web.AppRunner(app)
+            await self._runner.setup()
+            site = web.TCPSite(self._runner, "127.0.0.1", 0)
+            await site.start()
+            port = site._server.sockets[0].getsockname()[1]
+            self.base_url = f"http://127.0.0.1:{port}"
+            started.set()
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            self._loop.run_until_complete(serve())
+            self._loop.run_forever()
+
+        self._thread = threading.Thread(target=run, daemon=True)
+        self._thread.start()
+        started.wait()
+        return self
+
+    def reset(self):
+        self.connections = set()
+        self.requests = 0
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
@@ -9,6 +9,9 @@ WORD_TYPES = [
 ]
 SPREADSHEET_TYPES = ["text/csv", "application/csv"]
 
+# Options of the docling PDF, Word and PowerPoint pipelines
+DOCLING_PIPELINE_OPTIONS = {"do_ocr": False}
+
 
 PNG_MIME_TYPES = ["image/png"]
 JPEG_MIME_TYPES = ["image/jpeg"]
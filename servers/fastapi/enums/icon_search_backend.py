@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class IconSearchBackend(Enum):
+    NUMPY = "numpy"
+    CHROMA = "chroma"
@@ -0,0 +1,21 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class DocumentContext(BaseModel):
+    text: str
+    tokens: int
+    document_tokens: int
+    max_tokens: Optional[int] = None
+
+    @property
+    def trimmed(self) -> bool:
+        return self.tokens < self.document_tokens
+
+    def get_token_estimates(self) -> dict:
+        return {
+            "context": self.tokens,
+            "documents": self.document_tokens,
+            "max": self.max_tokens,
+        }
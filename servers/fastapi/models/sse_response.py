@@ -1,4 +1,5 @@
 import json
+from typing import Optional
 
 from pydantic import BaseModel
 
@@ -13,11 +14,14 @@ class SSEResponse(BaseModel):
 
 class SSEStatusResponse(BaseModel):
     status: str
+    # Token estimates of the prompt inputs, e.g. the documents context
+    tokens: Optional[dict] = None
 
     def to_string(self):
-        return SSEResponse(
-            event="response", data=json.dumps({"type": "status", "status": self.status})
-        ).to_string()
+        data = {"type": "status", "status": self.status}
+        if self.tokens is not None:
+            data["tokens"] = self.tokens
+        return SSEResponse(event="response", data=json.dumps(data)).to_string()
 
 
 class SSEErrorResponse(BaseModel):
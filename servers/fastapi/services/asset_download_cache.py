@@ -0,0 +1,234 @@
+import hashlib
+import os
+import re
+import sqlite3
+import time
+import uuid
+from typing import Dict, Mapping, Optional
+
+from services.size_capped_cache import SharedCaches, SizeCappedCache
+from utils.asset_directory_utils import get_asset_cache_directory
+from utils.file_utils import link_or_copy_file
+from utils.get_env import get_asset_download_cache_max_size_mb_env
+
+DEFAULT_ASSET_DOWNLOAD_CACHE_MAX_SIZE_MB = 512
+
+# Used when the response has no Cache-Control max-age
+DEFAULT_ASSET_FRESHNESS = 60 * 60
+MAX_ASSET_FRESHNESS = 7 * 24 * 60 * 60
+
+
+def _get_expires_at(headers: Mapping[str, str], now: float) -> Optional[float]:
+    """
+    Returns until when the response can be used without revalidation,
+    None if it must not be stored.
+    """
+    cache_control = headers.get("Cache-Control", "").lower()
+    if "no-store" in cache_control:
+        return None
+    if "no-cache" in cache_control:
+        return now
+    max_age = re.search(r"max-age=(\d+)", cache_control)
+    if max_age:
+        return now + min(int(max_age.group(1)), MAX_ASSET_FRESHNESS)
+    return now + DEFAULT_ASSET_FRESHNESS
+
+
+class AssetDownloadCacheEntry:
+    def __init__(
+        self,
+        url: str,
+        path: str,
+        filename: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        expires_at: float,
+    ):
+        self.url = url
+        self.path = path
+        self.filename = filename
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires_at = expires_at
+
+    def is_fresh(self) -> bool:
+        return self.expires_at > time.time()
+
+    def get_revalidation_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class AssetDownloadCache(SizeCappedCache):
+    """
+    Disk cache of downloaded assets keyed by url, shared across exports.
+
+    Fresh entries are served without a request, stale ones are revalidated with
+    If-None-Match / If-Modified-Since. Least recently used files are evicted
+    once the cache grows over max_size_bytes.
+    """
+
+    def __init__(self, directory: str, max_size_bytes: int):
+        super().__init__(directory, max_size_bytes)
+        self._connection = sqlite3.connect(
+            os.path.join(self.directory, "index.db"), check_same_thread=False
+        )
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                url TEXT PRIMARY KEY,
+                file TEXT NOT NULL,
+                filename TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                expires_at REAL NOT NULL,
+                last_accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._connection.commit()
+
+        self.revalidated = 0
+
+    def get(self, url: str) -> Optional[AssetDownloadCacheEntry]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT file, filename, etag, last_modified, expires_at "
+                "FROM entries WHERE url = ?",
+                (url,),
+            ).fetchone()
+            if not row:
+                return None
+
+            path = os.path.join(self.directory, row[0])
+            if not os.path.exists(path):
+                self._connection.execute("DELETE FROM entries WHERE url = ?", (url,))
+                self._connection.commit()
+                return None
+
+            return AssetDownloadCacheEntry(url, path, *row[1:])
+
+    def copy_to(
+        self,
+        entry: AssetDownloadCacheEntry,
+        download_directory: str,
+        response_headers: Optional[Mapping[str, str]] = None,
+    ) -> Optional[str]:
+        """
+        Places the cached file in download_directory and returns its path.
+        response_headers of a 304 response extend the entry's freshness.
+        """
+        now = time.time()
+        with self._lock:
+            destination = os.path.join(
+                download_directory, f"{uuid.uuid4()}-{entry.filename}"
+            )
+            try:
+                link_or_copy_file(entry.path, destination)
+            except FileNotFoundError:
+                # Evicted meanwhile
+                return None
+
+            if response_headers is not None:
+                self.revalidated += 1
+                self._connection.execute(
+                    "UPDATE entries SET expires_at = ? WHERE url = ?",
+                    (_get_expires_at(response_headers, now) or now, entry.url),
+                )
+            else:
+                self.hits += 1
+            self._connection.execute(
+                "UPDATE entries SET last_accessed_at = ? WHERE url = ?",
+                (now, entry.url),
+            )
+            self._connection.commit()
+            return destination
+
+    def put(self, url: str, path: str, response_headers: Mapping[str, str]):
+        now = time.time()
+        expires_at = _get_expires_at(response_headers, now)
+        if expires_at is None:
+            return
+
+        filename = os.path.basename(path)
+        file = (
+            hashlib.sha256(url.encode("utf-8")).hexdigest()
+            + os.path.splitext(filename)[1]
+        )
+        cached_path = os.path.join(self.directory, file)
+        temp_path = f"{cached_path}.{uuid.uuid4()}.tmp"
+
+        with self._lock:
+            self.misses += 1
+            link_or_copy_file(path, temp_path)
+            os.replace(temp_path, cached_path)
+            self._connection.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    url,
+                    file,
+                    filename,
+                    os.path.getsize(cached_path),
+                    response_headers.get("ETag"),
+                    response_headers.get("Last-Modified"),
+                    expires_at,
+                    now,
+                ),
+            )
+            self._connection.commit()
+            self._evict()
+
+    def _evict(self):
+        size = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()[0]
+        if size <= self.max_size_bytes:
+            return
+
+        for url, file, file_size in self._connection.execute(
+            "SELECT url, file, size FROM entries ORDER BY last_accessed_at"
+        ).fetchall():
+            if size <= self.max_size_bytes:
+                break
+            self._connection.execute("DELETE FROM entries WHERE url = ?", (url,))
+            try:
+                os.remove(os.path.join(self.directory, file))
+            except FileNotFoundError:
+                pass
+            size -= file_size
+            self.evictions += 1
+
+        self._connection.commit()
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            entries, size = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+        return {
+            "entries": entries,
+            "size_bytes": size,
+            "revalidated": self.revalidated,
+            **super().get_stats(),
+        }
+
+
+_ASSET_DOWNLOAD_CACHES: SharedCaches[AssetDownloadCache] = SharedCaches(
+    AssetDownloadCache,
+    get_asset_download_cache_max_size_mb_env,
+    DEFAULT_ASSET_DOWNLOAD_CACHE_MAX_SIZE_MB,
+    get_asset_cache_directory,
+)
+
+
+def get_asset_download_cache() -> Optional[AssetDownloadCache]:
+    """
+    Returns the shared asset download cache.
+    ASSET_DOWNLOAD_CACHE_MAX_SIZE_MB=0 disables caching.
+    """
+    return _ASSET_DOWNLOAD_CACHES.get()
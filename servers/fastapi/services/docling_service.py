@@ -7,14 +7,18 @@ from docling.document_converter import (
 from docling.datamodel.pipeline_options import PdfPipelineOptions
 from docling.datamodel.base_models import InputFormat
 
+from constants.documents import DOCLING_PIPELINE_OPTIONS
+from utils.lazy_proxy import LazyProxy
+
+DOCLING_FORMATS = [InputFormat.PPTX, InputFormat.PDF, InputFormat.DOCX]
+
 
 class DoclingService:
     def __init__(self):
-        self.pipeline_options = PdfPipelineOptions()
-        self.pipeline_options.do_ocr = False
+        self.pipeline_options = PdfPipelineOptions(**DOCLING_PIPELINE_OPTIONS)
 
         self.converter = DocumentConverter(
-            allowed_formats=[InputFormat.PPTX, InputFormat.PDF, InputFormat.DOCX],
+            allowed_formats=DOCLING_FORMATS,
             format_options={
                 InputFormat.DOCX: WordFormatOption(
                     pipeline_options=self.pipeline_options,
@@ -31,3 +35,16 @@ class DoclingService:
     def parse_to_markdown(self, file_path: str) -> str:
         result = self.converter.convert(file_path)
         return result.document.export_to_markdown()
+
+    def warm_up(self):
+        """Initializes the pipeline of every format, loading their models."""
+        for input_format in DOCLING_FORMATS:
+            try:
+                self.converter.initialize_pipeline(input_format)
+            except Exception as e:
+                # Initialized again on first use
+                print(f"Failed to initialize docling {input_format.value} pipeline: {e}")
+
+
+# Shared by every request of the process, docling guards pipeline creation itself
+DOCLING_SERVICE: DoclingService = LazyProxy(DoclingService)
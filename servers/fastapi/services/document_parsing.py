@@ -0,0 +1,90 @@
+import asyncio
+from typing import Optional
+
+from services.parsed_document_cache import (
+    get_parsed_document_cache,
+    get_parsed_document_key,
+)
+from services.process_pool_service import PROCESS_POOL_SERVICE, get_default_max_workers
+from utils.get_env import (
+    get_document_parsing_prewarm_env,
+    get_document_parsing_workers_env,
+)
+from utils.parsers import parse_bool_or_none, parse_int_or_none
+
+DOCUMENT_PARSING_POOL = "document_parsing"
+
+# Each worker holds its own converter and models, so keep the default pool small
+DEFAULT_DOCUMENT_PARSING_MAX_WORKERS = 2
+
+
+def get_document_parsing_workers() -> int:
+    workers = parse_int_or_none(get_document_parsing_workers_env())
+    if workers is None:
+        workers = min(DEFAULT_DOCUMENT_PARSING_MAX_WORKERS, get_default_max_workers())
+    return max(0, workers)
+
+
+def parse_document_to_markdown(file_path: str) -> str:
+    """
+    Parses a PDF, Word or PowerPoint file to markdown. Runs in the document
+    parsing pool, where each worker keeps its converter warm between files.
+    """
+    # Imported here as docling takes several seconds to import
+    from services.docling_service import DOCLING_SERVICE
+
+    return DOCLING_SERVICE.parse_to_markdown(file_path)
+
+
+def warm_up_document_parser():
+    """Creates the converter of the current process and loads its models."""
+    from services.docling_service import DOCLING_SERVICE
+
+    DOCLING_SERVICE.warm_up()
+
+
+def warm_up_document_parsing():
+    """
+    Startup warm-up step. Loads the converter in every document parsing
+    worker, or in this process when documents are parsed in threads. Only
+    with DOCUMENT_PARSING_PREWARM=true, otherwise the first upload loads it.
+    """
+    if not parse_bool_or_none(get_document_parsing_prewarm_env()):
+        return
+
+    workers = get_document_parsing_workers()
+    if workers <= 0:
+        warm_up_document_parser()
+        return
+
+    pool = PROCESS_POOL_SERVICE.get_pool(DOCUMENT_PARSING_POOL, workers)
+    # Each task takes seconds, so every worker gets spawned and picks one up
+    futures = [pool.submit(warm_up_document_parser) for _ in range(workers)]
+    for future in futures:
+        future.result()
+
+
+async def parse_document_to_markdown_async(
+    file_path: str, workers: Optional[int] = None
+) -> str:
+    """
+    Parses the file in the document parsing pool, unless a file with the
+    same content was already parsed with the same options.
+    """
+    cache = get_parsed_document_cache()
+    if cache:
+        # Hashes the file
+        key = await asyncio.to_thread(get_parsed_document_key, file_path)
+        document = await asyncio.to_thread(cache.get, key)
+        if document is not None:
+            return document
+
+    if workers is None:
+        workers = get_document_parsing_workers()
+    document = await PROCESS_POOL_SERVICE.run(
+        DOCUMENT_PARSING_POOL, workers, parse_document_to_markdown, file_path
+    )
+
+    if cache:
+        await asyncio.to_thread(cache.put, key, document)
+    return document
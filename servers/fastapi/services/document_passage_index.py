@@ -0,0 +1,208 @@
+import asyncio
+import re
+from typing import List, Optional
+
+import numpy as np
+from fastapi import HTTPException
+
+from services.documents_loader import DocumentsLoader
+from services.icon_index import normalize_embeddings
+from utils.document_context import (
+    DOCUMENT_SEPARATOR,
+    estimate_tokens,
+    trim_to_tokens,
+)
+from utils.get_env import (
+    get_slide_document_context_max_tokens_env,
+    get_slide_document_context_top_k_env,
+)
+from utils.parsers import parse_int_or_none
+
+DEFAULT_SLIDE_DOCUMENT_CONTEXT_MAX_TOKENS = 300
+DEFAULT_SLIDE_DOCUMENT_CONTEXT_TOP_K = 3
+
+# Small enough for a few passages to fit in a slide prompt
+MAX_PASSAGE_TOKENS = 120
+
+PARAGRAPH_SEPARATOR_PATTERN = re.compile(r"\n\s*\n")
+
+
+def split_text(text: str, max_tokens: int) -> List[str]:
+    """Splits text into pieces of at most max_tokens, at lines or words."""
+    pieces = []
+    while estimate_tokens(text) > max_tokens:
+        piece = trim_to_tokens(text, max_tokens)
+        pieces.append(piece)
+        text = text[len(piece) :].strip()
+    if text:
+        pieces.append(text)
+    return pieces
+
+
+def split_passages(document: str, max_tokens: int = MAX_PASSAGE_TOKENS) -> List[str]:
+    """
+    Splits a markdown document into passages of consecutive paragraphs up to
+    max_tokens, each prefixed with the heading it falls under.
+    """
+    passages = []
+    heading = ""
+    paragraphs: List[str] = []
+
+    def flush():
+        if paragraphs:
+            body = "\n\n".join(paragraphs)
+            passages.append(f"{heading}\n{body}" if heading else body)
+            paragraphs.clear()
+
+    for block in PARAGRAPH_SEPARATOR_PATTERN.split(document):
+        block = block.strip()
+        if not block:
+            continue
+        if block.startswith("#"):
+            flush()
+            heading, _, block = block.partition("\n")
+            block = block.strip()
+            if not block:
+                continue
+
+        body_tokens = max_tokens - estimate_tokens(heading)
+        for piece in split_text(block, max(body_tokens, max_tokens // 2)):
+            paragraphs_tokens = estimate_tokens("\n\n".join(paragraphs + [piece]))
+            if paragraphs and paragraphs_tokens > body_tokens:
+                flush()
+            paragraphs.append(piece)
+    flush()
+
+    return passages
+
+
+class DocumentPassageIndex:
+    """
+    Embedding index over the passages of a presentation's source documents,
+    so every slide can be grounded in the passages closest to its outline.
+    Built once per presentation, searched in memory.
+    """
+
+    def __init__(self, passages: List[str], embeddings: np.ndarray):
+        self.passages = passages
+        self.embeddings = embeddings
+
+    @classmethod
+    def build(cls, documents: List[str], embedding_function) -> "DocumentPassageIndex":
+        passages = [
+            passage for document in documents for passage in split_passages(document)
+        ]
+        if not passages:
+            return cls([], np.zeros((0, 0), dtype=np.float32))
+        return cls(passages, normalize_embeddings(embedding_function(passages)))
+
+    def search(self, query_embeddings, k: int) -> List[List[int]]:
+        """Returns the indices of the top k passages of each query, best first."""
+        queries = normalize_embeddings(query_embeddings)
+        k = min(k, len(self.passages))
+        if k <= 0:
+            return [[] for _ in range(len(queries))]
+
+        scores = queries @ self.embeddings.T
+        top = np.argsort(-scores, axis=1, kind="stable")[:, :k]
+        return top.tolist()
+
+    def get_context(self, passage_indices: List[int], max_tokens: int) -> str:
+        """Joins the passages, best first, within max_tokens."""
+        context = []
+        remaining = max_tokens
+        for index in passage_indices:
+            passage = self.passages[index]
+            tokens = estimate_tokens(passage + DOCUMENT_SEPARATOR)
+            if tokens > remaining:
+                # The best passage alone is over the budget
+                if not context:
+                    context.append(trim_to_tokens(passage, remaining))
+                break
+            context.append(passage)
+            remaining -= tokens
+        return DOCUMENT_SEPARATOR.join(context)
+
+    def get_contexts(
+        self, queries: List[str], embedding_function, k: int, max_tokens: int
+    ) -> List[str]:
+        if not self.passages or not queries:
+            return ["" for _ in queries]
+        return [
+            self.get_context(passage_indices, max_tokens)
+            for passage_indices in self.search(embedding_function(queries), k)
+        ]
+
+
+def get_slide_document_context_max_tokens() -> int:
+    max_tokens = parse_int_or_none(get_slide_document_context_max_tokens_env())
+    if max_tokens is None:
+        return DEFAULT_SLIDE_DOCUMENT_CONTEXT_MAX_TOKENS
+    return max(0, max_tokens)
+
+
+def get_slide_document_context_top_k() -> int:
+    top_k = parse_int_or_none(get_slide_document_context_top_k_env())
+    if top_k is None:
+        return DEFAULT_SLIDE_DOCUMENT_CONTEXT_TOP_K
+    return max(1, top_k)
+
+
+def get_slide_document_contexts_sync(
+    documents: List[str], outlines: List[str], embedding_function=None
+) -> List[str]:
+    if embedding_function is None:
+        from services.text_embedding import TEXT_EMBEDDING_FUNCTION
+
+        embedding_function = TEXT_EMBEDDING_FUNCTION.get()
+
+    index = DocumentPassageIndex.build(documents, embedding_function)
+    return index.get_contexts(
+        outlines,
+        embedding_function,
+        get_slide_document_context_top_k(),
+        get_slide_document_context_max_tokens(),
+    )
+
+
+async def get_slide_document_contexts(
+    documents: List[str], outlines: List[str]
+) -> List[Optional[str]]:
+    """
+    Returns the source document passages closest to each slide outline, within
+    SLIDE_DOCUMENT_CONTEXT_MAX_TOKENS. None for every slide when there are no
+    documents, retrieval is disabled or the embedding model is unavailable.
+    """
+    documents = [document for document in documents if document]
+    if not documents or not get_slide_document_context_max_tokens():
+        return [None for _ in outlines]
+
+    try:
+        contexts = await asyncio.to_thread(
+            get_slide_document_contexts_sync, documents, outlines
+        )
+    except Exception as e:
+        print(f"Failed to retrieve source document passages: {e}")
+        return [None for _ in outlines]
+    return [context or None for context in contexts]
+
+
+async def get_slide_document_contexts_from_files(
+    file_paths: Optional[List[str]], outlines: List[str]
+) -> List[Optional[str]]:
+    """
+    Same as get_slide_document_contexts for the uploaded files, parsed
+    documents come from the cache filled by the outline step. Loading errors
+    are reported and the slides are generated from the outlines alone.
+    """
+    if not file_paths or not get_slide_document_context_max_tokens():
+        return [None for _ in outlines]
+
+    documents_loader = DocumentsLoader(file_paths=file_paths)
+    try:
+        await documents_loader.load_documents()
+    except Exception as e:
+        detail = e.detail if isinstance(e, HTTPException) else e
+        print(f"Skipping source documents of the slides: {detail}")
+        return [None for _ in outlines]
+    return await get_slide_document_contexts(documents_loader.documents, outlines)
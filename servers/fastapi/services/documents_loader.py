@@ -2,7 +2,6 @@ import mimetypes
 from fastapi import HTTPException
 import os, asyncio
 from typing import List, Optional, Tuple
-import pdfplumber
 
 from constants.documents import (
     PDF_MIME_TYPES,
@@ -10,7 +9,14 @@ from constants.documents import (
     TEXT_MIME_TYPES,
     WORD_TYPES,
 )
-from services.docling_service import DoclingService
+from services.document_parsing import parse_document_to_markdown_async
+from services.pdf_renderer import (
+    get_pdf_page_count,
+    get_pdf_rendering_dpi,
+    get_pdf_rendering_max_size,
+    render_pdf_page_images,
+    render_pdf_pages,
+)
 
 
 class DocumentsLoader:
@@ -18,8 +24,6 @@ class DocumentsLoader:
     def __init__(self, file_paths: List[str]):
         self._file_paths = file_paths
 
-        self.docling_service = DoclingService()
-
         self._documents: List[str] = []
         self._images: List[List[str]] = []
 
@@ -37,10 +41,11 @@ class DocumentsLoader:
         load_text: bool = True,
         load_images: bool = False,
     ):
-        """If load_images is True, temp_dir must be provided"""
-
-        documents: List[str] = []
-        images: List[str] = []
+        """
+        If load_images is True, temp_dir must be provided.
+        Files are parsed in parallel, documents and images keep the order of
+        the file paths.
+        """
 
         for file_path in self._file_paths:
             if not os.path.exists(file_path):
@@ -48,26 +53,39 @@ class DocumentsLoader:
                     status_code=404, detail=f"File {file_path} not found"
                 )
 
-            document = ""
-            imgs = []
-
-            mime_type = mimetypes.guess_type(file_path)[0]
-            if mime_type in PDF_MIME_TYPES:
-                document, imgs = await self.load_pdf(
-                    file_path, load_text, load_images, temp_dir
-                )
-            elif mime_type in TEXT_MIME_TYPES:
-                document = await self.load_text(file_path)
-            elif mime_type in POWERPOINT_TYPES:
-                document = self.load_powerpoint(file_path)
-            elif mime_type in WORD_TYPES:
-                document = self.load_msword(file_path)
+        results = await asyncio.gather(
+            *[
+                self.load_document(file_path, temp_dir, load_text, load_images)
+                for file_path in self._file_paths
+            ]
+        )
 
-            documents.append(document)
-            images.append(imgs)
+        self._documents = [document for document, _ in results]
+        self._images = [imgs for _, imgs in results]
 
-        self._documents = documents
-        self._images = images
+    async def load_document(
+        self,
+        file_path: str,
+        temp_dir: Optional[str],
+        load_text: bool,
+        load_images: bool,
+    ) -> Tuple[str, List[str]]:
+        document = ""
+        imgs = []
+
+        mime_type = mimetypes.guess_type(file_path)[0]
+        if mime_type in PDF_MIME_TYPES:
+            document, imgs = await self.load_pdf(
+                file_path, load_text, load_images, temp_dir
+            )
+        elif mime_type in TEXT_MIME_TYPES:
+            document = await self.load_text(file_path)
+        elif mime_type in POWERPOINT_TYPES:
+            document = await self.load_powerpoint(file_path)
+        elif mime_type in WORD_TYPES:
+            document = await self.load_msword(file_path)
+
+        return document, imgs
 
     async def load_pdf(
         self,
@@ -80,7 +98,7 @@ class DocumentsLoader:
         document: str = ""
 
         if load_text:
-            document = self.docling_service.parse_to_markdown(file_path)
+            document = await parse_document_to_markdown_async(file_path)
 
         if load_images:
             image_paths = await self.get_page_images_from_pdf_async(file_path, temp_dir)
@@ -91,25 +109,24 @@ class DocumentsLoader:
         with open(file_path, "r") as file:
             return await asyncio.to_thread(file.read)
 
-    def load_msword(self, file_path: str) -> str:
-        return self.docling_service.parse_to_markdown(file_path)
+    async def load_msword(self, file_path: str) -> str:
+        return await parse_document_to_markdown_async(file_path)
 
-    def load_powerpoint(self, file_path: str) -> str:
-        return self.docling_service.parse_to_markdown(file_path)
+    async def load_powerpoint(self, file_path: str) -> str:
+        return await parse_document_to_markdown_async(file_path)
 
     @classmethod
     def get_page_images_from_pdf(cls, file_path: str, temp_dir: str) -> List[str]:
-        with pdfplumber.open(file_path) as pdf:
-            images = []
-            for page in pdf.pages:
-                img = page.to_image(resolution=150)
-                image_path = os.path.join(temp_dir, f"page_{page.page_number}.png")
-                img.save(image_path)
-                images.append(image_path)
-            return images
+        rendered = render_pdf_pages(
+            file_path,
+            list(range(get_pdf_page_count(file_path))),
+            temp_dir,
+            get_pdf_rendering_dpi(),
+            get_pdf_rendering_max_size(),
+        )
+        return [image_path for _, image_path in rendered]
 
     @classmethod
     async def get_page_images_from_pdf_async(cls, file_path: str, temp_dir: str):
-        return await asyncio.to_thread(
-            cls.get_page_images_from_pdf, file_path, temp_dir
-        )
+        """Renders the pages in parallel in the PDF rendering pool."""
+        return await render_pdf_page_images(file_path, temp_dir)
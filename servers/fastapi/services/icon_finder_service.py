@@ -1,56 +1,138 @@
 import asyncio
-import json
-import chromadb
-from chromadb.config import Settings
-from chromadb.utils.embedding_functions import ONNXMiniLM_L6_V2
+from typing import List, Optional
+
+from enums.icon_search_backend import IconSearchBackend
+from services.icon_index import (
+    ChromaIconIndex,
+    NumpyIconIndex,
+    get_icon_search_backend,
+)
+from services.icon_query_cache import (
+    DEFAULT_ICON_QUERY_CACHE_MAX_ENTRIES,
+    IconQueryCache,
+    normalize_icon_query,
+)
+from services.text_embedding import TEXT_EMBEDDING_FUNCTION
+from utils.asset_directory_utils import get_icon_query_cache_path
+from utils.get_env import (
+    get_icon_query_cache_max_entries_env,
+    get_icon_query_cache_persist_env,
+)
+from utils.lazy_proxy import LazyProxy
+from utils.parsers import parse_bool_or_none, parse_int_or_none
 
 
 class IconFinderService:
-    def __init__(self):
-        self.collection_name = "icons"
-        self.client = chromadb.PersistentClient(
-            path="chroma", settings=Settings(anonymized_telemetry=False)
+    def __init__(self, backend: Optional[IconSearchBackend] = None):
+        self.backend = backend or get_icon_search_backend()
+        print(f"Initializing icons index ({self.backend.value})...")
+        self._initialize_icons_index()
+        self._initialize_query_cache()
+        print("Icons index initialized.")
+
+    def _initialize_icons_index(self):
+        self.embedding_function = TEXT_EMBEDDING_FUNCTION.get()
+        if self.backend == IconSearchBackend.CHROMA:
+            self.index = ChromaIconIndex.load(self.embedding_function)
+        else:
+            self.index = NumpyIconIndex.load(self.embedding_function)
+
+    def _initialize_query_cache(self):
+        max_entries = parse_int_or_none(get_icon_query_cache_max_entries_env())
+        if max_entries is None:
+            max_entries = DEFAULT_ICON_QUERY_CACHE_MAX_ENTRIES
+        self.query_cache = IconQueryCache(max_entries) if max_entries > 0 else None
+        self.persist_query_cache = bool(
+            self.query_cache and parse_bool_or_none(get_icon_query_cache_persist_env())
         )
-        print("Initializing icons collection...")
-        self._initialize_icons_collection()
-        print("Icons collection initialized.")
-
-    def _initialize_icons_collection(self):
-        self.embedding_function = ONNXMiniLM_L6_V2()
-        self.embedding_function.DOWNLOAD_PATH = "chroma/models"
-        self.embedding_function._download_model_if_not_exists()
-        try:
-            self.collection = self.client.get_collection(
-                self.collection_name, embedding_function=self.embedding_function
+        if self.persist_query_cache:
+            self.query_cache.load(
+                get_icon_query_cache_path(),
+                self.embedding_function.MODEL_NAME,
+                self.index.fingerprint,
+            )
+
+    def save_query_cache(self):
+        if self.persist_query_cache:
+            self.query_cache.save(
+                get_icon_query_cache_path(),
+                self.embedding_function.MODEL_NAME,
+                self.index.fingerprint,
             )
-        except Exception:
-            with open("assets/icons.json", "r") as f:
-                icons = json.load(f)
-
-            documents = []
-            ids = []
-
-            for i, each in enumerate(icons["icons"]):
-                if each["name"].split("-")[-1] == "bold":
-                    doc_text = f"{each['name']} {each['tags']}"
-                    documents.append(doc_text)
-                    ids.append(each["name"])
-
-            if documents:
-                self.collection = self.client.create_collection(
-                    name=self.collection_name,
-                    embedding_function=self.embedding_function,
-                    metadata={"hnsw:space": "cosine"},
-                )
-                self.collection.add(documents=documents, ids=ids)
+
+    def get_query_cache_stats(self) -> Optional[dict]:
+        return self.query_cache.get_stats() if self.query_cache else None
+
+    def _search_icon_names(self, queries: List[str], k: int) -> List[List[str]]:
+        if not self.query_cache:
+            return self.index.search(self.embedding_function(queries), k)
+
+        queries = [normalize_icon_query(query) for query in queries]
+        results = {}
+        for query in dict.fromkeys(queries):
+            icon_names = self.query_cache.get_results(query, k)
+            if icon_names is not None:
+                results[query] = icon_names
+
+        missing_queries = [
+            query for query in dict.fromkeys(queries) if query not in results
+        ]
+        if missing_queries:
+            embeddings = {}
+            for query in missing_queries:
+                embedding = self.query_cache.get_embedding(query)
+                if embedding is not None:
+                    embeddings[query] = embedding
+
+            # Only queries never seen before go through the model
+            queries_to_embed = [q for q in missing_queries if q not in embeddings]
+            if queries_to_embed:
+                for query, embedding in zip(
+                    queries_to_embed, self.embedding_function(queries_to_embed)
+                ):
+                    embeddings[query] = embedding
+                    self.query_cache.set_embedding(query, embedding)
+
+            for query, icon_names in zip(
+                missing_queries,
+                self.index.search([embeddings[q] for q in missing_queries], k),
+            ):
+                results[query] = icon_names
+                self.query_cache.set_results(query, k, icon_names)
+
+        return [results[query] for query in queries]
 
     async def search_icons(self, query: str, k: int = 1):
-        result = await asyncio.to_thread(
-            self.collection.query,
-            query_texts=[query],
-            n_results=k,
+        return (await self.search_icons_many([query], k))[0]
+
+    async def search_icons_many(self, queries: List[str], k: int = 1) -> List[List[str]]:
+        """
+        Resolves all queries with a single embedding batch and index query.
+        Returns the icon urls of each query, in the order of queries.
+        """
+        if not queries:
+            return []
+
+        unique_queries = list(dict.fromkeys(queries))
+        icon_names = await asyncio.to_thread(
+            self._search_icon_names, unique_queries, k
         )
-        return [f"/static/icons/bold/{each}.svg" for each in result["ids"][0]]
+        icons = {
+            query: [f"/static/icons/bold/{each}.svg" for each in names]
+            for query, names in zip(unique_queries, icon_names)
+        }
+        return [icons[query] for query in queries]
+
+
+# Loads the embedding model and the icons index on first use
+ICON_FINDER_SERVICE: IconFinderService = LazyProxy(IconFinderService)
 
 
-ICON_FINDER_SERVICE = IconFinderService()
+async def get_icon_finder_service() -> IconFinderService:
+    """
+    Returns ICON_FINDER_SERVICE, built in a thread on first use so the event
+    loop keeps serving other requests while the model and index load.
+    """
+    if ICON_FINDER_SERVICE.is_initialized():
+        return ICON_FINDER_SERVICE.get()
+    return await asyncio.to_thread(ICON_FINDER_SERVICE.get)
@@ -0,0 +1,153 @@
+import hashlib
+import json
+import os
+import uuid
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from enums.icon_search_backend import IconSearchBackend
+from utils.get_env import get_icon_search_backend_env
+
+ICONS_PATH = "assets/icons.json"
+ICON_INDEX_DIRECTORY = "chroma"
+ICONS_COLLECTION_NAME = "icons"
+
+
+def get_icon_search_backend() -> IconSearchBackend:
+    try:
+        return IconSearchBackend(get_icon_search_backend_env() or "chroma")
+    except ValueError:
+        print(f"Unknown icon search backend: {get_icon_search_backend_env()}")
+        return IconSearchBackend.CHROMA
+
+
+def get_icon_documents(icons_path: str = ICONS_PATH) -> Tuple[List[str], List[str]]:
+    """Returns the names and searchable texts of the bold icons."""
+    with open(icons_path, "r") as f:
+        icons = json.load(f)
+
+    ids = []
+    documents = []
+    for each in icons["icons"]:
+        if each["name"].split("-")[-1] == "bold":
+            documents.append(f"{each['name']} {each['tags']}")
+            ids.append(each["name"])
+    return ids, documents
+
+
+def normalize_embeddings(embeddings) -> np.ndarray:
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    return embeddings / np.maximum(norms, 1e-12)
+
+
+class ChromaIconIndex:
+    """Icons in a persistent Chroma collection, searched through its HNSW index."""
+
+    def __init__(self, collection):
+        self.collection = collection
+        # Identifies the indexed icons, for caches of search results
+        self.fingerprint = f"chroma:{collection.name}:{collection.count()}"
+
+    @classmethod
+    def load(cls, embedding_function, directory: str = ICON_INDEX_DIRECTORY):
+        import chromadb
+        from chromadb.config import Settings
+
+        client = chromadb.PersistentClient(
+            path=directory, settings=Settings(anonymized_telemetry=False)
+        )
+        try:
+            collection = client.get_collection(
+                ICONS_COLLECTION_NAME, embedding_function=embedding_function
+            )
+        except Exception:
+            ids, documents = get_icon_documents()
+            collection = client.create_collection(
+                name=ICONS_COLLECTION_NAME,
+                embedding_function=embedding_function,
+                metadata={"hnsw:space": "cosine"},
+            )
+            if documents:
+                collection.add(documents=documents, ids=ids)
+        return cls(collection)
+
+    def search(self, query_embeddings, k: int) -> List[List[str]]:
+        result = self.collection.query(
+            query_embeddings=np.asarray(query_embeddings, dtype=np.float32),
+            n_results=k,
+        )
+        return result["ids"]
+
+
+class NumpyIconIndex:
+    """
+    All icon embeddings in one normalized float32 matrix. Top-k cosine search
+    is a single matrix product followed by argpartition.
+    """
+
+    def __init__(
+        self, ids: Sequence[str], embeddings, fingerprint: Optional[str] = None
+    ):
+        self.ids = np.asarray(ids)
+        self.embeddings = normalize_embeddings(embeddings).reshape(len(self.ids), -1)
+        # Identifies the indexed icons, for caches of search results
+        self.fingerprint = fingerprint or hashlib.sha256(
+            json.dumps(list(ids)).encode("utf-8")
+        ).hexdigest()[:16]
+
+    @classmethod
+    def load(
+        cls,
+        embedding_function,
+        directory: str = ICON_INDEX_DIRECTORY,
+        icons_path: str = ICONS_PATH,
+    ):
+        """
+        Loads the icon embeddings precomputed for the icons corpus and the
+        embedding model, computing and saving them on first use.
+        """
+        ids, documents = get_icon_documents(icons_path)
+        model_name = getattr(
+            embedding_function, "MODEL_NAME", type(embedding_function).__name__
+        )
+        corpus_hash = hashlib.sha256(
+            json.dumps([model_name, ids, documents]).encode("utf-8")
+        ).hexdigest()[:16]
+        embeddings_path = os.path.join(directory, f"icon_embeddings_{corpus_hash}.npy")
+
+        embeddings: Optional[np.ndarray] = None
+        try:
+            embeddings = np.load(embeddings_path)
+        except (OSError, ValueError):
+            pass
+
+        if embeddings is None or embeddings.shape[0] != len(ids):
+            print("Computing icon embeddings...")
+            embeddings = normalize_embeddings(embedding_function(documents))
+            os.makedirs(directory, exist_ok=True)
+            temp_path = f"{embeddings_path}.{uuid.uuid4()}.tmp.npy"
+            np.save(temp_path, embeddings)
+            os.replace(temp_path, embeddings_path)
+
+        return cls(ids, embeddings, f"numpy:{corpus_hash}")
+
+    def search(self, query_embeddings, k: int) -> List[List[str]]:
+        queries = normalize_embeddings(query_embeddings).reshape(
+            -1, self.embeddings.shape[1]
+        )
+        k = min(k, len(self.ids))
+        if k <= 0:
+            return [[] for _ in range(len(queries))]
+
+        scores = queries @ self.embeddings.T
+        if k < len(self.ids):
+            top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        else:
+            top = np.broadcast_to(np.arange(k), (len(queries), k))
+        order = np.argsort(
+            -np.take_along_axis(scores, top, axis=1), axis=1, kind="stable"
+        )
+        top = np.take_along_axis(top, order, axis=1)
+        return [self.ids[row].tolist() for row in top]
@@ -0,0 +1,146 @@
+import json
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+DEFAULT_ICON_QUERY_CACHE_MAX_ENTRIES = 4096
+
+
+def normalize_icon_query(query: str) -> str:
+    # MiniLM is uncased, so case and spacing do not change the embedding
+    return " ".join(query.lower().split())
+
+
+class IconQueryCache:
+    """
+    LRU caches of normalized icon query -> embedding and -> ranked icon names,
+    so repeated queries skip both model inference and the index search.
+
+    Results are kept for the largest k searched, smaller k are served from its
+    prefix. The cache can be saved to an .npz file and loaded back after a
+    restart. Embeddings are only reused with the same model, results only with
+    the same index.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_ICON_QUERY_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._embeddings: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._results: OrderedDict[str, Tuple[int, List[str]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.embedding_hits = 0
+        self.embedding_misses = 0
+        self.result_hits = 0
+        self.result_misses = 0
+
+    def _set(self, entries: OrderedDict, key, value):
+        entries[key] = value
+        entries.move_to_end(key)
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+
+    def get_embedding(self, query: str) -> Optional[np.ndarray]:
+        with self._lock:
+            embedding = self._embeddings.get(query)
+            if embedding is None:
+                self.embedding_misses += 1
+                return None
+            self._embeddings.move_to_end(query)
+            self.embedding_hits += 1
+            return embedding
+
+    def set_embedding(self, query: str, embedding):
+        with self._lock:
+            self._set(self._embeddings, query, np.asarray(embedding, np.float32))
+
+    def get_results(self, query: str, k: int) -> Optional[List[str]]:
+        with self._lock:
+            result = self._results.get(query)
+            # Fewer names than searched means the whole index was returned
+            if result is None or (result[0] < k and len(result[1]) == result[0]):
+                self.result_misses += 1
+                return None
+            self._results.move_to_end(query)
+            self.result_hits += 1
+            return result[1][:k]
+
+    def set_results(self, query: str, k: int, icon_names: List[str]):
+        with self._lock:
+            result = self._results.get(query)
+            if result is None or result[0] <= k:
+                self._set(self._results, query, (k, list(icon_names)))
+
+    def clear_results(self):
+        with self._lock:
+            self._results.clear()
+
+    def save(self, path: str, model_name: str, index_fingerprint: str):
+        with self._lock:
+            queries = list(self._embeddings.keys())
+            embeddings = list(self._embeddings.values())
+            metadata = {
+                "model_name": model_name,
+                "index_fingerprint": index_fingerprint,
+                "results": [
+                    [query, k, names] for query, (k, names) in self._results.items()
+                ],
+            }
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{uuid.uuid4()}.tmp.npz"
+        np.savez(
+            temp_path,
+            queries=np.array(queries, dtype=str),
+            embeddings=(
+                np.stack(embeddings) if embeddings else np.zeros((0, 0), np.float32)
+            ),
+            metadata=np.array(json.dumps(metadata)),
+        )
+        os.replace(temp_path, path)
+
+    def load(self, path: str, model_name: str, index_fingerprint: str) -> bool:
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                queries = data["queries"].tolist()
+                embeddings = data["embeddings"]
+                metadata = json.loads(str(data["metadata"]))
+        except (OSError, KeyError, ValueError) as e:
+            if not isinstance(e, FileNotFoundError):
+                print(f"Could not load icon query cache: {e}")
+            return False
+
+        if metadata.get("model_name") != model_name:
+            return False
+
+        with self._lock:
+            for query, embedding in zip(queries, embeddings):
+                self._set(self._embeddings, query, embedding)
+            if metadata.get("index_fingerprint") == index_fingerprint:
+                for query, k, names in metadata.get("results", []):
+                    self._set(self._results, query, (k, names))
+        return True
+
+    def get_stats(self) -> dict:
+        embedding_lookups = self.embedding_hits + self.embedding_misses
+        result_lookups = self.result_hits + self.result_misses
+        return {
+            "embeddings": len(self._embeddings),
+            "results": len(self._results),
+            "max_entries": self.max_entries,
+            "embedding_hits": self.embedding_hits,
+            "embedding_misses": self.embedding_misses,
+            "embedding_hit_rate": (
+                round(self.embedding_hits / embedding_lookups, 3)
+                if embedding_lookups
+                else None
+            ),
+            "result_hits": self.result_hits,
+            "result_misses": self.result_misses,
+            "result_hit_rate": (
+                round(self.result_hits / result_lookups, 3) if result_lookups else None
+            ),
+        }
@@ -0,0 +1,157 @@
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import uuid
+from typing import Optional
+
+from services.size_capped_cache import SharedCaches, SizeCappedCache
+from utils.asset_directory_utils import get_image_generation_cache_directory
+from utils.file_utils import get_file_hash, link_or_copy_file
+from utils.get_env import get_image_generation_cache_max_size_mb_env
+
+DEFAULT_IMAGE_GENERATION_CACHE_MAX_SIZE_MB = 1024
+
+
+class ImageGenerationCache(SizeCappedCache):
+    """
+    Persistent cache of generated images.
+
+    Entries are keyed by provider, model, quality and the full themed prompt.
+    Image files are stored content-addressed in directory and indexed in a
+    sidecar sqlite database, which also tracks last access for LRU eviction
+    once the cache grows over max_size_bytes. Lookups copy the image out to
+    the served images directory, the cache itself is never served.
+    """
+
+    def __init__(self, directory: str, max_size_bytes: int):
+        super().__init__(directory, max_size_bytes)
+        self._connection = sqlite3.connect(
+            os.path.join(self.directory, "index.db"), check_same_thread=False
+        )
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                file TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._connection.commit()
+
+    @staticmethod
+    def get_key(
+        provider: str, model: Optional[str], quality: Optional[str], prompt: str
+    ) -> str:
+        return hashlib.sha256(
+            json.dumps([provider, model, quality, prompt]).encode("utf-8")
+        ).hexdigest()
+
+    def get(self, key: str, output_directory: str) -> Optional[str]:
+        """
+        Returns a new path in output_directory holding the cached image,
+        or None if there is no entry for the key.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT file FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            cached_path = os.path.join(self.directory, row[0]) if row else None
+
+            if cached_path and not os.path.exists(cached_path):
+                # File was removed behind our back
+                self._connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._connection.commit()
+                cached_path = None
+
+            if not cached_path:
+                self.misses += 1
+                return None
+
+            self._connection.execute(
+                "UPDATE entries SET last_accessed_at = ? WHERE key = ?",
+                (time.time(), key),
+            )
+            self._connection.commit()
+            self.hits += 1
+
+            image_path = os.path.join(
+                output_directory, f"{uuid.uuid4()}{os.path.splitext(row[0])[1]}"
+            )
+            link_or_copy_file(cached_path, image_path)
+            return image_path
+
+    def put(self, key: str, image_path: str):
+        file = f"{get_file_hash(image_path)}{os.path.splitext(image_path)[1]}"
+        cached_path = os.path.join(self.directory, file)
+        now = time.time()
+
+        with self._lock:
+            if not os.path.exists(cached_path):
+                link_or_copy_file(image_path, cached_path)
+            self._connection.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                (key, file, os.path.getsize(cached_path), now, now),
+            )
+            self._connection.commit()
+            self._evict()
+
+    def _get_size(self) -> int:
+        # Several keys may point to the same file, count it once
+        return self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM "
+            "(SELECT MAX(size) AS size FROM entries GROUP BY file)"
+        ).fetchone()[0]
+
+    def _evict(self):
+        size = self._get_size()
+        if size <= self.max_size_bytes:
+            return
+
+        for key, file, file_size in self._connection.execute(
+            "SELECT key, file, size FROM entries ORDER BY last_accessed_at"
+        ).fetchall():
+            if size <= self.max_size_bytes:
+                break
+            self._connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self.evictions += 1
+
+            is_referenced = self._connection.execute(
+                "SELECT 1 FROM entries WHERE file = ?", (file,)
+            ).fetchone()
+            if not is_referenced:
+                try:
+                    os.remove(os.path.join(self.directory, file))
+                except FileNotFoundError:
+                    pass
+                size -= file_size
+
+        self._connection.commit()
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            entries = self._connection.execute(
+                "SELECT COUNT(*) FROM entries"
+            ).fetchone()[0]
+            size = self._get_size()
+        return {"entries": entries, "size_bytes": size, **super().get_stats()}
+
+
+_IMAGE_GENERATION_CACHES: SharedCaches[ImageGenerationCache] = SharedCaches(
+    ImageGenerationCache,
+    get_image_generation_cache_max_size_mb_env,
+    DEFAULT_IMAGE_GENERATION_CACHE_MAX_SIZE_MB,
+    get_image_generation_cache_directory,
+)
+
+
+def get_image_generation_cache() -> Optional[ImageGenerationCache]:
+    """
+    Returns the shared cache of generated images.
+    IMAGE_GENERATION_CACHE_MAX_SIZE_MB=0 disables caching.
+    """
+    return _IMAGE_GENERATION_CACHES.get()
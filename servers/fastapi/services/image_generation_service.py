@@ -1,15 +1,24 @@
 import asyncio
 import base64
+import hashlib
 import json
 import os
+from typing import List, Optional, Tuple
 import aiohttp
 from fastapi import HTTPException
 from google import genai
-import ssl
-import certifi
 from openai import NOT_GIVEN, AsyncOpenAI
+from enums.image_provider import ImageProvider
+from enums.llm_provider import LLMProvider
 from models.image_prompt import ImagePrompt
 from models.sql.image_asset import ImageAsset
+from services.image_generation_cache import get_image_generation_cache
+from services.llm_client_registry import LLM_CLIENT_REGISTRY
+from services.stock_image_session_pool import (
+    STOCK_IMAGE_RESULTS_PER_QUERY,
+    STOCK_IMAGE_SEARCH_CACHE,
+    STOCK_IMAGE_SESSION_POOL,
+)
 from utils.get_env import (
     get_dall_e_3_quality_env,
     get_gpt_image_1_5_quality_env,
@@ -30,12 +39,32 @@ from utils.image_provider import (
 )
 import uuid
 
+DALL_E_3_MODEL = "dall-e-3"
+DEFAULT_DALL_E_3_QUALITY = "standard"
+GPT_IMAGE_1_5_MODEL = "gpt-image-1.5"
+DEFAULT_GPT_IMAGE_1_5_QUALITY = "medium"
+GEMINI_FLASH_IMAGE_MODEL = "gemini-2.5-flash-image-preview"
+NANOBANANA_PRO_IMAGE_MODEL = "gemini-3-pro-image-preview"
+
+# Provider, model and quality (or the ComfyUI url and workflow hash)
+ImageModelSettings = Tuple[str, str, Optional[str]]
+
 
 class ImageGenerationService:
     def __init__(self, output_directory: str):
         self.output_directory = output_directory
         self.is_image_generation_disabled = is_image_generation_disabled()
         self.image_gen_func = self.get_image_gen_func()
+        self.cache = get_image_generation_cache()
+        # Generators and the settings they request images with, which are
+        # also the cache key of the images
+        self.image_model_settings = {
+            self.generate_image_openai_dalle3: self.get_dalle3_settings,
+            self.generate_image_openai_gpt_image_1_5: self.get_gpt_image_1_5_settings,
+            self.generate_image_gemini_flash: self.get_gemini_flash_settings,
+            self.generate_image_nanobanana_pro: self.get_nanobanana_pro_settings,
+            self.generate_image_comfyui: self.get_comfyui_settings,
+        }
 
     def get_image_gen_func(self):
         if self.is_image_generation_disabled:
@@ -60,6 +89,69 @@ class ImageGenerationService:
     def is_stock_provider_selected(self):
         return is_pixels_selected() or is_pixabay_selected()
 
+    def get_dalle3_settings(self) -> ImageModelSettings:
+        return (
+            "openai",
+            DALL_E_3_MODEL,
+            get_dall_e_3_quality_env() or DEFAULT_DALL_E_3_QUALITY,
+        )
+
+    def get_gpt_image_1_5_settings(self) -> ImageModelSettings:
+        return (
+            "openai",
+            GPT_IMAGE_1_5_MODEL,
+            get_gpt_image_1_5_quality_env() or DEFAULT_GPT_IMAGE_1_5_QUALITY,
+        )
+
+    def get_gemini_flash_settings(self) -> ImageModelSettings:
+        return "google", GEMINI_FLASH_IMAGE_MODEL, None
+
+    def get_nanobanana_pro_settings(self) -> ImageModelSettings:
+        return "google", NANOBANANA_PRO_IMAGE_MODEL, None
+
+    def get_comfyui_settings(self) -> ImageModelSettings:
+        # Model and sampler settings live in the workflow
+        workflow_hash = hashlib.sha256(
+            (get_comfyui_workflow_env() or "").encode("utf-8")
+        ).hexdigest()
+        return "comfyui", get_comfyui_url_env(), workflow_hash
+
+    def get_image_cache_key(self, image_gen_func, prompt: str) -> str | None:
+        """
+        Returns the cache key for the generated image.
+        Stock providers return urls and are not cached here.
+        """
+        get_settings = self.image_model_settings.get(image_gen_func)
+        if not get_settings:
+            return None
+        return self.cache.get_key(*get_settings(), prompt)
+
+    async def generate_image_with_cache(self, image_gen_func, prompt: str) -> str:
+        """
+        Generates an image with image_gen_func, reusing a previously generated
+        image for the same provider, model, quality and prompt if available.
+        """
+        cache_key = (
+            self.get_image_cache_key(image_gen_func, prompt) if self.cache else None
+        )
+        if cache_key:
+            image_path = await asyncio.to_thread(
+                self.cache.get, cache_key, self.output_directory
+            )
+            if image_path:
+                print(f"Image cache hit for {image_gen_func.__name__}")
+                return image_path
+
+        image_path = await image_gen_func(prompt, self.output_directory)
+
+        if cache_key and image_path and os.path.exists(image_path):
+            try:
+                await asyncio.to_thread(self.cache.put, cache_key, image_path)
+            except Exception as e:
+                print(f"Error caching generated image: {e}")
+
+        return image_path
+
     async def generate_image(self, prompt: ImagePrompt) -> str | ImageAsset:
         """
         Generates an image based on the provided prompt.
@@ -89,15 +181,15 @@ class ImageGenerationService:
                 if self.is_stock_provider_selected():
                     image_path = await self.image_gen_func(image_prompt)
                 else:
-                    image_path = await self.image_gen_func(
-                        image_prompt, self.output_directory
+                    image_path = await self.generate_image_with_cache(
+                        self.image_gen_func, image_prompt
                     )
 
             # If the primary provider fails or returns no image, fallback to Gemini
             if not image_path:
                 print("Primary provider failed. Falling back to Gemini Flash for image generation.")
-                image_path = await self.generate_image_gemini_flash(
-                    image_prompt, self.output_directory
+                image_path = await self.generate_image_with_cache(
+                    self.generate_image_gemini_flash, image_prompt
                 )
 
             if image_path:
@@ -127,7 +219,7 @@ class ImageGenerationService:
             prompt=prompt,
             n=1,
             quality=quality,
-            response_format="b64_json" if model == "dall-e-3" else NOT_GIVEN,
+            response_format="b64_json" if model == DALL_E_3_MODEL else NOT_GIVEN,
             size="1024x1024",
         )
         image_path = os.path.join(output_directory, f"{uuid.uuid4()}.png")
@@ -138,28 +230,27 @@ class ImageGenerationService:
     async def generate_image_openai_dalle3(
         self, prompt: str, output_directory: str
     ) -> str:
+        _, model, quality = self.get_dalle3_settings()
         return await self.generate_image_openai(
-            prompt,
-            output_directory,
-            "dall-e-3",
-            get_dall_e_3_quality_env() or "standard",
+            prompt, output_directory, model, quality
         )
 
     async def generate_image_openai_gpt_image_1_5(
         self, prompt: str, output_directory: str
     ) -> str:
+        _, model, quality = self.get_gpt_image_1_5_settings()
         return await self.generate_image_openai(
-            prompt,
-            output_directory,
-            "gpt-image-1.5",
-            get_gpt_image_1_5_quality_env() or "medium",
+            prompt, output_directory, model, quality
         )
 
     async def _generate_image_google(
         self, prompt: str, output_directory: str, model: str
     ) -> str:
         """Base method for Google image generation models."""
-        client = genai.Client()
+        client: genai.Client = LLM_CLIENT_REGISTRY.get_client(
+            LLMProvider.GOOGLE,
+            lambda api_key, _: genai.Client(api_key=api_key),
+        )
         response = await asyncio.to_thread(
             client.models.generate_content,
             model=model,
@@ -184,81 +275,97 @@ class ImageGenerationService:
         self, prompt: str, output_directory: str
     ) -> str:
         """Generate image using Gemini Flash (gemini-2.5-flash-image-preview)."""
-        return await self._generate_image_google(
-            prompt, output_directory, "gemini-2.5-flash-image-preview"
-        )
+        _, model, _ = self.get_gemini_flash_settings()
+        return await self._generate_image_google(prompt, output_directory, model)
 
     async def generate_image_nanobanana_pro(
         self, prompt: str, output_directory: str
     ) -> str:
         """Generate image using NanoBanana Pro (gemini-3-pro-image-preview)."""
-        return await self._generate_image_google(
-            prompt, output_directory, "gemini-3-pro-image-preview"
-        )
+        _, model, _ = self.get_nanobanana_pro_settings()
+        return await self._generate_image_google(prompt, output_directory, model)
 
     async def get_image_from_pixabay(self, query: str) -> str:
-        api_key = get_pixabay_api_key_env()
-        if not api_key:
-            raise ValueError("Pixabay API key not found")
-
         # Simplify the query to the first 5 words to improve match rate
         simplified_query = " ".join(query.split()[:5])
         print(f"Simplified Pixabay query: {simplified_query}")
 
-        url = f"https://pixabay.com/api/?key={api_key}&q={simplified_query}&image_type=photo&orientation=horizontal&safesearch=true&per_page=3"
-        print(f"Fetching image from Pixabay: {url}")
-
-        # Create an SSL context using certifi's certificates
-        ssl_context = ssl.create_default_context(cafile=certifi.where())
-        connector = aiohttp.TCPConnector(ssl=ssl_context)
-
-        async with aiohttp.ClientSession(connector=connector) as session:
-            async with session.get(url) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    print(f"Error from Pixabay API: {response.status} - {error_text}")
-                    raise HTTPException(
-                        status_code=response.status,
-                        detail=f"Failed to fetch image from Pixabay: {error_text}",
-                    )
-                
-                data = await response.json()
-                print(f"Pixabay API response: {data}")
+        result = STOCK_IMAGE_SEARCH_CACHE.get(ImageProvider.PIXABAY, simplified_query)
+        if not result:
+            result = STOCK_IMAGE_SEARCH_CACHE.set(
+                ImageProvider.PIXABAY,
+                simplified_query,
+                await self.search_images_on_pixabay(simplified_query),
+            )
+
+        image_url = result.next_url()
+        if not image_url:
+            print("No images found from Pixabay for the query.")
+        return image_url
+
+    async def search_images_on_pixabay(self, query: str) -> List[str]:
+        api_key = get_pixabay_api_key_env()
+        if not api_key:
+            raise ValueError("Pixabay API key not found")
 
-                if data["hits"]:
-                    return data["hits"][0]["largeImageURL"]
-                
-                print("No images found from Pixabay for the query.")
-                return ""
+        print(f"Fetching images from Pixabay: {query}")
+        session = STOCK_IMAGE_SESSION_POOL.get_session(ImageProvider.PIXABAY)
+        async with session.get(
+            "https://pixabay.com/api/",
+            params={
+                "key": api_key,
+                "q": query,
+                "image_type": "photo",
+                "orientation": "horizontal",
+                "safesearch": "true",
+                "per_page": STOCK_IMAGE_RESULTS_PER_QUERY,
+            },
+        ) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                print(f"Error from Pixabay API: {response.status} - {error_text}")
+                raise HTTPException(
+                    status_code=response.status,
+                    detail=f"Failed to fetch image from Pixabay: {error_text}",
+                )
 
+            data = await response.json()
+            return [hit["largeImageURL"] for hit in data["hits"]]
 
     async def get_image_from_pexels(self, query: str) -> str:
+        result = STOCK_IMAGE_SEARCH_CACHE.get(ImageProvider.PEXELS, query)
+        if not result:
+            result = STOCK_IMAGE_SEARCH_CACHE.set(
+                ImageProvider.PEXELS, query, await self.search_images_on_pexels(query)
+            )
+
+        image_url = result.next_url()
+        if not image_url:
+            print("No images found from Pexels for the query.")
+        return image_url
+
+    async def search_images_on_pexels(self, query: str) -> List[str]:
         api_key = get_pexels_api_key_env()
         if not api_key:
             raise ValueError("Pexels API key not found")
 
-        url = f"https://api.pexels.com/v1/search?query={query}&per_page=1"
-        print(f"Fetching image from Pexels: {url}")
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers={"Authorization": api_key}) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    print(f"Error from Pexels API: {response.status} - {error_text}")
-                    raise HTTPException(
-                        status_code=response.status,
-                        detail=f"Failed to fetch image from Pexels: {error_text}",
-                    )
-                
-                data = await response.json()
-                print(f"Pexels API response: {data}")
-
-                if data["photos"]:
-                    return data["photos"][0]["src"]["large"]
-                
-                print("No images found from Pexels for the query.")
-                return ""
+        print(f"Fetching images from Pexels: {query}")
+        session = STOCK_IMAGE_SESSION_POOL.get_session(ImageProvider.PEXELS)
+        async with session.get(
+            "https://api.pexels.com/v1/search",
+            params={"query": query, "per_page": STOCK_IMAGE_RESULTS_PER_QUERY},
+            headers={"Authorization": api_key},
+        ) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                print(f"Error from Pexels API: {response.status} - {error_text}")
+                raise HTTPException(
+                    status_code=response.status,
+                    detail=f"Failed to fetch image from Pexels: {error_text}",
+                )
 
+            data = await response.json()
+            return [photo["src"]["large"] for photo in data["photos"]]
 
     async def generate_image_comfyui(self, prompt: str, output_directory: str) -> str:
         """
@@ -0,0 +1,384 @@
+import asyncio
+import os
+import shutil
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+import weakref
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from utils.get_env import (
+    get_libreoffice_conversion_timeout_env,
+    get_libreoffice_max_jobs_per_worker_env,
+    get_libreoffice_prewarm_env,
+    get_libreoffice_workers_env,
+)
+from utils.lazy_proxy import LazyProxy
+from utils.parsers import parse_bool_or_none, parse_int_or_none
+
+LIBREOFFICE_PATHS = [
+    "soffice",
+    "libreoffice",  # Common on Linux
+    "/Applications/LibreOffice.app/Contents/MacOS/soffice",  # macOS
+]
+
+DEFAULT_LIBREOFFICE_WORKERS = 2
+DEFAULT_LIBREOFFICE_MAX_JOBS_PER_WORKER = 50
+DEFAULT_LIBREOFFICE_CONVERSION_TIMEOUT = 120
+
+# Seconds a new listener gets to accept connections
+LIBREOFFICE_STARTUP_TIMEOUT = 30
+
+PDF_EXPORT_FILTERS = {
+    ".ppt": "impress_pdf_Export",
+    ".pptx": "impress_pdf_Export",
+    ".odp": "impress_pdf_Export",
+    ".doc": "writer_pdf_Export",
+    ".docx": "writer_pdf_Export",
+    ".odt": "writer_pdf_Export",
+}
+
+
+def find_libreoffice_path() -> Optional[str]:
+    for path in LIBREOFFICE_PATHS:
+        if shutil.which(path):
+            return path
+    return None
+
+
+def load_uno():
+    """The UNO bindings ship with LibreOffice (python3-uno), not with pip."""
+    try:
+        import uno
+
+        return uno
+    except ImportError:
+        return None
+
+
+def get_free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def get_positive_int(value: Optional[str], default: int) -> int:
+    value = parse_int_or_none(value)
+    return value if value is not None and value > 0 else default
+
+
+class LibreOfficeWorker:
+    """
+    A headless soffice listening on a local socket, with its own user
+    profile so workers never share locks or settings. Documents are
+    converted over the socket with UNO. Without the UNO bindings each
+    conversion runs its own soffice, still in the worker's profile.
+    """
+
+    def __init__(self, libreoffice_path: str, conversion_timeout: int):
+        self.libreoffice_path = libreoffice_path
+        self.conversion_timeout = conversion_timeout
+        self.profile_directory = tempfile.mkdtemp(prefix="soffice_profile_")
+        self.jobs = 0
+        self.process: Optional[subprocess.Popen] = None
+        self.desktop = None
+        self.uno = load_uno()
+        if self.uno:
+            self._start_listener()
+
+    def get_command(self, *args: str) -> List[str]:
+        return [
+            self.libreoffice_path,
+            "--headless",
+            "--invisible",
+            "--nologo",
+            "--norestore",
+            "--nodefault",
+            "--nolockcheck",
+            f"-env:UserInstallation={Path(self.profile_directory).as_uri()}",
+            *args,
+        ]
+
+    def _start_listener(self):
+        connection = (
+            f"socket,host=127.0.0.1,port={get_free_port()};"
+            "urp;StarOffice.ComponentContext"
+        )
+        self.process = subprocess.Popen(
+            self.get_command(f"--accept={connection}"),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+        local_context = self.uno.getComponentContext()
+        resolver = local_context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local_context
+        )
+        deadline = time.monotonic() + LIBREOFFICE_STARTUP_TIMEOUT
+        while True:
+            try:
+                context = resolver.resolve(f"uno:{connection}")
+                break
+            except Exception:
+                if self.process.poll() is not None or time.monotonic() > deadline:
+                    self.close()
+                    raise Exception("LibreOffice listener failed to start")
+                time.sleep(0.25)
+
+        self.desktop = context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.frame.Desktop", context
+        )
+
+    def is_healthy(self) -> bool:
+        if self.process is None:
+            return self.desktop is None
+        if self.process.poll() is not None:
+            return False
+        try:
+            # Round trip over the socket
+            self.desktop.getComponents()
+            return True
+        except Exception:
+            return False
+
+    def convert(self, input_path: str, output_directory: str) -> str:
+        """Converts the document to a PDF in output_directory, returns its path."""
+        self.jobs += 1
+        output_path = os.path.join(
+            output_directory, f"{Path(input_path).stem}.pdf"
+        )
+        if self.desktop is None:
+            self._convert_with_process(input_path, output_directory)
+        else:
+            self._convert_with_listener(input_path, output_path)
+
+        if not os.path.exists(output_path):
+            raise Exception("LibreOffice failed to generate PDF file")
+        return output_path
+
+    def _convert_with_process(self, input_path: str, output_directory: str):
+        try:
+            result = subprocess.run(
+                self.get_command(
+                    "--convert-to", "pdf", "--outdir", output_directory, input_path
+                ),
+                capture_output=True,
+                timeout=self.conversion_timeout,
+            )
+        except subprocess.TimeoutExpired:
+            raise TimeoutError(
+                f"LibreOffice conversion timed out after {self.conversion_timeout}s"
+            )
+        if result.returncode != 0:
+            raise Exception(
+                f"LibreOffice conversion failed: {result.stderr.decode().strip()}"
+            )
+
+    def _make_property(self, name: str, value):
+        prop = self.uno.createUnoStruct("com.sun.star.beans.PropertyValue")
+        prop.Name = name
+        prop.Value = value
+        return prop
+
+    def _convert_with_listener(self, input_path: str, output_path: str):
+        # A blocked UNO call can't be cancelled, stopping soffice unblocks it
+        timed_out = threading.Event()
+
+        def stop_on_timeout():
+            timed_out.set()
+            self.stop()
+
+        timer = threading.Timer(self.conversion_timeout, stop_on_timeout)
+        timer.start()
+        try:
+            document = self.desktop.loadComponentFromURL(
+                self.uno.systemPathToFileUrl(os.path.abspath(input_path)),
+                "_blank",
+                0,
+                (self._make_property("Hidden", True),),
+            )
+            if document is None:
+                raise Exception("LibreOffice could not open the document")
+            try:
+                filter_name = PDF_EXPORT_FILTERS.get(
+                    Path(input_path).suffix.lower(), "impress_pdf_Export"
+                )
+                document.storeToURL(
+                    self.uno.systemPathToFileUrl(os.path.abspath(output_path)),
+                    (self._make_property("FilterName", filter_name),),
+                )
+            finally:
+                document.close(True)
+        except Exception as e:
+            if timed_out.is_set():
+                raise TimeoutError(
+                    f"LibreOffice conversion timed out after {self.conversion_timeout}s"
+                )
+            raise Exception(f"LibreOffice conversion failed: {e}")
+        finally:
+            timer.cancel()
+
+    def stop(self):
+        self.desktop = None
+        process, self.process = self.process, None
+        if process and process.poll() is None:
+            process.terminate()
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+
+    def close(self):
+        self.stop()
+        shutil.rmtree(self.profile_directory, ignore_errors=True)
+
+
+class LibreOfficePool:
+    """
+    Bounded pool of long-lived LibreOffice workers. A worker is checked
+    before each job and replaced when unhealthy, and recycled after
+    max_jobs conversions or a failed one, so leaks and stuck documents
+    don't build up. Async callers wait for a slot on the event loop, not in
+    a worker thread.
+    """
+
+    def __init__(
+        self,
+        size: Optional[int] = None,
+        max_jobs: Optional[int] = None,
+        conversion_timeout: Optional[int] = None,
+        worker_factory: Optional[Callable[[], LibreOfficeWorker]] = None,
+    ):
+        self.size = size or get_positive_int(
+            get_libreoffice_workers_env(), DEFAULT_LIBREOFFICE_WORKERS
+        )
+        self.max_jobs = max_jobs or get_positive_int(
+            get_libreoffice_max_jobs_per_worker_env(),
+            DEFAULT_LIBREOFFICE_MAX_JOBS_PER_WORKER,
+        )
+        self.conversion_timeout = conversion_timeout or get_positive_int(
+            get_libreoffice_conversion_timeout_env(),
+            DEFAULT_LIBREOFFICE_CONVERSION_TIMEOUT,
+        )
+        self.worker_factory = worker_factory or self._create_worker
+        self._idle: List[LibreOfficeWorker] = []
+        self._slots = threading.BoundedSemaphore(self.size)
+        # asyncio semaphores are bound to the loop they are first used in
+        self._async_slots: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _create_worker(self) -> LibreOfficeWorker:
+        libreoffice_path = find_libreoffice_path()
+        if not libreoffice_path:
+            raise Exception(
+                "LibreOffice not found. Please ensure it is installed and in your system's PATH, "
+                "or that it's in the standard macOS Applications folder."
+            )
+        return LibreOfficeWorker(libreoffice_path, self.conversion_timeout)
+
+    def _get_async_slots(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            slots = self._async_slots.get(loop)
+            if slots is None:
+                slots = asyncio.Semaphore(self.size)
+                self._async_slots[loop] = slots
+            return slots
+
+    def _check_open(self):
+        if self._closed:
+            raise Exception("LibreOffice pool is shut down")
+
+    def _acquire(self) -> LibreOfficeWorker:
+        self._check_open()
+        self._slots.acquire()
+        try:
+            self._check_open()
+            with self._lock:
+                worker = self._idle.pop() if self._idle else None
+            if worker is not None and not worker.is_healthy():
+                print("Replacing unhealthy LibreOffice worker")
+                worker.close()
+                worker = None
+            return worker or self.worker_factory()
+        except Exception:
+            self._slots.release()
+            raise
+
+    def _release(self, worker: LibreOfficeWorker, failed: bool):
+        try:
+            with self._lock:
+                keep = (
+                    not self._closed
+                    and not failed
+                    and worker.jobs < self.max_jobs
+                    and len(self._idle) < self.size
+                )
+                if keep:
+                    self._idle.append(worker)
+            if not keep:
+                worker.close()
+        finally:
+            self._slots.release()
+
+    def convert(self, input_path: str, output_directory: str) -> str:
+        worker = self._acquire()
+        failed = True
+        try:
+            output_path = worker.convert(input_path, output_directory)
+            failed = False
+            return output_path
+        finally:
+            self._release(worker, failed)
+
+    async def convert_async(self, input_path: str, output_directory: str) -> str:
+        self._check_open()
+        async with self._get_async_slots():
+            return await asyncio.to_thread(
+                self.convert, input_path, output_directory
+            )
+
+    def warm_up(self):
+        """Starts every worker ahead of the first upload."""
+        if self._closed or not find_libreoffice_path() or not load_uno():
+            return
+        with self._lock:
+            missing = self.size - len(self._idle)
+        workers = [self.worker_factory() for _ in range(missing)]
+        with self._lock:
+            if not self._closed:
+                self._idle.extend(workers)
+                workers = []
+        for worker in workers:
+            worker.close()
+
+    def shutdown(self):
+        """
+        Closes the idle workers and refuses new jobs, busy workers are closed
+        as soon as their conversion finishes.
+        """
+        with self._lock:
+            self._closed = True
+            workers, self._idle = self._idle, []
+        for worker in workers:
+            worker.close()
+
+
+LIBREOFFICE_POOL: LibreOfficePool = LazyProxy(LibreOfficePool)
+
+
+def warm_up_libreoffice_pool():
+    """
+    Startup warm-up step, only with LIBREOFFICE_PREWARM=true. Otherwise the
+    workers start on the first conversion.
+    """
+    if not parse_bool_or_none(get_libreoffice_prewarm_env()):
+        return
+    LIBREOFFICE_POOL.get().warm_up()
@@ -15,6 +15,7 @@ from google.genai.types import (
 )
 from google.genai.types import Tool as GoogleTool
 from enums.llm_provider import LLMProvider
+from services.llm_client_registry import LLM_CLIENT_REGISTRY
 from models.llm_message import (
     GoogleAssistantMessage,
     GoogleToolCallMessage,
@@ -91,7 +92,10 @@ class LLMClient:
                 status_code=400,
                 detail="Google API Key is not set",
             )
-        return genai.Client()
+        return LLM_CLIENT_REGISTRY.get_client(
+            LLMProvider.GOOGLE,
+            lambda api_key, _: genai.Client(api_key=api_key),
+        )
 
    
     # ? Prompts
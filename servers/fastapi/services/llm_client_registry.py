@@ -0,0 +1,151 @@
+import hashlib
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from enums.llm_provider import LLMProvider
+from utils.get_env import (
+    get_anthropic_api_key_env,
+    get_custom_llm_api_key_env,
+    get_custom_llm_url_env,
+    get_google_api_key_env,
+    get_ollama_url_env,
+    get_openai_api_key_env,
+)
+
+# (provider, api key fingerprint, base url)
+LLMClientKey = Tuple[str, Optional[str], Optional[str]]
+
+
+def get_provider_credentials(
+    provider: LLMProvider,
+) -> Tuple[Optional[str], Optional[str]]:
+    """Returns (api_key, base_url) currently configured for the provider."""
+    match provider:
+        case LLMProvider.OPENAI:
+            return get_openai_api_key_env(), None
+        case LLMProvider.GOOGLE:
+            return get_google_api_key_env(), None
+        case LLMProvider.ANTHROPIC:
+            return get_anthropic_api_key_env(), None
+        case LLMProvider.OLLAMA:
+            return None, get_ollama_url_env()
+        case LLMProvider.CUSTOM:
+            return get_custom_llm_api_key_env(), get_custom_llm_url_env()
+    return None, None
+
+
+def _fingerprint(api_key: Optional[str]) -> Optional[str]:
+    if not api_key:
+        return None
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:12]
+
+
+def _count_open_connections(client: Any) -> Optional[int]:
+    # Best effort, only google-genai clients backed by httpx expose their pool
+    try:
+        pool = client._api_client._httpx_client._transport._pool
+        return len(pool.connections)
+    except Exception:
+        return None
+
+
+class _RegistryEntry:
+    def __init__(self, client: Any):
+        self.client = client
+        self.created_at = time.time()
+        self.hits = 0
+
+
+class LLMClientRegistry:
+    """
+    Process-wide pool of provider SDK clients.
+
+    SDK clients own their HTTP connection pools, so sharing them across calls
+    avoids a new TLS handshake for every LLM request. Clients are keyed by
+    provider, API key and base URL and are dropped as soon as the configured
+    credentials change.
+    """
+
+    def __init__(self):
+        self._clients: Dict[LLMClientKey, _RegistryEntry] = {}
+        self._lock = threading.Lock()
+        self._created = 0
+        self._hits = 0
+        self._invalidated = 0
+
+    def _get_key(self, provider: LLMProvider) -> LLMClientKey:
+        api_key, base_url = get_provider_credentials(provider)
+        return (provider.value, _fingerprint(api_key), base_url)
+
+    def get_client(
+        self,
+        provider: LLMProvider,
+        factory: Callable[[Optional[str], Optional[str]], Any],
+    ) -> Any:
+        """
+        Returns the shared client for the provider's current credentials.
+        factory(api_key, base_url) is called only when no client exists yet.
+        """
+        key = self._get_key(provider)
+        with self._lock:
+            entry = self._clients.get(key)
+            if entry:
+                entry.hits += 1
+                self._hits += 1
+                return entry.client
+
+            # Credentials changed, older clients of this provider are stale
+            for stale_key in [k for k in self._clients if k[0] == provider.value]:
+                del self._clients[stale_key]
+                self._invalidated += 1
+
+            api_key, base_url = get_provider_credentials(provider)
+            entry = _RegistryEntry(factory(api_key, base_url))
+            self._clients[key] = entry
+            self._created += 1
+            return entry.client
+
+    def invalidate_stale(self):
+        """Drops clients whose credentials no longer match the environment."""
+        with self._lock:
+            for key in list(self._clients.keys()):
+                if key != self._get_key(LLMProvider(key[0])):
+                    # Not closed here, in-flight requests may still be using it
+                    del self._clients[key]
+                    self._invalidated += 1
+
+    def clear(self):
+        with self._lock:
+            clients = [entry.client for entry in self._clients.values()]
+            self._clients.clear()
+
+        for client in clients:
+            close = getattr(client, "close", None)
+            if callable(close):
+                try:
+                    close()
+                except Exception:
+                    pass
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                "clients": [
+                    {
+                        "provider": key[0],
+                        "api_key_fingerprint": key[1],
+                        "base_url": key[2],
+                        "age_seconds": round(time.time() - entry.created_at, 1),
+                        "hits": entry.hits,
+                        "open_connections": _count_open_connections(entry.client),
+                    }
+                    for key, entry in self._clients.items()
+                ],
+                "created": self._created,
+                "hits": self._hits,
+                "invalidated": self._invalidated,
+            }
+
+
+LLM_CLIENT_REGISTRY = LLMClientRegistry()
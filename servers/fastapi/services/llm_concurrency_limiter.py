@@ -0,0 +1,159 @@
+import asyncio
+import random
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Optional, TypeVar
+
+from utils.get_env import get_slide_content_concurrency_env
+from utils.parsers import parse_int_or_none
+
+T = TypeVar("T")
+
+DEFAULT_SLIDE_CONTENT_CONCURRENCY = 10
+
+
+def is_rate_limit_error(e: Exception) -> bool:
+    """Detects 429 / RESOURCE_EXHAUSTED errors raised by any of the provider SDKs."""
+    if getattr(e, "code", None) == 429 or getattr(e, "status_code", None) == 429:
+        return True
+    return "RESOURCE_EXHAUSTED" in str(getattr(e, "status", "")) or (
+        "RESOURCE_EXHAUSTED" in str(e)
+    )
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Limits the number of in-flight calls with an AIMD policy.
+
+    The limit is halved when the provider answers with a rate limit error and
+    grows back by roughly one slot per window of successful calls once no rate
+    limit has been seen for cooldown seconds. Slots are released as soon as a
+    call finishes, so there is no batch barrier between calls.
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        min_limit: int = 1,
+        decrease_factor: float = 0.5,
+        decrease_interval: float = 1.0,
+        cooldown: float = 5.0,
+        max_retries: int = 3,
+        retry_backoff: float = 1.0,
+    ):
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.decrease_factor = decrease_factor
+        self.decrease_interval = decrease_interval
+        self.cooldown = cooldown
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+
+        self._limit = float(self.max_limit)
+        self._in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._last_rate_limited_at: Optional[float] = None
+
+        self._completed = 0
+        self._rate_limited = 0
+        self._peak_in_flight = 0
+
+    @property
+    def limit(self) -> int:
+        return max(self.min_limit, int(self._limit))
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _wake_waiters(self):
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._take_slot()
+            waiter.set_result(None)
+
+    def _take_slot(self):
+        self._in_flight += 1
+        self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+
+    async def acquire(self):
+        if not self._waiters and self._in_flight < self.limit:
+            self._take_slot()
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Slot was handed over right before cancellation
+                self.release()
+            raise
+
+    def release(self):
+        self._in_flight -= 1
+        self._wake_waiters()
+
+    def on_success(self):
+        self._completed += 1
+        now = time.monotonic()
+        if (
+            self._last_rate_limited_at is None
+            or now - self._last_rate_limited_at >= self.cooldown
+        ):
+            self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+            self._wake_waiters()
+
+    def on_rate_limited(self):
+        self._rate_limited += 1
+        now = time.monotonic()
+        # A burst of 429s from calls started together counts as one signal
+        if (
+            self._last_rate_limited_at is None
+            or now - self._last_rate_limited_at >= self.decrease_interval
+        ):
+            self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+        self._last_rate_limited_at = now
+
+    async def run(self, func: Callable[[], Awaitable[T]]) -> T:
+        """Runs func in a slot, retrying with backoff when it is rate limited."""
+        attempt = 0
+        while True:
+            await self.acquire()
+            try:
+                result = await func()
+            except Exception as e:
+                if not is_rate_limit_error(e) or attempt >= self.max_retries:
+                    raise
+                self.on_rate_limited()
+            else:
+                self.on_success()
+                return result
+            finally:
+                self.release()
+
+            await asyncio.sleep(
+                self.retry_backoff * (2**attempt) * (1 + random.random())
+            )
+            attempt += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "max_limit": self.max_limit,
+            "in_flight": self._in_flight,
+            "waiting": len(self._waiters),
+            "peak_in_flight": self._peak_in_flight,
+            "completed": self._completed,
+            "rate_limited": self._rate_limited,
+        }
+
+
+# Shared by every presentation generated in this process
+SLIDE_CONTENT_LIMITER = AdaptiveConcurrencyLimiter(
+    max_limit=parse_int_or_none(get_slide_content_concurrency_env())
+    or DEFAULT_SLIDE_CONTENT_CONCURRENCY
+)
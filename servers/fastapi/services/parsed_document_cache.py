@@ -0,0 +1,84 @@
+import hashlib
+import json
+from importlib import metadata
+from typing import Optional
+
+from constants.documents import DOCLING_PIPELINE_OPTIONS
+from services.size_capped_cache import DirectoryCache, SharedCaches
+from utils.asset_directory_utils import get_parsed_document_cache_directory
+from utils.file_utils import get_file_hash
+from utils.get_env import get_parsed_document_cache_max_size_mb_env
+
+DEFAULT_PARSED_DOCUMENT_CACHE_MAX_SIZE_MB = 256
+
+# Bump when the markdown produced for a document changes
+DOCUMENT_PARSER_VERSION = 1
+
+
+def get_docling_version() -> Optional[str]:
+    try:
+        return metadata.version("docling")
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def get_parsed_document_key(file_path: str) -> str:
+    """Hashes the file content together with everything that shapes its markdown."""
+    return hashlib.sha256(
+        json.dumps(
+            [
+                get_file_hash(file_path),
+                DOCUMENT_PARSER_VERSION,
+                get_docling_version(),
+                DOCLING_PIPELINE_OPTIONS,
+            ],
+            sort_keys=True,
+        ).encode("utf-8")
+    ).hexdigest()
+
+
+class ParsedDocumentCache(DirectoryCache):
+    """
+    Disk cache of the markdown parsed from uploaded documents.
+
+    Files are named by the parsed document key, so the same file uploaded
+    again, under any name, is served without parsing it.
+    """
+
+    extensions = (".md",)
+
+    def get(self, key: str) -> Optional[str]:
+        cached_path = self._get_path(key)
+        with self._lock:
+            try:
+                with open(cached_path, "r", encoding="utf-8") as f:
+                    document = f.read()
+                self._touch(cached_path)
+            except FileNotFoundError:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return document
+
+    def put(self, key: str, document: str):
+        def write(temp_path: str):
+            with open(temp_path, "w", encoding="utf-8") as f:
+                f.write(document)
+
+        self._store(self._get_path(key), write)
+
+
+_PARSED_DOCUMENT_CACHES: SharedCaches[ParsedDocumentCache] = SharedCaches(
+    ParsedDocumentCache,
+    get_parsed_document_cache_max_size_mb_env,
+    DEFAULT_PARSED_DOCUMENT_CACHE_MAX_SIZE_MB,
+    get_parsed_document_cache_directory,
+)
+
+
+def get_parsed_document_cache() -> Optional[ParsedDocumentCache]:
+    """
+    Returns the shared parsed documents cache.
+    PARSED_DOCUMENT_CACHE_MAX_SIZE_MB=0 disables it.
+    """
+    return _PARSED_DOCUMENT_CACHES.get()
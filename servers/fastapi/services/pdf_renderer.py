@@ -0,0 +1,167 @@
+import asyncio
+import os
+import threading
+from typing import AsyncIterator, List, Optional, Tuple
+
+import pypdfium2
+from PIL import Image
+
+from services.process_pool_service import PROCESS_POOL_SERVICE
+from utils.get_env import (
+    get_pdf_rendering_dpi_env,
+    get_pdf_rendering_max_size_env,
+    get_pdf_rendering_workers_env,
+)
+from utils.parsers import parse_int_or_none
+
+PDF_RENDERING_POOL = "pdf_rendering"
+
+DEFAULT_PDF_RENDERING_DPI = 150
+
+# Pages rendered by one pool task, each task opens the document once
+PDF_RENDERING_BATCH_SIZE = 4
+
+# pdfium is not thread safe, only matters when pages are rendered in threads
+_PDFIUM_LOCK = threading.Lock()
+
+
+def get_pdf_rendering_dpi() -> int:
+    dpi = parse_int_or_none(get_pdf_rendering_dpi_env())
+    return dpi if dpi and dpi > 0 else DEFAULT_PDF_RENDERING_DPI
+
+
+def get_pdf_rendering_max_size() -> Optional[int]:
+    max_size = parse_int_or_none(get_pdf_rendering_max_size_env())
+    return max_size if max_size and max_size > 0 else None
+
+
+def get_pdf_page_count(file_path: str) -> int:
+    with _PDFIUM_LOCK:
+        pdf = pypdfium2.PdfDocument(file_path)
+        try:
+            return len(pdf)
+        finally:
+            pdf.close()
+
+
+def get_page_image_path(output_directory: str, page_number: int) -> str:
+    return os.path.join(output_directory, f"page_{page_number}.png")
+
+
+def save_page_image(
+    image: Image.Image,
+    output_directory: str,
+    page_number: int,
+    dpi: int,
+    max_size: Optional[int] = None,
+) -> str:
+    # Quantized like pdfplumber's PageImage.save, much smaller and faster PNGs
+    image = image.convert("RGB")
+    if max_size:
+        image.thumbnail((max_size, max_size))
+    image = image.quantize(256, method=Image.Quantize.FASTOCTREE)
+    image_path = get_page_image_path(output_directory, page_number)
+    image.save(image_path, dpi=(dpi, dpi))
+    return image_path
+
+
+def render_pdf_pages(
+    file_path: str,
+    page_indices: List[int],
+    output_directory: str,
+    dpi: int,
+    max_size: Optional[int] = None,
+) -> List[Tuple[int, str]]:
+    """
+    Renders the pages to page_<number>.png in output_directory, scaled to dpi
+    and then shrunk to fit max_size pixels when given. Runs in the PDF
+    rendering pool, returns the page numbers with their image paths.
+    """
+    rendered = []
+    with _PDFIUM_LOCK:
+        pdf = pypdfium2.PdfDocument(file_path)
+    try:
+        for page_index in page_indices:
+            with _PDFIUM_LOCK:
+                page = pdf[page_index]
+                try:
+                    # Same output as pdfplumber's page.to_image
+                    image = page.render(
+                        scale=dpi / 72,
+                        no_smoothtext=True,
+                        no_smoothpath=True,
+                        no_smoothimage=True,
+                        prefer_bgrx=True,
+                    ).to_pil()
+                finally:
+                    page.close()
+
+            # Encoded outside of the lock
+            image_path = save_page_image(
+                image, output_directory, page_index + 1, dpi, max_size
+            )
+            rendered.append((page_index + 1, image_path))
+    finally:
+        with _PDFIUM_LOCK:
+            pdf.close()
+    return rendered
+
+
+async def iter_pdf_page_images(
+    file_path: str,
+    output_directory: str,
+    dpi: Optional[int] = None,
+    max_size: Optional[int] = None,
+) -> AsyncIterator[Tuple[int, str]]:
+    """
+    Renders the pages of the PDF in parallel in the PDF rendering pool and
+    yields (page number, image path) as soon as each batch of pages is done,
+    not necessarily in page order.
+    """
+    dpi = dpi or get_pdf_rendering_dpi()
+    max_size = max_size or get_pdf_rendering_max_size()
+    workers = parse_int_or_none(get_pdf_rendering_workers_env())
+
+    page_count = await asyncio.to_thread(get_pdf_page_count, file_path)
+    batches = [
+        list(range(start, min(start + PDF_RENDERING_BATCH_SIZE, page_count)))
+        for start in range(0, page_count, PDF_RENDERING_BATCH_SIZE)
+    ]
+    tasks = [
+        asyncio.create_task(
+            PROCESS_POOL_SERVICE.run(
+                PDF_RENDERING_POOL,
+                workers,
+                render_pdf_pages,
+                file_path,
+                batch,
+                output_directory,
+                dpi,
+                max_size,
+            )
+        )
+        for batch in batches
+    ]
+    try:
+        for next_batch in asyncio.as_completed(tasks):
+            for page_number, image_path in await next_batch:
+                yield page_number, image_path
+    finally:
+        # The caller stopped early or a batch failed
+        for task in tasks:
+            task.cancel()
+
+
+async def render_pdf_page_images(
+    file_path: str,
+    output_directory: str,
+    dpi: Optional[int] = None,
+    max_size: Optional[int] = None,
+) -> List[str]:
+    """Renders every page of the PDF, returns the image paths in page order."""
+    image_paths = {}
+    async for page_number, image_path in iter_pdf_page_images(
+        file_path, output_directory, dpi, max_size
+    ):
+        image_paths[page_number] = image_path
+    return [image_paths[page_number] for page_number in sorted(image_paths)]
@@ -0,0 +1,71 @@
+import hashlib
+import os
+import uuid
+from typing import Optional
+
+from services.size_capped_cache import DirectoryCache, SharedCaches
+from utils.asset_directory_utils import get_picture_cache_directory
+from utils.file_utils import link_or_copy_file
+from utils.get_env import get_picture_transform_cache_max_size_mb_env
+
+DEFAULT_PICTURE_TRANSFORM_CACHE_MAX_SIZE_MB = 256
+
+PICTURE_EXTENSIONS = (".png", ".jpg")
+
+
+class PictureTransformCache(DirectoryCache):
+    """
+    Disk cache of transformed pictures shared across exports.
+
+    Files are named by the hash of the picture transform key, which already
+    includes the source file hash.
+    """
+
+    extensions = PICTURE_EXTENSIONS
+
+    def _get_picture_path(self, transform_key: str, extension: str) -> str:
+        return self._get_path(
+            hashlib.sha256(transform_key.encode("utf-8")).hexdigest(), extension
+        )
+
+    def get(self, transform_key: str, output_directory: str) -> Optional[str]:
+        """Returns a new path in output_directory holding the cached picture."""
+        with self._lock:
+            for extension in PICTURE_EXTENSIONS:
+                cached_path = self._get_picture_path(transform_key, extension)
+                image_path = os.path.join(
+                    output_directory, f"{uuid.uuid4()}{extension}"
+                )
+                try:
+                    link_or_copy_file(cached_path, image_path)
+                    self._touch(cached_path)
+                except FileNotFoundError:
+                    continue
+                self.hits += 1
+                return image_path
+            self.misses += 1
+            return None
+
+    def put(self, transform_key: str, image_path: str):
+        cached_path = self._get_picture_path(
+            transform_key, os.path.splitext(image_path)[1].lower()
+        )
+        self._store(
+            cached_path, lambda temp_path: link_or_copy_file(image_path, temp_path)
+        )
+
+
+_PICTURE_TRANSFORM_CACHES: SharedCaches[PictureTransformCache] = SharedCaches(
+    PictureTransformCache,
+    get_picture_transform_cache_max_size_mb_env,
+    DEFAULT_PICTURE_TRANSFORM_CACHE_MAX_SIZE_MB,
+    get_picture_cache_directory,
+)
+
+
+def get_picture_transform_cache() -> Optional[PictureTransformCache]:
+    """
+    Returns the shared transformed pictures cache.
+    PICTURE_TRANSFORM_CACHE_MAX_SIZE_MB=0 disables it.
+    """
+    return _PICTURE_TRANSFORM_CACHES.get()
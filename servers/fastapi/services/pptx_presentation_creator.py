@@ -1,5 +1,9 @@
+import asyncio
+import io
+import json
+import math
 import os
-from typing import List, Optional
+from typing import Dict, List, Optional
 from lxml import etree
 from services.html_to_text_runs_service import (
     parse_html_text_to_text_runs as parse_inline_html_to_runs,
@@ -34,27 +38,208 @@ from models.pptx_models import (
     PptxTextBoxModel,
     PptxTextRunModel,
 )
+from services.asset_download_cache import get_asset_download_cache
+from services.picture_transform_cache import get_picture_transform_cache
+from services.process_pool_service import PROCESS_POOL_SERVICE
 from utils.download_helpers import download_files
-from utils.image_utils import (
-    clip_image,
-    create_circle_image,
-    fit_image,
-    invert_image,
-    round_image_corners,
-    set_image_opacity,
+from utils.file_utils import get_file_hash, link_or_copy_file
+from utils.get_env import (
+    get_pptx_export_image_dpi_env,
+    get_pptx_export_workers_env,
 )
+from utils.image_utils import downscale_image, get_picture_format, transform_image
+from utils.parsers import parse_int_or_none
 import uuid
 
 BLANK_SLIDE_LAYOUT = 6
 
+PPTX_EXPORT_POOL = "pptx_export"
+
+# Bump when transform_picture output changes to invalidate cached pictures
+PICTURE_TRANSFORM_VERSION = 1
+
+PICTURE_JPEG_QUALITY = 85
+PICTURE_FORMAT_EXTENSIONS = {"PNG": ".png", "JPEG": ".jpg"}
+
+
+def has_picture_transforms(picture_model: PptxPictureBoxModel) -> bool:
+    return bool(
+        picture_model.clip
+        or picture_model.border_radius
+        or picture_model.invert
+        or picture_model.opacity
+        or picture_model.object_fit
+        or picture_model.shape
+    )
+
+
+def get_picture_key(
+    picture_model: PptxPictureBoxModel, image_dpi: Optional[int] = None
+) -> Optional[str]:
+    """
+    Returns a key identifying the transformed picture within one export by
+    source path, transform parameters, target size and resolution, None if
+    the picture is embedded as is.
+    """
+    if not (has_picture_transforms(picture_model) or image_dpi):
+        return None
+
+    return json.dumps(
+        [
+            picture_model.picture.path,
+            picture_model.model_dump(
+                mode="json",
+                include={
+                    "position": {"width", "height"},
+                    "clip": True,
+                    "opacity": True,
+                    "invert": True,
+                    "border_radius": True,
+                    "shape": True,
+                    "object_fit": True,
+                },
+            ),
+            image_dpi,
+        ],
+        sort_keys=True,
+    )
+
+
+def get_picture_transform_key(picture_key: str) -> str:
+    """
+    Returns the key of the transformed picture across exports, by source file
+    content instead of path.
+    """
+    path, parameters, image_dpi = json.loads(picture_key)
+    try:
+        source = get_file_hash(path)
+    except OSError:
+        source = path
+
+    return json.dumps(
+        [PICTURE_TRANSFORM_VERSION, source, parameters, image_dpi], sort_keys=True
+    )
+
+
+def transform_picture(
+    picture_model: PptxPictureBoxModel,
+    output_directory: str,
+    image_dpi: Optional[int] = None,
+) -> Optional[str]:
+    """
+    Applies clip/fit, border radius, shape, invert and opacity of the picture
+    and saves the result as PNG. With image_dpi, the picture is rendered or
+    resampled down to its box size at that resolution instead, and saved as
+    JPEG or PNG depending on its content. Returns the path of the new file in
+    output_directory. Runs in export worker processes.
+    """
+    image_path = picture_model.picture.path
+    try:
+        image = Image.open(image_path)
+    except Exception:
+        print(f"Could not open image: {image_path}")
+        return None
+
+    source_format = image.format
+    width = picture_model.position.width
+    height = picture_model.position.height
+    # Transforms render one pixel per point (72 dpi) unless a resolution is
+    # requested, positions are in points
+    scale = 1
+    if image_dpi:
+        scale = image_dpi / 72
+        if width and height:
+            # Never enlarge the source past its own resolution
+            scale = min(scale, max(1, min(image.width / width, image.height / height)))
+
+    is_transformed = has_picture_transforms(picture_model)
+    if is_transformed:
+        image = transform_image(
+            image,
+            max(1, round(width * scale)),
+            max(1, round(height * scale)),
+            clip=picture_model.clip,
+            object_fit=picture_model.object_fit,
+            border_radius=(
+                [round(radius * scale) for radius in picture_model.border_radius]
+                if picture_model.border_radius
+                else picture_model.border_radius
+            ),
+            circle=picture_model.shape == PptxBoxShapeEnum.CIRCLE,
+            invert=picture_model.invert,
+            opacity=picture_model.opacity,
+        )
+
+    if not image_dpi:
+        output_path = os.path.join(output_directory, f"{uuid.uuid4()}.png")
+        image.save(output_path)
+        return output_path
+
+    resampled_image = downscale_image(
+        image, math.ceil(width * image_dpi / 72), math.ceil(height * image_dpi / 72)
+    )
+    picture_format = get_picture_format(resampled_image)
+    output_path = os.path.join(
+        output_directory,
+        f"{uuid.uuid4()}{PICTURE_FORMAT_EXTENSIONS[picture_format]}",
+    )
+
+    if (
+        not is_transformed
+        and resampled_image is image
+        and source_format == picture_format
+    ):
+        # Already small enough and in the right format, re-encoding would only
+        # lose quality
+        link_or_copy_file(image_path, output_path)
+    elif picture_format == "JPEG":
+        resampled_image.convert("RGB").save(
+            output_path, "JPEG", quality=PICTURE_JPEG_QUALITY, optimize=True
+        )
+    else:
+        resampled_image.save(output_path, "PNG")
+    return output_path
+
+
+def build_pptx(
+    ppt_model: PptxPresentationModel,
+    temp_dir: str,
+    transformed_pictures: Dict[str, str],
+    image_dpi: Optional[int] = None,
+) -> bytes:
+    """
+    Assembles the presentation and returns the saved PPTX.
+    Runs in export worker processes.
+    """
+    pptx_creator = PptxPresentationCreator(
+        ppt_model, temp_dir, transformed_pictures, image_dpi
+    )
+    pptx_creator.add_slides()
+    return pptx_creator.to_bytes()
+
 
 class PptxPresentationCreator:
-    def __init__(self, ppt_model: PptxPresentationModel, temp_dir: str):
+    def __init__(
+        self,
+        ppt_model: PptxPresentationModel,
+        temp_dir: str,
+        transformed_pictures: Optional[Dict[str, str]] = None,
+        image_dpi: Optional[int] = None,
+    ):
         self._temp_dir = temp_dir
 
         self._ppt_model = ppt_model
         self._slide_models = ppt_model.slides
 
+        # Picture key -> path of the rendered picture
+        self._transformed_pictures = transformed_pictures or {}
+        # Resolution pictures are resampled to, None embeds them at full size
+        if image_dpi is None:
+            image_dpi = parse_int_or_none(get_pptx_export_image_dpi_env())
+        self._image_dpi = image_dpi if image_dpi and image_dpi > 0 else None
+        self._pptx_bytes: Optional[bytes] = None
+        self._export_workers = parse_int_or_none(get_pptx_export_workers_env())
+
         self._ppt = Presentation()
         self._ppt.slide_width = Pt(1280)
         self._ppt.slide_height = Pt(720)
@@ -105,7 +290,9 @@ class PptxPresentationCreator:
         if image_urls:
             print(f"Found {len(image_urls)} network images to download.")
             print("URLs:", image_urls)
-            image_paths = await download_files(image_urls, self._temp_dir)
+            image_paths = await download_files(
+                image_urls, self._temp_dir, cache=get_asset_download_cache()
+            )
             print(f"Downloaded image paths: {image_paths}")
 
             for each_shape, each_image_path in zip(
@@ -121,8 +308,94 @@ class PptxPresentationCreator:
         print("--- Finished Network Asset Fetch ---")
 
     async def create_ppt(self):
+        """
+        Downloads network assets, renders transformed pictures in parallel and
+        assembles the presentation in the export process pool, so none of the
+        CPU heavy work runs on the event loop.
+        """
         await self.fetch_network_assets()
+        await self.transform_pictures()
+
+        self._pptx_bytes = await PROCESS_POOL_SERVICE.run(
+            PPTX_EXPORT_POOL,
+            self._export_workers,
+            build_pptx,
+            self._ppt_model,
+            self._temp_dir,
+            self._transformed_pictures,
+            self._image_dpi,
+        )
 
+    async def transform_pictures(self):
+        """
+        Renders every distinct transformed picture once, in parallel, reusing
+        pictures rendered by previous exports when they are cached on disk.
+        """
+        pictures: Dict[str, PptxPictureBoxModel] = {}
+        shapes = list(self._ppt_model.shapes or [])
+        for slide_model in self._slide_models:
+            shapes.extend(slide_model.shapes)
+
+        for shape in shapes:
+            if isinstance(shape, PptxPictureBoxModel):
+                picture_key = get_picture_key(shape, self._image_dpi)
+                if picture_key and picture_key not in self._transformed_pictures:
+                    pictures.setdefault(picture_key, shape)
+
+        # Hashes the source files, once per distinct picture. Pictures with the
+        # same content under different paths are rendered once
+        transform_keys = await asyncio.to_thread(
+            lambda: {
+                picture_key: get_picture_transform_key(picture_key)
+                for picture_key in pictures
+            }
+        )
+        picture_keys_by_transform: Dict[str, List[str]] = {}
+        for picture_key, transform_key in transform_keys.items():
+            picture_keys_by_transform.setdefault(transform_key, []).append(
+                picture_key
+            )
+
+        image_paths: Dict[str, Optional[str]] = {}
+        cache = get_picture_transform_cache()
+        if cache:
+            for transform_key in picture_keys_by_transform:
+                image_path = await asyncio.to_thread(
+                    cache.get, transform_key, self._temp_dir
+                )
+                if image_path:
+                    image_paths[transform_key] = image_path
+
+        missing_transform_keys = [
+            transform_key
+            for transform_key in picture_keys_by_transform
+            if transform_key not in image_paths
+        ]
+        rendered_paths = await asyncio.gather(
+            *[
+                PROCESS_POOL_SERVICE.run(
+                    PPTX_EXPORT_POOL,
+                    self._export_workers,
+                    transform_picture,
+                    pictures[picture_keys_by_transform[transform_key][0]],
+                    self._temp_dir,
+                    self._image_dpi,
+                )
+                for transform_key in missing_transform_keys
+            ]
+        )
+        for transform_key, image_path in zip(missing_transform_keys, rendered_paths):
+            image_paths[transform_key] = image_path
+            if image_path and cache:
+                await asyncio.to_thread(cache.put, transform_key, image_path)
+
+        # The export workers look pictures up by key, without hashing again
+        for transform_key, image_path in image_paths.items():
+            if image_path:
+                for picture_key in picture_keys_by_transform[transform_key]:
+                    self._transformed_pictures[picture_key] = image_path
+
+    def add_slides(self):
         for slide_model in self._slide_models:
             # Adding global shapes to slide
             if self._ppt_model.shapes:
@@ -186,47 +459,16 @@ class PptxPresentationCreator:
 
     def add_picture(self, slide: Slide, picture_model: PptxPictureBoxModel):
         image_path = picture_model.picture.path
-        if (
-            picture_model.clip
-            or picture_model.border_radius
-            or picture_model.invert
-            or picture_model.opacity
-            or picture_model.object_fit
-            or picture_model.shape
-        ):
-            try:
-                image = Image.open(image_path)
-            except Exception:
-                print(f"Could not open image: {image_path}")
-                return
-
-            image = image.convert("RGBA")
-            # ? Applying border radius twice to support both clip and object fit
-            if picture_model.border_radius:
-                image = round_image_corners(image, picture_model.border_radius)
-            if picture_model.object_fit:
-                image = fit_image(
-                    image,
-                    picture_model.position.width,
-                    picture_model.position.height,
-                    picture_model.object_fit,
-                )
-            elif picture_model.clip:
-                image = clip_image(
-                    image,
-                    picture_model.position.width,
-                    picture_model.position.height,
+        picture_key = get_picture_key(picture_model, self._image_dpi)
+        if picture_key:
+            image_path = self._transformed_pictures.get(picture_key)
+            if not image_path:
+                image_path = transform_picture(
+                    picture_model, self._temp_dir, self._image_dpi
                 )
-            if picture_model.border_radius:
-                image = round_image_corners(image, picture_model.border_radius)
-            if picture_model.shape == PptxBoxShapeEnum.CIRCLE:
-                image = create_circle_image(image)
-            if picture_model.invert:
-                image = invert_image(image)
-            if picture_model.opacity:
-                image = set_image_opacity(image, picture_model.opacity)
-            image_path = os.path.join(self._temp_dir, f"{uuid.uuid4()}.png")
-            image.save(image_path)
+                if not image_path:
+                    return
+                self._transformed_pictures[picture_key] = image_path
 
         margined_position = self.get_margined_position(
             picture_model.position, picture_model.margin
@@ -492,5 +734,14 @@ class PptxPresentationCreator:
         except Exception as e:
             print(f"Could not apply strikethrough: {e}")
 
+    def to_bytes(self) -> bytes:
+        buffer = io.BytesIO()
+        self._ppt.save(buffer)
+        return buffer.getvalue()
+
     def save(self, path: str):
-        self._ppt.save(path)
+        if self._pptx_bytes is not None:
+            with open(path, "wb") as f:
+                f.write(self._pptx_bytes)
+        else:
+            self._ppt.save(path)
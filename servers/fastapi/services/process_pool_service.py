@@ -0,0 +1,66 @@
+import asyncio
+import functools
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+def get_default_max_workers() -> int:
+    return max(1, min(4, (os.cpu_count() or 1) - 1))
+
+
+class ProcessPoolService:
+    """
+    Named, bounded process pools for CPU heavy work that would otherwise block
+    the event loop. Pools are created on first use with the spawn start method,
+    so workers never inherit threads or sockets from the server process.
+    A pool with max_workers=0 runs the work in a thread instead.
+    """
+
+    def __init__(self):
+        self._pools: Dict[str, ProcessPoolExecutor] = {}
+        self._lock = threading.Lock()
+
+    def get_pool(self, name: str, max_workers: int) -> ProcessPoolExecutor:
+        with self._lock:
+            pool = self._pools.get(name)
+            if not pool:
+                pool = ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+                self._pools[name] = pool
+            return pool
+
+    async def run(
+        self,
+        name: str,
+        max_workers: Optional[int],
+        func: Callable[..., T],
+        *args,
+        **kwargs,
+    ) -> T:
+        """Runs func(*args, **kwargs) in the named pool, func must be picklable."""
+        if max_workers is None:
+            max_workers = get_default_max_workers()
+        if max_workers <= 0:
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+        return await asyncio.get_running_loop().run_in_executor(
+            self.get_pool(name, max_workers),
+            functools.partial(func, *args, **kwargs),
+        )
+
+    def shutdown(self):
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+PROCESS_POOL_SERVICE = ProcessPoolService()
@@ -1,21 +1,18 @@
 import asyncio
-from typing import List
+import re
+from collections import deque
+from typing import Dict, List, Optional, Tuple
 
 from models.document_chunk import DocumentChunk
 
+# A line starting with "#" after optional whitespace, never spanning lines
+HEADING_LINE_PATTERN = re.compile(r"^[^\S\n]*#[^\n]*", re.MULTILINE)
+
 
 class ScoreBasedChunker:
 
     def extract_headings(self, text: str) -> List[str]:
-        lines = text.split("\n")
-        headings = []
-        
-        for line in lines:
-            line = line.strip()
-            if line.startswith("#"):
-                headings.append(line)
-        
-        return headings
+        return [heading for heading, _, _ in self.get_heading_offsets(text)]
 
     def score_headings(self, headings: List[str]) -> List[float]:
         heading_scores = []
@@ -46,17 +43,10 @@ class ScoreBasedChunker:
 
         return heading_scores
 
-    def get_chunks_from_headings(
-        self,
-        text: str,
-        headings: List[str],
-        heading_scores: List[float],
-        top_k: int = 10,
-    ) -> List[DocumentChunk]:
-        if not heading_scores:
-            heading_scores = self.score_headings(headings)
-
-        chunks = []
+    def select_heading_indices(
+        self, heading_scores: List[float], top_k: int = 10
+    ) -> List[int]:
+        """Returns the indices of the top_k headings to chunk at, in order."""
         heading_indices = []
 
         for i, score in enumerate(heading_scores):
@@ -64,7 +54,7 @@ class ScoreBasedChunker:
                 heading_indices.append((i, score))
 
         if len(heading_indices) == 0:
-            return chunks
+            return []
 
         heading_indices.sort(key=lambda x: (-x[1], x[0]))
 
@@ -111,53 +101,81 @@ class ScoreBasedChunker:
 
             selected_indices.sort()
 
-        lines = text.split("\n")
+        return selected_indices
+
+    def get_heading_offsets(self, text: str) -> List[Tuple[str, int, int]]:
+        """
+        Scans the text once, returning every heading with the offset of its
+        line and the offset right after it, where its content starts.
+        """
+        return [
+            (match.group().strip(), match.start(), match.end() + 1)
+            for match in HEADING_LINE_PATTERN.finditer(text)
+        ]
+
+    def get_chunks_from_headings(
+        self,
+        text: str,
+        headings: List[str],
+        heading_scores: List[float],
+        top_k: int = 10,
+        heading_offsets: Optional[List[Tuple[str, int, int]]] = None,
+    ) -> List[DocumentChunk]:
+        if not heading_scores:
+            heading_scores = self.score_headings(headings)
+
+        selected_indices = self.select_heading_indices(heading_scores, top_k)
+        if not selected_indices:
+            return []
+
+        if heading_offsets is None:
+            heading_offsets = self.get_heading_offsets(text)
+
+        # The n-th line with a heading's text belongs to the n-th heading with it
+        offsets_by_heading: Dict[str, deque] = {}
+        for heading, line_start, content_start in heading_offsets:
+            offsets_by_heading.setdefault(heading, deque()).append(
+                (line_start, content_start)
+            )
         heading_positions = {}
-        
-        for i, line in enumerate(lines):
-            line_stripped = line.strip()
-            if line_stripped.startswith("#"):
-                for heading_idx, heading in enumerate(headings):
-                    if heading == line_stripped and heading_idx not in heading_positions:
-                        heading_positions[heading_idx] = i
-                        break
-        
+        for heading_idx, heading in enumerate(headings):
+            offsets = offsets_by_heading.get(heading)
+            if offsets:
+                heading_positions[heading_idx] = offsets.popleft()
+
+        chunks = []
         for i, heading_idx in enumerate(selected_indices):
             if heading_idx not in heading_positions:
                 continue
-                
-            heading = headings[heading_idx]
-            heading_line_idx = heading_positions[heading_idx]
-            
+
+            content_start = heading_positions[heading_idx][1]
+            content_end = len(text)
             if i + 1 < len(selected_indices):
                 next_heading_idx = selected_indices[i + 1]
                 if next_heading_idx in heading_positions:
-                    next_heading_line_idx = heading_positions[next_heading_idx]
-                    content_end = next_heading_line_idx
-                else:
-                    content_end = len(lines)
-            else:
-                content_end = len(lines)
-
-            content_lines = lines[heading_line_idx + 1 : content_end]
-            content = "\n".join(content_lines).strip()
-
-            chunk = DocumentChunk(
-                heading=heading,
-                content=content,
-                heading_index=heading_idx,
-                score=heading_scores[heading_idx],
+                    content_end = heading_positions[next_heading_idx][0]
+
+            chunks.append(
+                DocumentChunk(
+                    heading=headings[heading_idx],
+                    content=text[content_start:content_end].strip(),
+                    heading_index=heading_idx,
+                    score=heading_scores[heading_idx],
+                )
             )
-            chunks.append(chunk)
-            
+
         return chunks
 
-    async def get_n_chunks(self, text: str, n: int) -> List[DocumentChunk]:
-        headings = await asyncio.to_thread(self.extract_headings, text)
-        heading_scores = await asyncio.to_thread(self.score_headings, headings)
-        chunks = await asyncio.to_thread(
-            self.get_chunks_from_headings, text, headings, heading_scores, n
+    def get_n_chunks_sync(self, text: str, n: int) -> List[DocumentChunk]:
+        heading_offsets = self.get_heading_offsets(text)
+        headings = [heading for heading, _, _ in heading_offsets]
+        heading_scores = self.score_headings(headings)
+        return self.get_chunks_from_headings(
+            text, headings, heading_scores, n, heading_offsets
         )
+
+    async def get_n_chunks(self, text: str, n: int) -> List[DocumentChunk]:
+        chunks = await asyncio.to_thread(self.get_n_chunks_sync, text, n)
         if len(chunks) < n:
             raise ValueError(f"Only {len(chunks)} chunks found, requested {n}")
         return chunks
@@ -0,0 +1,122 @@
+import os
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Generic, Optional, Tuple, TypeVar
+
+from utils.parsers import parse_int_or_none
+
+T = TypeVar("T", bound="SizeCappedCache")
+
+
+class SizeCappedCache(ABC):
+    """
+    Base of the disk caches kept under max_size_bytes. Subclasses store their
+    files in directory and evict the least recently used ones in _evict.
+    """
+
+    def __init__(self, directory: str, max_size_bytes: int):
+        self.directory = directory
+        os.makedirs(self.directory, exist_ok=True)
+        self.max_size_bytes = max_size_bytes
+
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @abstractmethod
+    def _evict(self):
+        """Removes the least recently used entries until under max_size_bytes."""
+
+    def get_stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "max_size_bytes": self.max_size_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+            "evictions": self.evictions,
+        }
+
+
+class DirectoryCache(SizeCappedCache):
+    """
+    Cache with no index, files are named by their key. The file mtime is
+    bumped on every hit and the oldest files are evicted once the cache grows
+    over max_size_bytes.
+    """
+
+    # Extensions of the cached files, anything else in directory is ignored
+    extensions: Tuple[str, ...] = ()
+
+    def _get_path(self, name: str, extension: Optional[str] = None) -> str:
+        return os.path.join(
+            self.directory, f"{name}{extension or self.extensions[0]}"
+        )
+
+    def _touch(self, cached_path: str):
+        os.utime(cached_path)
+
+    def _store(self, cached_path: str, write: Callable[[str], None]):
+        """Writes the file with write(temp_path) and moves it in place atomically."""
+        temp_path = f"{cached_path}.{uuid.uuid4()}.tmp"
+        with self._lock:
+            write(temp_path)
+            os.replace(temp_path, cached_path)
+            self._evict()
+
+    def _evict(self):
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith(self.extensions):
+                stat = entry.stat()
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+
+        size = sum(file_size for _, file_size, _ in files)
+        for _, file_size, path in sorted(files):
+            if size <= self.max_size_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            size -= file_size
+            self.evictions += 1
+
+
+class SharedCaches(Generic[T]):
+    """
+    One shared cache per directory, sized by an env value in MB. The env
+    value is read on every get, 0 disables the cache.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[str, int], T],
+        get_max_size_mb_env: Callable[[], Optional[str]],
+        default_max_size_mb: int,
+        get_directory: Optional[Callable[[], str]] = None,
+    ):
+        self.factory = factory
+        self.get_max_size_mb_env = get_max_size_mb_env
+        self.default_max_size_mb = default_max_size_mb
+        self.get_directory = get_directory
+        self._caches: Dict[str, T] = {}
+        self._lock = threading.Lock()
+
+    def get(self, directory: Optional[str] = None) -> Optional[T]:
+        max_size_mb = parse_int_or_none(self.get_max_size_mb_env())
+        if max_size_mb is None:
+            max_size_mb = self.default_max_size_mb
+        if max_size_mb <= 0:
+            return None
+
+        directory = os.path.abspath(directory or self.get_directory())
+        with self._lock:
+            cache = self._caches.get(directory)
+            if not cache:
+                cache = self.factory(directory, max_size_mb * 1024 * 1024)
+                self._caches[directory] = cache
+            cache.max_size_bytes = max_size_mb * 1024 * 1024
+            return cache
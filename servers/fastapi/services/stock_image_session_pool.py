@@ -0,0 +1,158 @@
+import asyncio
+import ssl
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, Tuple
+
+import aiohttp
+import certifi
+
+from enums.image_provider import ImageProvider
+
+# Results fetched per search, the extra ones are served as alternates
+STOCK_IMAGE_RESULTS_PER_QUERY = 10
+
+DEFAULT_STOCK_IMAGE_SEARCH_TTL = 60 * 60
+DEFAULT_STOCK_IMAGE_SEARCH_MAX_ENTRIES = 2048
+
+
+class StockImageSessionPool:
+    """
+    Long-lived aiohttp sessions, one per stock image provider.
+
+    Sessions are created in the app lifespan and keep their connections alive
+    across lookups. If a session is requested from another event loop (tests,
+    background scripts) a new one is created for that loop and the old one
+    is closed.
+    """
+
+    def __init__(self):
+        self._sessions: Dict[ImageProvider, aiohttp.ClientSession] = {}
+        self._closing: Set[asyncio.Future] = set()
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        ssl_context = ssl.create_default_context(cafile=certifi.where())
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(ssl=ssl_context, keepalive_timeout=60),
+            timeout=aiohttp.ClientTimeout(total=30),
+            trust_env=True,
+        )
+
+    def _close_stale_session(self, session: aiohttp.ClientSession):
+        if session._loop.is_running():
+            # Still serving another thread, close it there
+            closing = asyncio.run_coroutine_threadsafe(session.close(), session._loop)
+            closing = asyncio.wrap_future(closing)
+        else:
+            closing = asyncio.ensure_future(session.close())
+        self._closing.add(closing)
+        closing.add_done_callback(self._closing.discard)
+
+    def get_session(self, provider: ImageProvider) -> aiohttp.ClientSession:
+        session = self._sessions.get(provider)
+        if (
+            session is None
+            or session.closed
+            or session._loop is not asyncio.get_running_loop()
+        ):
+            if session is not None and not session.closed:
+                self._close_stale_session(session)
+            session = self._create_session()
+            self._sessions[provider] = session
+        return session
+
+    async def start(self):
+        for provider in (ImageProvider.PEXELS, ImageProvider.PIXABAY):
+            self.get_session(provider)
+
+    async def close(self):
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        for session in sessions:
+            if not session.closed:
+                await session.close()
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *[closing for closing in self._closing if closing.get_loop() is loop],
+            return_exceptions=True,
+        )
+
+
+class StockImageSearchResult:
+    def __init__(self, urls: List[str], expires_at: float):
+        self.urls = urls
+        self.expires_at = expires_at
+        self._next_index = 0
+
+    def next_url(self) -> str:
+        """Returns the urls in turn, so repeated queries get alternate images."""
+        if not self.urls:
+            return ""
+        url = self.urls[self._next_index % len(self.urls)]
+        self._next_index += 1
+        return url
+
+
+class StockImageSearchCache:
+    """
+    TTL cache of stock image search results keyed by provider and query.
+    Empty results are cached as well so misses do not spend API quota.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_STOCK_IMAGE_SEARCH_TTL,
+        max_entries: int = DEFAULT_STOCK_IMAGE_SEARCH_MAX_ENTRIES,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Tuple[str, str], StockImageSearchResult] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _get_key(self, provider: ImageProvider, query: str) -> Tuple[str, str]:
+        return (provider.value, " ".join(query.lower().split()))
+
+    def get(
+        self, provider: ImageProvider, query: str
+    ) -> Optional[StockImageSearchResult]:
+        key = self._get_key(provider, query)
+        with self._lock:
+            result = self._entries.get(key)
+            if result and result.expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+            if result:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def set(
+        self, provider: ImageProvider, query: str, urls: List[str]
+    ) -> StockImageSearchResult:
+        result = StockImageSearchResult(urls, time.monotonic() + self.ttl)
+        with self._lock:
+            self._entries[self._get_key(provider, query)] = result
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return result
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+STOCK_IMAGE_SESSION_POOL = StockImageSessionPool()
+STOCK_IMAGE_SEARCH_CACHE = StockImageSearchCache()
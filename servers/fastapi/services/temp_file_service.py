@@ -2,6 +2,7 @@ import os
 from typing import Optional, Union
 
 from utils.get_env import get_temp_directory_env
+from utils.lazy_proxy import LazyProxy
 import uuid
 
 
@@ -67,4 +68,5 @@ class TempFileService:
         self.cleanup_temp_dir(self.base_dir)
 
 
-TEMP_FILE_SERVICE = TempFileService()
+# Wipes the temp directory on first use instead of on import
+TEMP_FILE_SERVICE: TempFileService = LazyProxy(TempFileService)
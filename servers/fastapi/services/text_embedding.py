@@ -0,0 +1,17 @@
+from services.icon_index import ICON_INDEX_DIRECTORY
+from utils.lazy_proxy import LazyProxy
+
+
+def load_text_embedding_function():
+    """Loads the MiniLM ONNX sentence embedding model, downloading it once."""
+    # Imported here as chromadb alone takes about a second to import
+    from chromadb.utils.embedding_functions import ONNXMiniLM_L6_V2
+
+    embedding_function = ONNXMiniLM_L6_V2()
+    embedding_function.DOWNLOAD_PATH = f"{ICON_INDEX_DIRECTORY}/models"
+    embedding_function._download_model_if_not_exists()
+    return embedding_function
+
+
+# Shared by the icons search and the source documents retrieval
+TEXT_EMBEDDING_FUNCTION = LazyProxy(load_text_embedding_function)
@@ -0,0 +1,86 @@
+import asyncio
+import importlib
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from services.document_parsing import warm_up_document_parsing
+from services.icon_finder_service import ICON_FINDER_SERVICE
+from services.libreoffice_pool import warm_up_libreoffice_pool
+from services.temp_file_service import TEMP_FILE_SERVICE
+
+
+def import_modules(*module_names: str) -> Callable[[], None]:
+    def warmup():
+        for module_name in module_names:
+            importlib.import_module(module_name)
+
+    return warmup
+
+
+# Run in order, each in a worker thread
+WARMUP_STEPS: List[Tuple[str, Callable[[], object]]] = [
+    ("temp_files", TEMP_FILE_SERVICE.get),
+    ("document_parsing", warm_up_document_parsing),
+    ("libreoffice", warm_up_libreoffice_pool),
+    ("llm_sdks", import_modules("google.generativeai", "anthropic")),
+    ("icon_finder", ICON_FINDER_SERVICE.get),
+]
+
+
+class WarmupService:
+    """
+    Preloads the lazily initialized services and imports in the background
+    after startup, so the first requests don't pay for them. Steps that fail
+    are reported and retried lazily on first use.
+    """
+
+    def __init__(self, steps: List[Tuple[str, Callable[[], object]]] = WARMUP_STEPS):
+        self.steps = steps
+        self.status: Dict[str, str] = {name: "pending" for name, _ in steps}
+        self.durations: Dict[str, float] = {}
+        self.errors: Dict[str, str] = {}
+        self.started = False
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        self.started = True
+        self._task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        for name, warmup in self.steps:
+            self.status[name] = "running"
+            started = time.perf_counter()
+            try:
+                await asyncio.to_thread(warmup)
+                self.status[name] = "done"
+            except Exception as e:
+                print(f"Warm-up of {name} failed: {e}")
+                self.status[name] = "failed"
+                self.errors[name] = str(e)
+            self.durations[name] = round(time.perf_counter() - started, 3)
+
+    async def stop(self):
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    def is_ready(self) -> bool:
+        # Nothing to wait for when warm-up is disabled
+        return not self.started or all(
+            status in ("done", "failed") for status in self.status.values()
+        )
+
+    def get_status(self) -> dict:
+        return {
+            "ready": self.is_ready(),
+            "warmup": self.started,
+            "steps": self.status,
+            "durations": self.durations,
+            "errors": self.errors,
+        }
+
+
+WARMUP_SERVICE = WarmupService()
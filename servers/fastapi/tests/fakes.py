@@ -0,0 +1,114 @@
+"""
+Synthetic decks and pictures shared by the PPTX export tests and benchmarks.
+"""
+
+import os
+from typing import List
+
+
+def write_synthetic_images(directory: str, count: int, size: int) -> List[str]:
+    """Writes count noisy RGB PNG photos of size x size pixels."""
+    from PIL import Image
+
+    paths = []
+    for i in range(count):
+        image = Image.merge(
+            "RGB",
+            [
+                Image.effect_noise((size, size), 40 + i % 20),
+                Image.linear_gradient("L").resize((size, size)),
+                Image.radial_gradient("L").resize((size, size)),
+            ],
+        )
+        path = os.path.join(directory, f"synthetic-{size}-{i}.png")
+        image.save(path)
+        paths.append(path)
+    return paths
+
+
+def synthetic_pptx_model(n_slides: int, image_paths: List[str]):
+    """
+    A deck with a cover background, a rounded picture, a circle avatar, a title,
+    a bullet list and an autoshape on every slide. Pictures cycle through
+    image_paths.
+    """
+    from models.pptx_models import (
+        PptxAutoShapeBoxModel,
+        PptxBoxShapeEnum,
+        PptxFillModel,
+        PptxFontModel,
+        PptxObjectFitEnum,
+        PptxObjectFitModel,
+        PptxParagraphModel,
+        PptxPictureBoxModel,
+        PptxPictureModel,
+        PptxPositionModel,
+        PptxPresentationModel,
+        PptxSlideModel,
+        PptxTextBoxModel,
+    )
+
+    def picture(i: int, position: PptxPositionModel, **kwargs):
+        return PptxPictureBoxModel(
+            position=position,
+            picture=PptxPictureModel(
+                is_network=False, path=image_paths[i % len(image_paths)]
+            ),
+            **kwargs,
+        )
+
+    slides = []
+    for i in range(n_slides):
+        slides.append(
+            PptxSlideModel(
+                background=PptxFillModel(color="FFFFFF"),
+                note=f"Speaker note {i}",
+                shapes=[
+                    picture(
+                        3 * i,
+                        PptxPositionModel(left=0, top=0, width=1280, height=720),
+                        opacity=0.3,
+                        object_fit=PptxObjectFitModel(fit=PptxObjectFitEnum.COVER),
+                    ),
+                    picture(
+                        3 * i + 1,
+                        PptxPositionModel(left=700, top=160, width=480, height=400),
+                        border_radius=[24, 24, 24, 24],
+                    ),
+                    picture(
+                        3 * i + 2,
+                        PptxPositionModel(left=80, top=560, width=120, height=120),
+                        shape=PptxBoxShapeEnum.CIRCLE,
+                    ),
+                    PptxTextBoxModel(
+                        position=PptxPositionModel(
+                            left=80, top=60, width=1100, height=80
+                        ),
+                        paragraphs=[
+                            PptxParagraphModel(
+                                text=f"Slide {i + 1} title",
+                                font=PptxFontModel(size=40, font_weight=700),
+                            )
+                        ],
+                    ),
+                    PptxTextBoxModel(
+                        position=PptxPositionModel(
+                            left=80, top=160, width=560, height=380
+                        ),
+                        paragraphs=[
+                            PptxParagraphModel(
+                                text=f"<b>Point {j}</b> lorem ipsum dolor sit amet"
+                            )
+                            for j in range(5)
+                        ],
+                    ),
+                    PptxAutoShapeBoxModel(
+                        position=PptxPositionModel(
+                            left=0, top=700, width=1280, height=20
+                        ),
+                        fill=PptxFillModel(color="1E40AF"),
+                    ),
+                ],
+            )
+        )
+    return PptxPresentationModel(name="synthetic", slides=slides)
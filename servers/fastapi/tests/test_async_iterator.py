@@ -0,0 +1,98 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from utils.async_iterator import iterator_to_async
+
+
+def slow_numbers(n: int, delay: float = 0.0):
+    for i in range(n):
+        if delay:
+            time.sleep(delay)
+        yield i
+
+
+def failing_numbers():
+    yield 1
+    raise ValueError("stream broken")
+
+
+def test_iterator_to_async_yields_items_in_order():
+    async def collect():
+        return [each async for each in iterator_to_async(slow_numbers)(100)]
+
+    assert asyncio.run(collect()) == list(range(100))
+
+
+def test_iterator_to_async_propagates_errors():
+    async def collect():
+        items = []
+        async for each in iterator_to_async(failing_numbers)():
+            items.append(each)
+        return items
+
+    with pytest.raises(ValueError, match="stream broken"):
+        asyncio.run(collect())
+
+
+def test_iterator_to_async_does_not_block_event_loop():
+    async def run():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        ticker_task = asyncio.create_task(ticker())
+        items = [
+            each async for each in iterator_to_async(slow_numbers)(5, delay=0.05)
+        ]
+        ticker_task.cancel()
+        return items, ticks
+
+    items, ticks = asyncio.run(run())
+    assert items == [0, 1, 2, 3, 4]
+    # ~250ms of blocking sleeps in the iterator, the loop must keep ticking
+    assert ticks >= 20
+
+
+def test_iterator_to_async_stops_producer_when_consumer_exits_early():
+    produced = []
+
+    def numbers():
+        for i in range(1000):
+            produced.append(i)
+            yield i
+
+    async def take_two():
+        async for each in iterator_to_async(numbers, max_buffered_items=2)():
+            if each == 1:
+                break
+        await asyncio.sleep(0.05)
+
+    asyncio.run(take_two())
+    assert len(produced) < 10
+
+
+def test_iterator_to_async_producer_exits_when_the_loop_closes():
+    closed = threading.Event()
+
+    def numbers():
+        try:
+            for i in range(1000):
+                yield i
+        finally:
+            closed.set()
+
+    loop = asyncio.new_event_loop()
+    items = iterator_to_async(numbers, max_buffered_items=1)()
+    assert loop.run_until_complete(items.__anext__()) == 0
+    # The generator is never closed, the producer is blocked on a full queue
+    time.sleep(0.2)
+    loop.close()
+
+    assert closed.wait(timeout=2)
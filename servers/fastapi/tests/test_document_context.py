@@ -0,0 +1,97 @@
+import asyncio
+import json
+
+from models.sse_response import SSEStatusResponse
+from utils.document_context import (
+    build_document_context,
+    estimate_tokens,
+    fit_document_to_tokens,
+    get_document_budgets,
+    get_document_context,
+    get_document_context_max_tokens,
+)
+
+
+def make_document(title: str, sections: int, words: int) -> str:
+    lines = [f"{title} summary paragraph."]
+    for index in range(sections):
+        lines.append(f"## {title} section {index + 1}")
+        lines.append(" ".join([f"word{index}"] * words))
+    return "\n".join(lines)
+
+
+def test_small_documents_are_joined_unchanged():
+    documents = ["# One\nfirst", "", "# Two\nsecond"]
+    context = build_document_context(documents, max_tokens=1000)
+
+    assert context.text == "# One\nfirst\n\n# Two\nsecond"
+    assert not context.trimmed
+    assert context.tokens == context.document_tokens
+
+
+def test_large_document_keeps_best_sections_within_budget():
+    document = make_document("Report", sections=50, words=200)
+    context = build_document_context([document], max_tokens=2000)
+
+    assert context.trimmed
+    assert context.tokens <= 2000
+    assert context.document_tokens == estimate_tokens(document)
+    # Text before the first heading always ranks first
+    assert context.text.startswith("Report summary paragraph.")
+    # Sections stay in document order
+    section_numbers = [
+        int(line.rsplit(" ", 1)[1])
+        for line in context.text.split("\n")
+        if line.startswith("## ")
+    ]
+    assert section_numbers == sorted(section_numbers)
+    assert len(section_numbers) > 1
+
+
+def test_document_without_headings_is_trimmed():
+    document = "\n".join(["plain text line"] * 1000)
+    text = fit_document_to_tokens(document, 100)
+
+    assert estimate_tokens(text) <= 100
+    assert document.startswith(text)
+
+
+def test_budget_is_shared_between_documents():
+    assert get_document_budgets([100, 5000, 5000], 3000) == [100, 1450, 1450]
+
+    documents = [
+        make_document("Short", sections=1, words=10),
+        make_document("Long", sections=40, words=300),
+        make_document("Other", sections=40, words=300),
+    ]
+    context = build_document_context(documents, max_tokens=4000)
+
+    assert context.tokens <= 4000
+    assert "Short section 1" in context.text
+    assert "Long section" in context.text
+    assert "Other section" in context.text
+
+
+def test_document_context_max_tokens_env(monkeypatch):
+    monkeypatch.setenv("DOCUMENT_CONTEXT_MAX_TOKENS", "0")
+    assert get_document_context_max_tokens() is None
+    document = make_document("Report", sections=50, words=200)
+    assert asyncio.run(get_document_context([document])).text == document
+
+    monkeypatch.setenv("DOCUMENT_CONTEXT_MAX_TOKENS", "500")
+    assert asyncio.run(get_document_context([document])).tokens <= 500
+
+
+def test_status_event_reports_token_estimates():
+    context = build_document_context(["# One\nfirst"], max_tokens=10)
+    event = SSEStatusResponse(
+        status="Using documents", tokens=context.get_token_estimates()
+    ).to_string()
+
+    data = json.loads(event.split("data: ", 1)[1])
+    assert data == {
+        "type": "status",
+        "status": "Using documents",
+        "tokens": {"context": 3, "documents": 3, "max": 10},
+    }
+    assert "tokens" not in SSEStatusResponse(status="Loading").to_string()
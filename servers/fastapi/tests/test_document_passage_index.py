@@ -0,0 +1,149 @@
+import asyncio
+import re
+import zlib
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+
+from services import document_passage_index
+from services.document_passage_index import (
+    DocumentPassageIndex,
+    get_slide_document_contexts,
+    get_slide_document_contexts_from_files,
+    get_slide_document_contexts_sync,
+    split_passages,
+)
+from utils.document_context import estimate_tokens
+from utils.llm_calls.generate_slide_content import get_messages, get_user_prompt
+
+REPORT = """# Annual report
+
+## Revenue
+Revenue grew 42% to $12.4M, driven by enterprise contracts.
+
+## Hiring
+Headcount went from 35 to 58 engineers across three offices.
+
+## Outlook
+Next year we expect to open a fourth office in Berlin.
+"""
+
+
+class FakeEmbeddingFunction:
+    """Bag of words embedding, enough to rank passages by shared words."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        embeddings = np.zeros((len(texts), 256), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for word in re.findall(r"[a-z]+", text.lower()):
+                embeddings[row, zlib.crc32(word.encode()) % 256] += 1
+        return embeddings
+
+
+def test_split_passages_keeps_headings_and_token_limit():
+    passages = split_passages(REPORT)
+    assert passages[0].startswith("## Revenue\nRevenue grew 42%")
+    assert len(passages) == 3
+
+    long_document = "# Notes\n\n" + "\n\n".join(
+        f"Paragraph {i} " + "word " * 60 for i in range(20)
+    )
+    passages = split_passages(long_document, max_tokens=120)
+    assert all(passage.startswith("# Notes\n") for passage in passages)
+    assert all(estimate_tokens(passage) <= 120 for passage in passages)
+    assert "Paragraph 19" in passages[-1]
+
+
+def test_each_outline_gets_its_closest_passages():
+    embedding_function = FakeEmbeddingFunction()
+    index = DocumentPassageIndex.build([REPORT], embedding_function)
+
+    contexts = index.get_contexts(
+        ["Revenue growth this year", "Hiring more engineers"],
+        embedding_function,
+        k=1,
+        max_tokens=100,
+    )
+
+    assert contexts[0].startswith("## Revenue")
+    assert contexts[1].startswith("## Hiring")
+    # Passages embedded once, outlines in a single batch
+    assert len(embedding_function.calls) == 2
+
+
+def test_slide_context_stays_within_token_cap(monkeypatch):
+    monkeypatch.setenv("SLIDE_DOCUMENT_CONTEXT_MAX_TOKENS", "20")
+    monkeypatch.setenv("SLIDE_DOCUMENT_CONTEXT_TOP_K", "3")
+
+    contexts = get_slide_document_contexts_sync(
+        [REPORT], ["Revenue growth"], FakeEmbeddingFunction()
+    )
+
+    assert 0 < estimate_tokens(contexts[0]) <= 20
+    assert contexts[0].startswith("## Revenue")
+
+
+def test_slide_contexts_are_skipped_without_documents_or_model(monkeypatch):
+    outlines = ["Revenue", "Hiring"]
+    assert asyncio.run(get_slide_document_contexts([""], outlines)) == [None, None]
+
+    def unavailable(*args):
+        raise RuntimeError("model not downloaded")
+
+    monkeypatch.setattr(
+        document_passage_index, "get_slide_document_contexts_sync", unavailable
+    )
+    assert asyncio.run(get_slide_document_contexts([REPORT], outlines)) == [
+        None,
+        None,
+    ]
+
+    monkeypatch.setenv("SLIDE_DOCUMENT_CONTEXT_MAX_TOKENS", "0")
+    assert asyncio.run(get_slide_document_contexts([REPORT], outlines)) == [
+        None,
+        None,
+    ]
+
+
+def test_slide_prompt_includes_document_context():
+    messages = get_messages("Revenue", "English", document_context="Revenue grew 42%")
+    assert "## Source Document Excerpts" in messages[1].content
+    assert "Revenue grew 42%" in messages[1].content
+
+    messages = get_messages("Revenue", "English")
+    assert "Source Document Excerpts" not in messages[1].content
+
+
+def test_slide_prompt_is_unchanged_without_document_context():
+    prompt = get_user_prompt("Revenue", "English")
+    assert prompt.rstrip().endswith("## Slide Outline\n        Revenue")
+    assert "\n        \n" not in prompt
+
+
+def test_slide_contexts_from_files_never_fail_the_stream(tmp_path, monkeypatch):
+    deck = tmp_path / "deck.pdf"
+    deck.write_text("not a pdf")
+
+    async def broken_parse(*args, **kwargs):
+        raise BrokenProcessPool("worker died")
+
+    monkeypatch.setattr(
+        "services.documents_loader.parse_document_to_markdown_async", broken_parse
+    )
+    outlines = ["Revenue", "Hiring"]
+    assert asyncio.run(
+        get_slide_document_contexts_from_files([str(deck)], outlines)
+    ) == [None, None]
+    assert asyncio.run(
+        get_slide_document_contexts_from_files(
+            [str(tmp_path / "missing.pdf")], outlines
+        )
+    ) == [None, None]
+    assert asyncio.run(get_slide_document_contexts_from_files(None, outlines)) == [
+        None,
+        None,
+    ]
@@ -0,0 +1,177 @@
+import asyncio
+import os
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException
+
+from services import document_parsing, parsed_document_cache
+from services.documents_loader import DocumentsLoader
+
+
+@pytest.fixture
+def document_files(tmp_path):
+    paths = []
+    for name in ["slow.pdf", "notes.txt", "fast.docx", "deck.pptx"]:
+        path = tmp_path / name
+        path.write_text(f"contents of {name}")
+        paths.append(str(path))
+    return paths
+
+
+def fake_parse(file_path: str) -> str:
+    # The first file finishes last
+    time.sleep(0.2 if file_path.endswith("slow.pdf") else 0.01)
+    return f"# {os.path.basename(file_path)}"
+
+
+def test_load_documents_parses_in_parallel_and_keeps_order(
+    document_files, monkeypatch
+):
+    monkeypatch.setenv("DOCUMENT_PARSING_WORKERS", "0")
+    monkeypatch.setenv("PARSED_DOCUMENT_CACHE_MAX_SIZE_MB", "0")
+    threads = set()
+
+    def parse(file_path):
+        threads.add(threading.get_ident())
+        return fake_parse(file_path)
+
+    with patch.object(document_parsing, "parse_document_to_markdown", parse):
+        loader = DocumentsLoader(document_files)
+        started = time.perf_counter()
+        asyncio.run(loader.load_documents())
+        elapsed = time.perf_counter() - started
+
+    assert loader.documents == [
+        "# slow.pdf",
+        "contents of notes.txt",
+        "# fast.docx",
+        "# deck.pptx",
+    ]
+    assert loader.images == [[], [], [], []]
+    assert len(threads) == 3
+    assert elapsed < 0.2 + 0.15
+
+
+def test_load_documents_checks_every_file_before_parsing(document_files):
+    with patch.object(document_parsing, "parse_document_to_markdown") as parse:
+        loader = DocumentsLoader(document_files + ["/missing/file.pdf"])
+        with pytest.raises(HTTPException) as error:
+            asyncio.run(loader.load_documents())
+
+    assert error.value.status_code == 404
+    parse.assert_not_called()
+
+
+def test_load_documents_reuses_parsed_documents_with_same_content(
+    tmp_path, monkeypatch
+):
+    monkeypatch.setenv("DOCUMENT_PARSING_WORKERS", "0")
+    monkeypatch.setenv("APP_DATA_DIRECTORY", str(tmp_path / "app_data"))
+    for name in ["report.pdf", "report-copy.pdf", "other.pdf"]:
+        contents = "other" if name == "other.pdf" else "same"
+        (tmp_path / name).write_text(contents)
+    file_paths = [str(tmp_path / "report.pdf"), str(tmp_path / "other.pdf")]
+
+    with patch.object(
+        document_parsing, "parse_document_to_markdown", side_effect=fake_parse
+    ) as parse:
+        loader = DocumentsLoader(file_paths)
+        asyncio.run(loader.load_documents())
+        assert parse.call_count == 2
+
+        # Uploaded again under another name
+        loader = DocumentsLoader([str(tmp_path / "report-copy.pdf")] + file_paths)
+        asyncio.run(loader.load_documents())
+        assert parse.call_count == 2
+
+    assert loader.documents == ["# report.pdf", "# report.pdf", "# other.pdf"]
+    assert parsed_document_cache.get_parsed_document_cache().hits == 3
+
+
+def test_parsed_document_cache_evicts_least_recently_used(tmp_path):
+    cache = parsed_document_cache.ParsedDocumentCache(str(tmp_path), 250)
+    cache.put("first", "a" * 100)
+    cache.put("second", "b" * 100)
+    # Used last, so kept over "second"
+    os.utime(cache._get_path("first"), (time.time() + 10, time.time() + 10))
+    cache.put("third", "c" * 100)
+
+    assert cache.get("first") == "a" * 100
+    assert cache.get("second") is None
+    assert cache.get("third") == "c" * 100
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_parsed_document_key_depends_on_content_and_parser_options(
+    tmp_path, monkeypatch
+):
+    first = tmp_path / "first.docx"
+    second = tmp_path / "second.docx"
+    first.write_text("same")
+    second.write_text("same")
+    key = parsed_document_cache.get_parsed_document_key(str(first))
+    assert parsed_document_cache.get_parsed_document_key(str(second)) == key
+
+    monkeypatch.setattr(
+        parsed_document_cache, "DOCLING_PIPELINE_OPTIONS", {"do_ocr": True}
+    )
+    assert parsed_document_cache.get_parsed_document_key(str(first)) != key
+
+
+def test_document_parsing_workers_are_configurable(monkeypatch):
+    monkeypatch.setenv("DOCUMENT_PARSING_WORKERS", "3")
+    assert document_parsing.get_document_parsing_workers() == 3
+
+    monkeypatch.setenv("DOCUMENT_PARSING_WORKERS", "0")
+    assert document_parsing.get_document_parsing_workers() == 0
+
+    monkeypatch.delenv("DOCUMENT_PARSING_WORKERS")
+    assert 1 <= document_parsing.get_document_parsing_workers() <= 2
+
+
+class FakeFuture:
+    def __init__(self, func):
+        self.func = func
+
+    def result(self):
+        return self.func()
+
+
+class FakePool:
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, func):
+        self.submitted.append(func)
+        return FakeFuture(func)
+
+
+def test_warm_up_document_parsing_loads_every_worker(monkeypatch):
+    monkeypatch.setenv("DOCUMENT_PARSING_WORKERS", "2")
+    monkeypatch.setenv("DOCUMENT_PARSING_PREWARM", "true")
+    pool = FakePool()
+    with patch.object(
+        document_parsing.PROCESS_POOL_SERVICE, "get_pool", return_value=pool
+    ) as get_pool, patch.object(
+        document_parsing, "warm_up_document_parser"
+    ) as warm_up:
+        document_parsing.warm_up_document_parsing()
+
+    get_pool.assert_called_once_with(document_parsing.DOCUMENT_PARSING_POOL, 2)
+    assert len(pool.submitted) == 2
+    assert warm_up.call_count == 2
+
+
+def test_warm_up_document_parsing_is_opt_in(monkeypatch):
+    monkeypatch.setenv("DOCUMENT_PARSING_WORKERS", "0")
+    monkeypatch.delenv("DOCUMENT_PARSING_PREWARM", raising=False)
+    with patch.object(document_parsing, "warm_up_document_parser") as warm_up:
+        document_parsing.warm_up_document_parsing()
+        assert warm_up.call_count == 0
+
+        monkeypatch.setenv("DOCUMENT_PARSING_PREWARM", "true")
+        document_parsing.warm_up_document_parsing()
+        assert warm_up.call_count == 1
@@ -0,0 +1,147 @@
+import asyncio
+import os
+
+from aiohttp import web
+
+from services.asset_download_cache import AssetDownloadCache
+from utils.download_helpers import download_files
+
+
+async def start_server(requests: list, connections: set):
+    async def image(request: web.Request):
+        requests.append((request.method, request.path))
+        connections.add(id(request.transport))
+        return web.Response(
+            body=b"image-" + request.path.encode(), content_type="image/png"
+        )
+
+    app = web.Application()
+    app.router.add_route("*", "/{name}", image)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+class TestDownloadFiles:
+    def test_downloads_over_shared_connections_without_head(self, tmp_path):
+        async def run_test():
+            requests, connections = [], set()
+            runner, base_url = await start_server(requests, connections)
+            try:
+                urls = [f"{base_url}/image-{i}" for i in range(20)]
+                paths = await download_files(urls + urls[:5], str(tmp_path))
+            finally:
+                await runner.cleanup()
+
+            assert all(path.endswith(".png") for path in paths)
+            assert paths[20:] == paths[:5]
+            with open(paths[3], "rb") as f:
+                assert f.read() == b"image-/image-3"
+
+            assert [method for method, _ in requests] == ["GET"] * 20
+            # Connections are bounded by the per host limit and reused
+            assert len(connections) <= 8
+
+        asyncio.run(run_test())
+
+    def test_same_file_names_do_not_overwrite_each_other(self, tmp_path):
+        async def run_test():
+            runner, base_url = await start_server([], set())
+            try:
+                paths = await download_files(
+                    [f"{base_url}/photo.jpg", f"{base_url}/photo.jpg?w=100"],
+                    str(tmp_path),
+                )
+            finally:
+                await runner.cleanup()
+
+            assert paths[0] != paths[1]
+            assert len(os.listdir(tmp_path)) == 2
+
+        asyncio.run(run_test())
+
+    def test_failed_downloads_return_none(self, tmp_path):
+        paths = asyncio.run(
+            download_files(["http://127.0.0.1:9/missing.png"], str(tmp_path))
+        )
+        assert paths == [None]
+
+
+async def start_cached_server(requests: list, cache_control: str):
+    async def image(request: web.Request):
+        requests.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304, headers={"Cache-Control": cache_control})
+        return web.Response(
+            body=b"image",
+            content_type="image/png",
+            headers={"ETag": '"v1"', "Cache-Control": cache_control},
+        )
+
+    app = web.Application()
+    app.router.add_get("/{name}", image)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+class TestDownloadFilesCache:
+    def download_twice(self, tmp_path, cache_control: str):
+        async def run_test():
+            requests = []
+            cache = AssetDownloadCache(str(tmp_path / "cache"), 1024 * 1024)
+            runner, base_url = await start_cached_server(requests, cache_control)
+            try:
+                first = await download_files(
+                    [f"{base_url}/a.png"], str(tmp_path / "export-1"), cache=cache
+                )
+                second = await download_files(
+                    [f"{base_url}/a.png"], str(tmp_path / "export-2"), cache=cache
+                )
+            finally:
+                await runner.cleanup()
+            return requests, cache, first[0], second[0]
+
+        return asyncio.run(run_test())
+
+    def test_fresh_assets_are_not_requested_again(self, tmp_path):
+        requests, cache, first, second = self.download_twice(
+            tmp_path, "max-age=3600"
+        )
+
+        assert requests == [None]
+        assert os.path.dirname(second) == str(tmp_path / "export-2")
+        with open(second, "rb") as f:
+            assert f.read() == b"image"
+        assert cache.get_stats()["hits"] == 1
+
+    def test_stale_assets_are_revalidated_with_etag(self, tmp_path):
+        requests, cache, first, second = self.download_twice(tmp_path, "no-cache")
+
+        assert requests == [None, '"v1"']
+        with open(second, "rb") as f:
+            assert f.read() == b"image"
+        assert cache.get_stats()["revalidated"] == 1
+
+    def test_no_store_assets_are_not_cached(self, tmp_path):
+        requests, cache, first, second = self.download_twice(tmp_path, "no-store")
+
+        assert requests == [None, None]
+        assert cache.get_stats()["entries"] == 0
+
+    def test_least_recently_used_assets_are_evicted(self, tmp_path):
+        cache = AssetDownloadCache(str(tmp_path / "cache"), max_size_bytes=10)
+        for name in ["a", "b", "c"]:
+            path = tmp_path / f"{name}.png"
+            path.write_bytes(b"12345")
+            cache.put(f"http://example.com/{name}.png", str(path), {})
+
+        assert cache.get("http://example.com/a.png") is None
+        assert cache.get("http://example.com/c.png")
+        assert cache.get_stats()["size_bytes"] == 10
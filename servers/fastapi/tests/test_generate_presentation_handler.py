@@ -0,0 +1,71 @@
+import asyncio
+import uuid
+
+import pytest
+from fastapi import HTTPException
+
+from api.v1.ppt.endpoints import presentation as presentation_endpoint
+from models.generate_presentation_request import GeneratePresentationRequest
+from models.presentation_layout import PresentationLayoutModel, SlideLayoutModel
+
+
+def test_failed_slide_cancels_the_other_slides_and_assets(tmp_path, monkeypatch):
+    monkeypatch.setenv("APP_DATA_DIRECTORY", str(tmp_path))
+    layout = PresentationLayoutModel(
+        name="general",
+        ordered=True,
+        slides=[
+            SlideLayoutModel(id=f"layout-{i}", json_schema={}) for i in range(3)
+        ],
+    )
+    cancelled = []
+
+    async def get_layout_by_name(_):
+        return layout
+
+    async def get_slide_content(slide_layout, *args):
+        if slide_layout.id == "layout-2":
+            await asyncio.sleep(0.05)
+            raise HTTPException(status_code=500, detail="Slide failed")
+        if slide_layout.id == "layout-1":
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append("slide")
+                raise
+        return {}
+
+    async def fetch_assets(*args, **kwargs):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append("assets")
+            raise
+
+    monkeypatch.setattr(presentation_endpoint, "get_layout_by_name", get_layout_by_name)
+    monkeypatch.setattr(
+        presentation_endpoint,
+        "get_slide_content_from_type_and_outline",
+        get_slide_content,
+    )
+    monkeypatch.setattr(
+        presentation_endpoint, "process_slide_and_fetch_assets", fetch_assets
+    )
+    monkeypatch.setattr(
+        presentation_endpoint.CONCURRENT_SERVICE, "run_task", lambda *args: None
+    )
+
+    request = GeneratePresentationRequest(
+        content="Deck", slides_markdown=["# One", "# Two", "# Three"]
+    )
+
+    async def run_test():
+        with pytest.raises(HTTPException):
+            await presentation_endpoint.generate_presentation_handler(
+                request, uuid.uuid4(), None, None
+            )
+        # Let the cancellations land, asyncio.run would cancel leftovers itself
+        await asyncio.sleep(0)
+        assert sorted(cancelled) == ["assets", "slide"]
+
+    asyncio.run(run_test())
@@ -0,0 +1,129 @@
+import asyncio
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+from services import icon_finder_service as icon_finder_module
+from services.icon_finder_service import IconFinderService
+from services.icon_query_cache import IconQueryCache
+from utils.lazy_proxy import LazyProxy
+from utils.process_slides import search_icons_many
+
+
+class FakeIconIndex:
+    def __init__(self):
+        self.calls = []
+
+    def search(self, query_embeddings, k):
+        queries = [
+            bytes(np.asarray(embedding, np.uint8)).decode().strip()
+            for embedding in query_embeddings
+        ]
+        self.calls.append(queries)
+        return [[f"{query}-{i}-bold" for i in range(k)] for query in queries]
+
+
+class FakeEmbeddingFunction:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, queries):
+        # Embeddings encode the query text, so the fake index can decode them
+        self.calls.append(queries)
+        return [
+            np.frombuffer(query.encode().ljust(16), np.uint8).astype(np.float32)
+            for query in queries
+        ]
+
+
+def make_icon_finder_service(query_cache=None) -> IconFinderService:
+    # Skips loading the embedding model and the icons index
+    icon_finder_service = IconFinderService.__new__(IconFinderService)
+    icon_finder_service.embedding_function = FakeEmbeddingFunction()
+    icon_finder_service.index = FakeIconIndex()
+    icon_finder_service.query_cache = query_cache
+    return icon_finder_service
+
+
+def test_importing_the_service_does_not_load_the_model():
+    # The embedding model and the icons index need the network, in a fresh
+    # interpreter so other tests can't have loaded them already
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "from services.icon_finder_service import ICON_FINDER_SERVICE;"
+            "assert not ICON_FINDER_SERVICE.is_initialized()",
+        ],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        check=True,
+    )
+
+
+def test_event_loop_keeps_running_while_the_service_loads(monkeypatch):
+    def load_service():
+        # Stands in for loading the model and the icons index
+        time.sleep(0.3)
+        return make_icon_finder_service()
+
+    monkeypatch.setattr(
+        icon_finder_module, "ICON_FINDER_SERVICE", LazyProxy(load_service)
+    )
+
+    async def run_test():
+        ticks = 0
+        search = asyncio.create_task(search_icons_many(["chart"]))
+        while not search.done():
+            ticks += 1
+            await asyncio.sleep(0.01)
+        assert await search == [["/static/icons/bold/chart-0-bold.svg"]]
+        return ticks
+
+    assert asyncio.run(run_test()) > 10
+
+
+def test_search_icons_many_queries_index_once():
+    icon_finder_service = make_icon_finder_service()
+
+    results = asyncio.run(
+        icon_finder_service.search_icons_many(["chart", "team", "chart"], k=2)
+    )
+
+    assert icon_finder_service.index.calls == [["chart", "team"]]
+    assert results == [
+        ["/static/icons/bold/chart-0-bold.svg", "/static/icons/bold/chart-1-bold.svg"],
+        ["/static/icons/bold/team-0-bold.svg", "/static/icons/bold/team-1-bold.svg"],
+        ["/static/icons/bold/chart-0-bold.svg", "/static/icons/bold/chart-1-bold.svg"],
+    ]
+
+
+def test_search_icons_many_without_queries():
+    icon_finder_service = make_icon_finder_service()
+
+    assert asyncio.run(icon_finder_service.search_icons_many([])) == []
+    assert asyncio.run(icon_finder_service.search_icons("growth")) == [
+        "/static/icons/bold/growth-0-bold.svg"
+    ]
+    assert icon_finder_service.index.calls == [["growth"]]
+
+
+def test_search_icons_many_reuses_cached_queries():
+    icon_finder_service = make_icon_finder_service(IconQueryCache())
+
+    asyncio.run(icon_finder_service.search_icons_many(["Chart", "team"], k=3))
+    results = asyncio.run(
+        icon_finder_service.search_icons_many(["chart ", "goal", "team"], k=1)
+    )
+
+    assert results == [
+        ["/static/icons/bold/chart-0-bold.svg"],
+        ["/static/icons/bold/goal-0-bold.svg"],
+        ["/static/icons/bold/team-0-bold.svg"],
+    ]
+    # Only the new query was embedded and searched
+    assert icon_finder_service.embedding_function.calls == [["chart", "team"], ["goal"]]
+    assert icon_finder_service.index.calls == [["chart", "team"], ["goal"]]
+    assert icon_finder_service.get_query_cache_stats()["result_hits"] == 2
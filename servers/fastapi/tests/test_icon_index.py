@@ -0,0 +1,84 @@
+import hashlib
+import json
+
+import numpy as np
+
+from enums.icon_search_backend import IconSearchBackend
+from services.icon_index import NumpyIconIndex, get_icon_search_backend
+
+
+class FakeEmbeddingFunction:
+    MODEL_NAME = "fake-embeddings"
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, texts):
+        self.calls += 1
+        return [
+            np.random.default_rng(
+                int(hashlib.sha256(text.encode("utf-8")).hexdigest()[:8], 16)
+            ).normal(size=32)
+            for text in texts
+        ]
+
+
+def write_icons(path, n_icons: int):
+    icons = [
+        {"name": f"icon-{i}-{'bold' if i % 4 else 'light'}", "tags": f"tag {i}"}
+        for i in range(n_icons)
+    ]
+    path.write_text(json.dumps({"icons": icons}))
+
+
+def test_numpy_icon_index_matches_brute_force_cosine_ranking():
+    rng = np.random.default_rng(7)
+    embeddings = rng.normal(size=(500, 32))
+    ids = [f"icon-{i}" for i in range(500)]
+    index = NumpyIconIndex(ids, embeddings)
+
+    queries = rng.normal(size=(6, 32)) * 3
+    results = index.search(queries, 10)
+
+    normalized = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+    for query, result in zip(queries, results):
+        scores = normalized @ (query / np.linalg.norm(query))
+        assert result == [ids[i] for i in np.argsort(-scores)[:10]]
+
+    # k larger than the corpus returns everything, best first
+    assert len(index.search(queries[:1], 1000)[0]) == 500
+    assert index.search(queries[:1], 0) == [[]]
+
+
+def test_numpy_icon_index_precomputes_embeddings_once(tmp_path):
+    icons_path = tmp_path / "icons.json"
+    write_icons(icons_path, 40)
+    embedding_function = FakeEmbeddingFunction()
+
+    index = NumpyIconIndex.load(embedding_function, str(tmp_path), str(icons_path))
+    assert len(index.ids) == 30
+    assert all(name.endswith("-bold") for name in index.ids)
+    assert np.allclose(np.linalg.norm(index.embeddings, axis=1), 1)
+    assert embedding_function.calls == 1
+
+    reloaded = NumpyIconIndex.load(embedding_function, str(tmp_path), str(icons_path))
+    assert embedding_function.calls == 1
+    assert np.array_equal(reloaded.embeddings, index.embeddings)
+
+    # An icon query equal to an icon document finds that icon first
+    query = embedding_function(["icon-5-bold tag 5"])
+    assert reloaded.search(query, 3)[0][0] == "icon-5-bold"
+
+    # A changed corpus is embedded again
+    write_icons(icons_path, 44)
+    index = NumpyIconIndex.load(embedding_function, str(tmp_path), str(icons_path))
+    assert len(index.ids) == 33
+    assert embedding_function.calls == 3
+
+
+def test_chroma_stays_the_default_icon_search_backend(monkeypatch):
+    monkeypatch.delenv("ICON_SEARCH_BACKEND", raising=False)
+    assert get_icon_search_backend() == IconSearchBackend.CHROMA
+
+    monkeypatch.setenv("ICON_SEARCH_BACKEND", "numpy")
+    assert get_icon_search_backend() == IconSearchBackend.NUMPY
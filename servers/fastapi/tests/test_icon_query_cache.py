@@ -0,0 +1,58 @@
+import numpy as np
+
+from services.icon_query_cache import IconQueryCache, normalize_icon_query
+
+
+def test_normalize_icon_query():
+    assert normalize_icon_query("  Growth   Chart ") == "growth chart"
+
+
+def test_icon_query_cache_evicts_least_recently_used():
+    cache = IconQueryCache(max_entries=2)
+    cache.set_embedding("chart", [1, 0])
+    cache.set_embedding("team", [0, 1])
+    assert cache.get_embedding("chart") is not None
+    cache.set_embedding("target", [1, 1])
+
+    assert cache.get_embedding("team") is None
+    assert cache.get_embedding("chart").dtype == np.float32
+    assert cache.get_stats()["embedding_hit_rate"] == round(2 / 3, 3)
+
+
+def test_icon_query_cache_serves_smaller_k_from_larger_results():
+    cache = IconQueryCache()
+    cache.set_results("chart", 3, ["a", "b", "c"])
+
+    assert cache.get_results("chart", 1) == ["a"]
+    assert cache.get_results("chart", 3) == ["a", "b", "c"]
+    assert cache.get_results("chart", 5) is None
+
+    # Smaller results do not replace larger ones
+    cache.set_results("chart", 1, ["a"])
+    assert cache.get_results("chart", 2) == ["a", "b"]
+
+    # The whole index had fewer icons than searched for
+    cache.set_results("team", 20, ["x", "y"])
+    assert cache.get_results("team", 50) == ["x", "y"]
+
+
+def test_icon_query_cache_persists_across_restarts(tmp_path):
+    path = str(tmp_path / "cache" / "icon_queries.npz")
+    cache = IconQueryCache()
+    cache.set_embedding("chart", [0.5, 0.25])
+    cache.set_results("chart", 1, ["chart-bold"])
+    cache.save(path, "model", "index-1")
+
+    restored = IconQueryCache()
+    assert restored.load(path, "model", "index-1")
+    assert np.array_equal(restored.get_embedding("chart"), [0.5, 0.25])
+    assert restored.get_results("chart", 1) == ["chart-bold"]
+
+    # Results of another index are dropped, embeddings are still valid
+    restored = IconQueryCache()
+    assert restored.load(path, "model", "index-2")
+    assert restored.get_embedding("chart") is not None
+    assert restored.get_results("chart", 1) is None
+
+    assert not IconQueryCache().load(path, "other-model", "index-1")
+    assert not IconQueryCache().load(str(tmp_path / "missing.npz"), "model", "index-1")
@@ -0,0 +1,134 @@
+import asyncio
+import os
+from unittest.mock import patch
+
+from models.image_prompt import ImagePrompt
+from models.sql.image_asset import ImageAsset
+from services.image_generation_cache import ImageGenerationCache
+from services.image_generation_service import ImageGenerationService
+
+
+def write_image(path: str, content: bytes) -> str:
+    with open(path, "wb") as f:
+        f.write(content)
+    return path
+
+
+class TestImageGenerationCache:
+    def test_get_returns_copy_of_cached_image(self, tmp_path):
+        cache = ImageGenerationCache(str(tmp_path), max_size_bytes=1024)
+        key = cache.get_key("openai", "dall-e-3", "standard", "a red fox")
+
+        assert cache.get(key, str(tmp_path)) is None
+
+        cache.put(key, write_image(str(tmp_path / "generated.png"), b"fox"))
+        image_path = cache.get(key, str(tmp_path))
+
+        assert image_path.endswith(".png")
+        assert image_path != str(tmp_path / "generated.png")
+        with open(image_path, "rb") as f:
+            assert f.read() == b"fox"
+        assert cache.get_stats()["hits"] == 1
+        assert cache.get_stats()["misses"] == 1
+
+    def test_keys_differ_by_model_and_quality(self):
+        key = ImageGenerationCache.get_key("openai", "dall-e-3", "standard", "fox")
+        assert key != ImageGenerationCache.get_key("openai", "dall-e-3", "hd", "fox")
+        assert key != ImageGenerationCache.get_key(
+            "openai", "gpt-image-1.5", "standard", "fox"
+        )
+
+    def test_identical_images_are_stored_once(self, tmp_path):
+        cache = ImageGenerationCache(str(tmp_path), max_size_bytes=1024)
+        cache.put("a", write_image(str(tmp_path / "a.png"), b"same"))
+        cache.put("b", write_image(str(tmp_path / "b.png"), b"same"))
+
+        stats = cache.get_stats()
+        assert stats["entries"] == 2
+        assert stats["size_bytes"] == 4
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path):
+        cache = ImageGenerationCache(str(tmp_path), max_size_bytes=10)
+        cache.put("old", write_image(str(tmp_path / "old.png"), b"12345"))
+        cache.put("recent", write_image(str(tmp_path / "recent.png"), b"67890"))
+        assert cache.get("old", str(tmp_path))
+
+        cache.put("new", write_image(str(tmp_path / "new.png"), b"abcde"))
+
+        assert cache.get("recent", str(tmp_path)) is None
+        assert cache.get("old", str(tmp_path))
+        assert cache.get("new", str(tmp_path))
+        assert cache.get_stats()["size_bytes"] <= 10
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_images_served_from_cache_survive_eviction(self, tmp_path):
+        cache = ImageGenerationCache(str(tmp_path), max_size_bytes=5)
+        cache.put("a", write_image(str(tmp_path / "a.png"), b"12345"))
+        image_path = cache.get("a", str(tmp_path))
+
+        cache.put("b", write_image(str(tmp_path / "b.png"), b"67890"))
+
+        assert cache.get("a", str(tmp_path)) is None
+        assert os.path.exists(image_path)
+
+
+class TestImageGenerationServiceCache:
+    def test_repeated_prompt_calls_provider_once(self, tmp_path):
+        async def run_test():
+            with patch.dict(
+                os.environ,
+                {
+                    "APP_DATA_DIRECTORY": str(tmp_path / "app_data"),
+                    "IMAGE_PROVIDER": "dall-e-3",
+                    "DISABLE_IMAGE_GENERATION": "false",
+                },
+            ):
+                service = ImageGenerationService(str(tmp_path))
+                # Cached images live outside the served images directory
+                assert service.cache.directory == str(
+                    tmp_path / "app_data" / "cache" / "images"
+                )
+
+            calls = []
+
+            async def generate_image_openai(prompt, output_directory, model, quality):
+                calls.append((prompt, model, quality))
+                return write_image(
+                    os.path.join(output_directory, f"{len(calls)}.png"), b"image"
+                )
+
+            # The request to OpenAI, generate_image_openai_dalle3 picks the model
+            service.generate_image_openai = generate_image_openai
+            service.image_gen_func = service.generate_image_openai_dalle3
+
+            prompt = ImagePrompt(prompt="A beautiful sunset over mountains")
+            first = await service.generate_image(prompt)
+            second = await service.generate_image(prompt)
+
+            assert isinstance(first, ImageAsset)
+            assert isinstance(second, ImageAsset)
+            assert first.path != second.path
+            assert len(calls) == 1
+            assert calls[0][1:] == ("dall-e-3", "standard")
+            assert service.cache.get_stats()["hits"] == 1
+
+        asyncio.run(run_test())
+
+
+def test_cache_key_follows_the_requested_model(tmp_path):
+    with patch.dict(os.environ, {"DALL_E_3_QUALITY": "hd"}):
+        service = ImageGenerationService(str(tmp_path))
+        dalle3_key = service.get_image_cache_key(
+            service.generate_image_openai_dalle3, "fox"
+        )
+        assert dalle3_key == ImageGenerationCache.get_key(
+            "openai", "dall-e-3", "hd", "fox"
+        )
+
+    assert service.get_image_cache_key(
+        service.generate_image_nanobanana_pro, "fox"
+    ) == ImageGenerationCache.get_key(
+        "google", "gemini-3-pro-image-preview", None, "fox"
+    )
+    # Stock providers return urls
+    assert service.get_image_cache_key(service.get_image_from_pexels, "fox") is None
@@ -0,0 +1,115 @@
+import itertools
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from models.pptx_models import PptxObjectFitEnum, PptxObjectFitModel
+from utils.image_utils import (
+    clip_image,
+    create_circle_image,
+    fit_image,
+    invert_image,
+    round_image_corners,
+    set_image_opacity,
+    transform_image,
+)
+
+
+def legacy_transform(
+    image, width, height, clip, object_fit, border_radius, circle, invert, opacity
+):
+    # Same sequence as PptxPresentationCreator.add_picture used to run
+    image = image.convert("RGBA")
+    if border_radius:
+        image = round_image_corners(image, border_radius)
+    if object_fit:
+        image = fit_image(image, width, height, object_fit)
+    elif clip:
+        image = clip_image(image, width, height)
+    if border_radius:
+        image = round_image_corners(image, border_radius)
+    if circle:
+        image = create_circle_image(image)
+    if invert:
+        image = invert_image(image)
+    if opacity:
+        image = set_image_opacity(image, opacity)
+    return image
+
+
+def random_image(width: int, height: int, mode: str) -> Image.Image:
+    pixels = np.random.default_rng(width * height).integers(
+        0, 256, (height, width, 4), dtype=np.uint8
+    )
+    # Some fully transparent pixels to exercise invert
+    pixels[::7, ::5, 3] = 0
+    return Image.fromarray(pixels, "RGBA").convert(mode)
+
+
+OBJECT_FITS = [
+    None,
+    PptxObjectFitModel(fit=PptxObjectFitEnum.CONTAIN),
+    PptxObjectFitModel(fit=PptxObjectFitEnum.COVER, focus=[20, 80]),
+    PptxObjectFitModel(fit=PptxObjectFitEnum.FILL),
+]
+
+
+@pytest.mark.parametrize(
+    "object_fit, border_radius, circle, invert, opacity",
+    list(
+        itertools.product(
+            OBJECT_FITS,
+            [None, [12, 0, 30, 200]],
+            [False, True],
+            [False, True],
+            [None, 0.35],
+        )
+    ),
+)
+def test_transform_image_matches_legacy_pipeline(
+    object_fit, border_radius, circle, invert, opacity
+):
+    image = random_image(97, 64, "RGBA")
+    kwargs = dict(
+        width=50,
+        height=41,
+        clip=True,
+        object_fit=object_fit,
+        border_radius=border_radius,
+        circle=circle,
+        invert=invert,
+        opacity=opacity,
+    )
+
+    expected = legacy_transform(image, **kwargs)
+    result = transform_image(image, **kwargs)
+
+    assert result.mode == "RGBA"
+    assert result.size == expected.size
+    assert np.array_equal(np.asarray(result), np.asarray(expected))
+
+
+@pytest.mark.parametrize("mode", ["RGB", "L", "P"])
+def test_transform_image_matches_legacy_pipeline_for_any_mode(mode):
+    image = random_image(40, 60, mode)
+    kwargs = dict(
+        width=60,
+        height=60,
+        clip=False,
+        object_fit=None,
+        border_radius=[10, 10, 10, 10],
+        circle=False,
+        invert=True,
+        opacity=0.8,
+    )
+
+    expected = legacy_transform(image, **kwargs)
+    assert np.array_equal(
+        np.asarray(transform_image(image, **kwargs)), np.asarray(expected)
+    )
+
+
+def test_transform_image_validates_border_radius():
+    with pytest.raises(ValueError):
+        transform_image(random_image(10, 10, "RGBA"), 10, 10, border_radius=[1, 2])
@@ -0,0 +1,68 @@
+import threading
+import time
+from unittest.mock import patch
+
+from utils.lazy_proxy import LazyProxy, lazy_import
+
+
+class ExpensiveService:
+    instances = 0
+
+    def __init__(self):
+        time.sleep(0.05)
+        ExpensiveService.instances += 1
+        self.value = 1
+
+    def get_value(self):
+        return self.value
+
+
+def test_lazy_proxy_builds_instance_once_on_first_use():
+    ExpensiveService.instances = 0
+    service = LazyProxy(ExpensiveService)
+    assert not service.is_initialized()
+    assert ExpensiveService.instances == 0
+
+    threads = [threading.Thread(target=service.get_value) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert ExpensiveService.instances == 1
+    assert service.is_initialized()
+    assert service.get() is service.get()
+
+    service.value = 2
+    assert service.get().value == 2
+
+
+def test_lazy_proxy_supports_patching_attributes():
+    service = LazyProxy(ExpensiveService)
+    with patch.object(service, "get_value", return_value=42):
+        assert service.get_value() == 42
+    assert service.get_value() == 1
+
+
+def test_lazy_proxy_retries_failed_factory():
+    calls = []
+
+    def factory():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("model download failed")
+        return ExpensiveService()
+
+    service = LazyProxy(factory)
+    try:
+        service.get()
+    except RuntimeError:
+        pass
+    assert not service.is_initialized()
+    assert service.get_value() == 1
+
+
+def test_lazy_import():
+    json_module = lazy_import("json")
+    assert not json_module.is_initialized()
+    assert json_module.dumps([1]) == "[1]"
@@ -0,0 +1,206 @@
+import asyncio
+import os
+import stat
+import threading
+import time
+
+import pytest
+
+from api.v1.ppt.endpoints import pptx_slides
+from services import libreoffice_pool
+from services.libreoffice_pool import LibreOfficePool, LibreOfficeWorker
+from utils.lazy_proxy import LazyProxy
+
+# Stands in for soffice --convert-to, writes <outdir>/<name>.pdf
+FAKE_SOFFICE = """#!/bin/sh
+for arg in "$@"; do
+    case "$arg" in -env:UserInstallation=*) echo "$arg" >> "$0.profiles";; esac
+done
+while [ "$1" != "--outdir" ]; do shift; done
+[ -n "$FAKE_SOFFICE_SLEEP" ] && sleep "$FAKE_SOFFICE_SLEEP"
+name=$(basename "$3")
+echo pdf > "$2/${name%.*}.pdf"
+"""
+
+
+class FakeWorker:
+    def __init__(self, delay=0.0, fail=False):
+        self.jobs = 0
+        self.delay = delay
+        self.fail = fail
+        self.healthy = True
+        self.closed = False
+
+    def is_healthy(self):
+        return self.healthy
+
+    def convert(self, input_path, output_directory):
+        self.jobs += 1
+        time.sleep(self.delay)
+        if self.fail:
+            raise Exception("LibreOffice conversion failed: broken deck")
+        return os.path.join(output_directory, "deck.pdf")
+
+    def close(self):
+        self.closed = True
+
+
+def make_pool(size=1, max_jobs=10, **worker_kwargs):
+    workers = []
+
+    def worker_factory():
+        workers.append(FakeWorker(**worker_kwargs))
+        return workers[-1]
+
+    pool = LibreOfficePool(size, max_jobs, 5, worker_factory=worker_factory)
+    return pool, workers
+
+
+def test_workers_are_reused_and_recycled_after_max_jobs():
+    pool, workers = make_pool(max_jobs=3)
+
+    for _ in range(7):
+        assert pool.convert("deck.pptx", "/tmp") == "/tmp/deck.pdf"
+
+    assert [worker.jobs for worker in workers] == [3, 3, 1]
+    assert [worker.closed for worker in workers] == [True, True, False]
+
+
+def test_unhealthy_and_failed_workers_are_replaced():
+    pool, workers = make_pool()
+    pool.convert("deck.pptx", "/tmp")
+    workers[0].healthy = False
+    pool.convert("deck.pptx", "/tmp")
+    assert len(workers) == 2
+    assert workers[0].closed
+
+    workers[1].fail = True
+    with pytest.raises(Exception, match="broken deck"):
+        pool.convert("deck.pptx", "/tmp")
+    assert workers[1].closed
+
+    pool.shutdown()
+
+
+def test_concurrent_conversions_are_bounded_by_pool_size():
+    pool, workers = make_pool(size=2, delay=0.1)
+
+    async def run():
+        await asyncio.gather(
+            *[pool.convert_async("deck.pptx", "/tmp") for _ in range(6)]
+        )
+
+    started = time.perf_counter()
+    asyncio.run(run())
+
+    assert len(workers) == 2
+    assert sum(worker.jobs for worker in workers) == 6
+    # Three rounds of two conversions
+    assert time.perf_counter() - started >= 0.3
+
+
+def test_waiting_async_callers_do_not_hold_threads():
+    pool, _ = make_pool(size=1, delay=0.05)
+    convert = pool.convert
+    running = []
+    most_running = 0
+
+    def tracked_convert(input_path, output_directory):
+        nonlocal most_running
+        running.append(input_path)
+        most_running = max(most_running, len(running))
+        try:
+            return convert(input_path, output_directory)
+        finally:
+            running.remove(input_path)
+
+    pool.convert = tracked_convert
+
+    async def run():
+        await asyncio.gather(
+            *[pool.convert_async(f"deck_{i}.pptx", "/tmp") for i in range(4)]
+        )
+
+    asyncio.run(run())
+    asyncio.run(run())
+    assert most_running == 1
+
+
+def test_shutdown_closes_busy_workers_and_refuses_new_jobs():
+    pool, workers = make_pool(size=2, delay=0.2)
+    busy = threading.Thread(target=pool.convert, args=("deck.pptx", "/tmp"))
+    busy.start()
+    time.sleep(0.05)
+
+    pool.shutdown()
+    assert not workers[0].closed
+    busy.join()
+    assert workers[0].closed
+
+    with pytest.raises(Exception, match="shut down"):
+        pool.convert("deck.pptx", "/tmp")
+    with pytest.raises(Exception, match="shut down"):
+        asyncio.run(pool.convert_async("deck.pptx", "/tmp"))
+    assert len(workers) == 1
+
+
+def test_pool_is_warmed_up_only_when_asked_to(monkeypatch):
+    pool, workers = make_pool(size=2)
+    monkeypatch.setattr(libreoffice_pool, "LIBREOFFICE_POOL", LazyProxy(lambda: pool))
+    monkeypatch.setattr(libreoffice_pool, "find_libreoffice_path", lambda: "soffice")
+    monkeypatch.setattr(libreoffice_pool, "load_uno", lambda: object())
+
+    monkeypatch.delenv("LIBREOFFICE_PREWARM", raising=False)
+    libreoffice_pool.warm_up_libreoffice_pool()
+    assert not libreoffice_pool.LIBREOFFICE_POOL.is_initialized()
+
+    monkeypatch.setenv("LIBREOFFICE_PREWARM", "true")
+    libreoffice_pool.warm_up_libreoffice_pool()
+    assert len(workers) == 2
+
+
+@pytest.fixture
+def fake_soffice(tmp_path, monkeypatch):
+    monkeypatch.setattr(libreoffice_pool, "load_uno", lambda: None)
+    path = tmp_path / "soffice"
+    path.write_text(FAKE_SOFFICE)
+    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+    return str(path)
+
+
+def test_worker_converts_in_its_own_profile(fake_soffice, tmp_path):
+    workers = [LibreOfficeWorker(fake_soffice, 5) for _ in range(2)]
+    for worker in workers:
+        assert worker.convert(str(tmp_path / "deck.pptx"), str(tmp_path)) == str(
+            tmp_path / "deck.pdf"
+        )
+
+    with open(f"{fake_soffice}.profiles") as f:
+        profiles = f.read().split()
+    assert len(set(profiles)) == 2
+    for worker in workers:
+        worker.close()
+        assert not os.path.exists(worker.profile_directory)
+
+
+def test_worker_conversion_times_out(fake_soffice, tmp_path, monkeypatch):
+    monkeypatch.setenv("FAKE_SOFFICE_SLEEP", "5")
+    worker = LibreOfficeWorker(fake_soffice, 1)
+
+    with pytest.raises(TimeoutError, match="timed out after 1s"):
+        worker.convert(str(tmp_path / "deck.pptx"), str(tmp_path))
+    worker.close()
+
+
+def test_convert_pptx_to_pdf_uses_the_pool(monkeypatch):
+    pool, workers = make_pool()
+    monkeypatch.setattr(pptx_slides, "LIBREOFFICE_POOL", pool)
+
+    pdf_path = asyncio.run(pptx_slides._convert_pptx_to_pdf("deck.pptx", "/tmp"))
+    assert pdf_path == "/tmp/deck.pdf"
+    asyncio.run(pptx_slides._convert_pptx_to_pdf("deck.pptx", "/tmp"))
+    assert len(workers) == 1
+
+    workers[0].fail = True
+    with pytest.raises(Exception, match="LibreOffice conversion failed"):
+        asyncio.run(pptx_slides._convert_pptx_to_pdf("deck.pptx", "/tmp"))
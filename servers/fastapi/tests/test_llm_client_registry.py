@@ -0,0 +1,65 @@
+import os
+from unittest.mock import patch
+
+from enums.llm_provider import LLMProvider
+from services.llm_client_registry import LLMClientRegistry
+
+
+class FakeClient:
+    def __init__(self, api_key, base_url):
+        self.api_key = api_key
+        self.base_url = base_url
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def test_registry_reuses_client_for_same_credentials():
+    registry = LLMClientRegistry()
+    with patch.dict(os.environ, {"GOOGLE_API_KEY": "key-1"}):
+        first = registry.get_client(LLMProvider.GOOGLE, FakeClient)
+        second = registry.get_client(LLMProvider.GOOGLE, FakeClient)
+
+    assert first is second
+    assert first.api_key == "key-1"
+    stats = registry.get_stats()
+    assert stats["created"] == 1
+    assert stats["hits"] == 1
+    assert "key-1" not in str(stats)
+
+
+def test_registry_replaces_client_when_credentials_change():
+    registry = LLMClientRegistry()
+    with patch.dict(os.environ, {"GOOGLE_API_KEY": "key-1"}):
+        first = registry.get_client(LLMProvider.GOOGLE, FakeClient)
+    with patch.dict(os.environ, {"GOOGLE_API_KEY": "key-2"}):
+        second = registry.get_client(LLMProvider.GOOGLE, FakeClient)
+
+    assert first is not second
+    assert second.api_key == "key-2"
+    assert len(registry.get_stats()["clients"]) == 1
+
+
+def test_invalidate_stale_drops_clients_with_old_credentials():
+    registry = LLMClientRegistry()
+    with patch.dict(os.environ, {"GOOGLE_API_KEY": "key-1"}):
+        registry.get_client(LLMProvider.GOOGLE, FakeClient)
+        registry.invalidate_stale()
+        assert len(registry.get_stats()["clients"]) == 1
+
+    with patch.dict(os.environ, {"GOOGLE_API_KEY": "key-2"}):
+        registry.invalidate_stale()
+
+    stats = registry.get_stats()
+    assert stats["clients"] == []
+    assert stats["invalidated"] == 1
+
+
+def test_clear_closes_clients():
+    registry = LLMClientRegistry()
+    with patch.dict(os.environ, {"GOOGLE_API_KEY": "key-1"}):
+        client = registry.get_client(LLMProvider.GOOGLE, FakeClient)
+    registry.clear()
+    assert client.closed
+    assert registry.get_stats()["clients"] == []
@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+from google.genai.errors import ClientError
+
+from services.llm_concurrency_limiter import (
+    AdaptiveConcurrencyLimiter,
+    is_rate_limit_error,
+)
+
+
+def rate_limit_error():
+    return ClientError(
+        429,
+        {"error": {"code": 429, "message": "quota", "status": "RESOURCE_EXHAUSTED"}},
+    )
+
+
+def test_is_rate_limit_error():
+    assert is_rate_limit_error(rate_limit_error())
+    assert not is_rate_limit_error(ValueError("boom"))
+
+
+def test_limiter_bounds_in_flight_calls_without_batching():
+    limiter = AdaptiveConcurrencyLimiter(max_limit=3)
+    in_flight = 0
+    peak = 0
+
+    async def call(delay):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(delay)
+        in_flight -= 1
+        return delay
+
+    async def run():
+        delays = [0.05, 0.01, 0.01, 0.01, 0.01, 0.01]
+        return await asyncio.gather(
+            *[limiter.run(lambda d=d: call(d)) for d in delays]
+        )
+
+    results = asyncio.run(run())
+    assert results == [0.05, 0.01, 0.01, 0.01, 0.01, 0.01]
+    assert peak == 3
+    assert limiter.in_flight == 0
+
+
+def test_limiter_shrinks_on_rate_limit_and_retries():
+    limiter = AdaptiveConcurrencyLimiter(max_limit=8, retry_backoff=0.001)
+    attempts = 0
+
+    async def flaky():
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise rate_limit_error()
+        return "ok"
+
+    assert asyncio.run(limiter.run(flaky)) == "ok"
+    assert attempts == 2
+    assert limiter.limit == 4
+    assert limiter.get_stats()["rate_limited"] == 1
+
+
+def test_limiter_gives_up_after_max_retries():
+    limiter = AdaptiveConcurrencyLimiter(max_limit=4, max_retries=1, retry_backoff=0.001)
+
+    async def always_limited():
+        raise rate_limit_error()
+
+    with pytest.raises(ClientError):
+        asyncio.run(limiter.run(always_limited))
+    assert limiter.in_flight == 0
+
+
+def test_limiter_grows_back_after_cooldown():
+    limiter = AdaptiveConcurrencyLimiter(max_limit=4, cooldown=0)
+    limiter.on_rate_limited()
+    assert limiter.limit == 2
+
+    for _ in range(20):
+        limiter.on_success()
+    assert limiter.limit == 4
@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+from PIL import Image
+
+from services import pdf_renderer
+from services.documents_loader import DocumentsLoader
+from services.pdf_renderer import (
+    iter_pdf_page_images,
+    render_pdf_page_images,
+    render_pdf_pages,
+)
+
+COLORS = [(200, 0, 0), (0, 200, 0), (0, 0, 200), (200, 200, 0), (0, 200, 200)]
+
+
+@pytest.fixture
+def pdf_path(tmp_path, monkeypatch):
+    monkeypatch.setenv("PDF_RENDERING_WORKERS", "0")
+    monkeypatch.delenv("PDF_RENDERING_DPI", raising=False)
+    monkeypatch.delenv("PDF_RENDERING_MAX_SIZE", raising=False)
+
+    # 72 DPI pages of 160x90 points, one color per page
+    pages = [Image.new("RGB", (160, 90), color) for color in COLORS]
+    path = tmp_path / "deck.pdf"
+    pages[0].save(path, save_all=True, append_images=pages[1:], resolution=72)
+    return str(path)
+
+
+def get_page_color(image_path: str):
+    # Pillow embeds the pages as JPEG, match the closest page color
+    with Image.open(image_path) as image:
+        pixel = image.convert("RGB").getpixel((image.width // 2, image.height // 2))
+    return min(
+        COLORS, key=lambda color: sum(abs(a - b) for a, b in zip(color, pixel))
+    )
+
+
+def test_render_pdf_pages_scales_to_dpi_and_max_size(pdf_path, tmp_path):
+    rendered = render_pdf_pages(pdf_path, [0, 2], str(tmp_path), 144)
+
+    assert [page_number for page_number, _ in rendered] == [1, 3]
+    with Image.open(rendered[0][1]) as image:
+        assert image.size == (320, 180)
+    assert get_page_color(rendered[1][1]) == COLORS[2]
+
+    rendered = render_pdf_pages(pdf_path, [1], str(tmp_path), 144, max_size=100)
+    with Image.open(rendered[0][1]) as image:
+        assert max(image.size) == 100
+
+
+def test_render_pdf_pages_closes_the_document_when_a_page_fails(
+    pdf_path, tmp_path, monkeypatch
+):
+    documents = []
+
+    class TrackedPdfDocument(pdf_renderer.pypdfium2.PdfDocument):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.closed = False
+            documents.append(self)
+
+        def close(self):
+            self.closed = True
+            super().close()
+
+    monkeypatch.setattr(pdf_renderer.pypdfium2, "PdfDocument", TrackedPdfDocument)
+
+    with pytest.raises(Exception):
+        render_pdf_pages(pdf_path, [0, 9], str(tmp_path), 72)
+    assert len(documents) == 1 and documents[0].closed
+
+
+def test_iter_pdf_page_images_yields_every_page(pdf_path, tmp_path):
+    async def collect():
+        return [
+            page
+            async for page in iter_pdf_page_images(pdf_path, str(tmp_path), dpi=72)
+        ]
+
+    pages = asyncio.run(collect())
+    assert sorted(page_number for page_number, _ in pages) == [1, 2, 3, 4, 5]
+    for page_number, image_path in pages:
+        assert image_path.endswith(f"page_{page_number}.png")
+
+
+def test_page_images_are_returned_in_page_order(pdf_path, tmp_path, monkeypatch):
+    monkeypatch.setenv("PDF_RENDERING_DPI", "36")
+
+    image_paths = asyncio.run(render_pdf_page_images(pdf_path, str(tmp_path)))
+    assert [get_page_color(path) for path in image_paths] == COLORS
+    with Image.open(image_paths[0]) as image:
+        assert image.size == (80, 45)
+
+    loader_paths = asyncio.run(
+        DocumentsLoader.get_page_images_from_pdf_async(pdf_path, str(tmp_path))
+    )
+    assert loader_paths == image_paths
+    assert DocumentsLoader.get_page_images_from_pdf(pdf_path, str(tmp_path)) == (
+        image_paths
+    )
@@ -1,4 +1,5 @@
 import asyncio
+import os
 from models.pptx_models import (
     PptxAutoShapeBoxModel,
     PptxFillModel,
@@ -38,3 +39,168 @@ def test_pptx_creator():
     pptx_creator = PptxPresentationCreator(pptx_model, temp_dir)
     asyncio.run(pptx_creator.create_ppt())
     pptx_creator.save("debug/test.pptx")
+
+
+def test_pptx_creator_renders_pictures_in_export_pool(tmp_path, monkeypatch):
+    from PIL import Image
+    from pptx import Presentation
+
+    from services.process_pool_service import PROCESS_POOL_SERVICE
+    from tests.fakes import synthetic_pptx_model
+
+    monkeypatch.setenv("PPTX_EXPORT_WORKERS", "2")
+    monkeypatch.setenv("PICTURE_TRANSFORM_CACHE_MAX_SIZE_MB", "0")
+    image_path = str(tmp_path / "photo.png")
+    Image.new("RGB", (64, 48), "red").save(image_path)
+
+    pptx_creator = PptxPresentationCreator(
+        synthetic_pptx_model(3, [image_path]), str(tmp_path)
+    )
+    try:
+        asyncio.run(pptx_creator.create_ppt())
+    finally:
+        PROCESS_POOL_SERVICE.shutdown()
+    pptx_creator.save(str(tmp_path / "deck.pptx"))
+
+    # Background, rounded picture and circle are rendered once each
+    assert len(pptx_creator._transformed_pictures) == 3
+    presentation = Presentation(str(tmp_path / "deck.pptx"))
+    assert len(presentation.slides) == 3
+    assert all(len(slide.shapes) == 6 for slide in presentation.slides)
+
+
+def test_pptx_creator_reuses_transformed_pictures(tmp_path, monkeypatch):
+    from PIL import Image
+
+    import services.picture_transform_cache as picture_transform_cache
+    import services.pptx_presentation_creator as pptx_presentation_creator
+    from tests.fakes import synthetic_pptx_model
+
+    monkeypatch.setenv("PPTX_EXPORT_WORKERS", "0")
+    monkeypatch.setenv("APP_DATA_DIRECTORY", str(tmp_path / "app_data"))
+
+    transform_calls = []
+    transform_picture = pptx_presentation_creator.transform_picture
+
+    def counting_transform_picture(picture_model, output_directory, image_dpi=None):
+        transform_calls.append(picture_model.picture.path)
+        return transform_picture(picture_model, output_directory, image_dpi)
+
+    monkeypatch.setattr(
+        pptx_presentation_creator, "transform_picture", counting_transform_picture
+    )
+
+    # Same logo content under two different paths
+    image_paths = [str(tmp_path / "logo.png"), str(tmp_path / "logo-copy.png")]
+    for image_path in image_paths:
+        Image.new("RGB", (64, 48), "red").save(image_path)
+
+    def export(temp_dir):
+        os.makedirs(temp_dir)
+        pptx_creator = PptxPresentationCreator(
+            synthetic_pptx_model(10, image_paths), temp_dir
+        )
+        asyncio.run(pptx_creator.create_ppt())
+        pptx_creator.save(os.path.join(temp_dir, "deck.pptx"))
+
+    export(str(tmp_path / "export-1"))
+    # Three distinct transforms across 10 slides and 30 pictures
+    assert len(transform_calls) == 3
+
+    export(str(tmp_path / "export-2"))
+    assert len(transform_calls) == 3
+    assert picture_transform_cache.get_picture_transform_cache().hits == 3
+
+
+def test_pptx_creator_hashes_each_source_picture_once(tmp_path, monkeypatch):
+    from PIL import Image
+
+    import services.pptx_presentation_creator as pptx_presentation_creator
+    from tests.fakes import synthetic_pptx_model
+
+    monkeypatch.setenv("PPTX_EXPORT_WORKERS", "0")
+    monkeypatch.setenv("PICTURE_TRANSFORM_CACHE_MAX_SIZE_MB", "0")
+
+    hashed_paths = []
+    get_file_hash = pptx_presentation_creator.get_file_hash
+
+    def counting_get_file_hash(path):
+        hashed_paths.append(path)
+        return get_file_hash(path)
+
+    monkeypatch.setattr(
+        pptx_presentation_creator, "get_file_hash", counting_get_file_hash
+    )
+
+    image_paths = [str(tmp_path / "logo.png"), str(tmp_path / "photo.png")]
+    for image_path in image_paths:
+        Image.new("RGB", (64, 48), "red").save(image_path)
+
+    pptx_creator = PptxPresentationCreator(
+        synthetic_pptx_model(10, image_paths), str(tmp_path)
+    )
+    asyncio.run(pptx_creator.create_ppt())
+
+    # Once per distinct picture, not per occurrence while building the deck
+    assert len(hashed_paths) == len(pptx_creator._transformed_pictures)
+    assert set(hashed_paths) == set(image_paths)
+
+
+def test_pptx_creator_resamples_pictures_to_box_size(tmp_path, monkeypatch):
+    import zipfile
+
+    from PIL import Image
+
+    from models.pptx_models import PptxPictureBoxModel, PptxPictureModel
+    from tests.fakes import write_synthetic_images
+
+    monkeypatch.setenv("PPTX_EXPORT_WORKERS", "0")
+    monkeypatch.setenv("PICTURE_TRANSFORM_CACHE_MAX_SIZE_MB", "0")
+
+    photo_path = write_synthetic_images(str(tmp_path), 1, 1024)[0]
+    logo_path = str(tmp_path / "logo.png")
+    logo = Image.new("RGBA", (800, 800), (0, 0, 0, 0))
+    logo.paste((30, 64, 175, 255), (200, 200, 600, 600))
+    logo.save(logo_path)
+
+    def picture(path, width, height, clip=True):
+        return PptxPictureBoxModel(
+            position=PptxPositionModel(left=0, top=0, width=width, height=height),
+            picture=PptxPictureModel(is_network=False, path=path),
+            clip=clip,
+        )
+
+    def export(image_dpi):
+        temp_dir = tmp_path / f"export-{image_dpi}"
+        temp_dir.mkdir()
+        model = PptxPresentationModel(
+            slides=[
+                PptxSlideModel(
+                    shapes=[
+                        picture(photo_path, 300, 150),
+                        picture(photo_path, 200, 100, clip=False),
+                        picture(logo_path, 72, 72),
+                    ]
+                )
+                for _ in range(3)
+            ]
+        )
+        pptx_creator = PptxPresentationCreator(model, str(temp_dir), image_dpi=image_dpi)
+        asyncio.run(pptx_creator.create_ppt())
+        pptx_path = str(temp_dir / "deck.pptx")
+        pptx_creator.save(pptx_path)
+        with zipfile.ZipFile(pptx_path) as pptx_zip:
+            media = sorted(
+                (os.path.splitext(name)[1], Image.open(pptx_zip.open(name)).size)
+                for name in pptx_zip.namelist()
+                if name.startswith("ppt/media/")
+            )
+        return media, os.path.getsize(pptx_path)
+
+    media, full_size = export(None)
+    assert media == [(".png", (72, 72)), (".png", (300, 150)), (".png", (1024, 1024))]
+
+    # One part per distinct picture, photos as JPEG, the logo keeps its alpha
+    media, size = export(144)
+    assert media == [(".jpg", (400, 200)), (".jpg", (600, 300)), (".png", (144, 144))]
+    assert size < full_size / 2
@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+
+from services.score_based_chunker import ScoreBasedChunker
+
+TEXT = """Intro line
+# Title
+Opening paragraph.
+
+  ## Overview
+Overview body
+with two lines.
+## Overview
+Second overview body.
+text with a # inside
+### Details
+Details body"""
+
+
+def test_extract_headings_strips_heading_lines():
+    assert ScoreBasedChunker().extract_headings(TEXT) == [
+        "# Title",
+        "## Overview",
+        "## Overview",
+        "### Details",
+    ]
+
+
+def test_get_heading_offsets_point_at_heading_lines():
+    for heading, line_start, content_start in ScoreBasedChunker().get_heading_offsets(
+        TEXT
+    ):
+        assert TEXT[line_start:content_start].strip() == heading
+        assert TEXT[content_start - 1] == "\n"
+
+
+def test_chunks_follow_repeated_headings_in_order():
+    chunker = ScoreBasedChunker()
+    headings = chunker.extract_headings(TEXT)
+    chunks = chunker.get_chunks_from_headings(
+        TEXT, headings, chunker.score_headings(headings), top_k=10
+    )
+
+    assert [(chunk.heading, chunk.heading_index) for chunk in chunks] == [
+        ("# Title", 0),
+        ("## Overview", 1),
+        ("## Overview", 2),
+        ("### Details", 3),
+    ]
+    assert [chunk.content for chunk in chunks] == [
+        "Opening paragraph.",
+        "Overview body\nwith two lines.",
+        "Second overview body.\ntext with a # inside",
+        "Details body",
+    ]
+
+
+def test_chunks_span_until_next_selected_heading():
+    chunker = ScoreBasedChunker()
+    headings = chunker.extract_headings(TEXT)
+    # Only the first and last headings score
+    chunks = chunker.get_chunks_from_headings(
+        TEXT, headings, [1.0, 0.0, 0.0, 1.0], top_k=10
+    )
+
+    assert [chunk.heading_index for chunk in chunks] == [0, 3]
+    assert chunks[0].content.startswith("Opening paragraph.")
+    assert chunks[0].content.endswith("text with a # inside")
+
+
+def test_get_n_chunks_runs_in_one_thread_call(monkeypatch):
+    calls = []
+
+    async def to_thread(func, *args):
+        calls.append(func)
+        return func(*args)
+
+    monkeypatch.setattr(asyncio, "to_thread", to_thread)
+    chunker = ScoreBasedChunker()
+
+    chunks = asyncio.run(chunker.get_n_chunks(TEXT, 2))
+    assert len(chunks) == 2
+    assert len(calls) == 1
+
+    with pytest.raises(ValueError):
+        asyncio.run(chunker.get_n_chunks(TEXT, 10))
@@ -0,0 +1,52 @@
+import os
+
+import pytest
+
+from services.size_capped_cache import DirectoryCache, SharedCaches, SizeCappedCache
+
+
+class TextCache(DirectoryCache):
+    extensions = (".txt",)
+
+    def put(self, name: str, text: str):
+        def write(temp_path: str):
+            with open(temp_path, "w") as f:
+                f.write(text)
+
+        self._store(self._get_path(name), write)
+
+
+def test_shared_caches_are_per_directory_and_sized_by_env(tmp_path, monkeypatch):
+    caches = SharedCaches(TextCache, lambda: os.getenv("TEXT_CACHE_MB"), 1)
+
+    first = caches.get(str(tmp_path / "a"))
+    assert first is caches.get(str(tmp_path / "a"))
+    assert first is not caches.get(str(tmp_path / "b"))
+    assert first.max_size_bytes == 1024 * 1024
+
+    monkeypatch.setenv("TEXT_CACHE_MB", "2")
+    assert caches.get(str(tmp_path / "a")).max_size_bytes == 2 * 1024 * 1024
+
+    monkeypatch.setenv("TEXT_CACHE_MB", "0")
+    assert caches.get(str(tmp_path / "a")) is None
+
+
+def test_directory_cache_ignores_other_files(tmp_path):
+    (tmp_path / "index.db").write_text("x" * 100)
+    cache = TextCache(str(tmp_path), max_size_bytes=15)
+
+    cache.put("first", "a" * 10)
+    cache.put("second", "b" * 10)
+
+    assert not (tmp_path / "first.txt").exists()
+    assert (tmp_path / "second.txt").exists()
+    assert (tmp_path / "index.db").exists()
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_caches_must_implement_eviction(tmp_path):
+    class NoEvictionCache(SizeCappedCache):
+        pass
+
+    with pytest.raises(TypeError):
+        NoEvictionCache(str(tmp_path), 1024)
@@ -0,0 +1,91 @@
+import asyncio
+import os
+from unittest.mock import AsyncMock, patch
+
+from enums.image_provider import ImageProvider
+from services.image_generation_service import ImageGenerationService
+from services.stock_image_session_pool import (
+    STOCK_IMAGE_SEARCH_CACHE,
+    StockImageSearchCache,
+    StockImageSessionPool,
+)
+
+
+class TestStockImageSearchCache:
+    def test_results_expire_after_ttl(self):
+        cache = StockImageSearchCache(ttl=0)
+        cache.set(ImageProvider.PEXELS, "mountains", ["a"])
+        assert cache.get(ImageProvider.PEXELS, "mountains") is None
+
+    def test_queries_are_normalized_and_scoped_by_provider(self):
+        cache = StockImageSearchCache()
+        cache.set(ImageProvider.PEXELS, "Snowy  Mountains", ["a"])
+
+        assert cache.get(ImageProvider.PEXELS, "snowy mountains").urls == ["a"]
+        assert cache.get(ImageProvider.PIXABAY, "snowy mountains") is None
+        assert cache.get_stats() == {"entries": 1, "hits": 1, "misses": 1}
+
+    def test_next_url_rotates_through_alternates(self):
+        cache = StockImageSearchCache()
+        result = cache.set(ImageProvider.PIXABAY, "fox", ["a", "b"])
+        assert [result.next_url() for _ in range(3)] == ["a", "b", "a"]
+        assert cache.set(ImageProvider.PIXABAY, "none", []).next_url() == ""
+
+    def test_oldest_entries_are_dropped(self):
+        cache = StockImageSearchCache(max_entries=2)
+        for query in ["a", "b", "c"]:
+            cache.set(ImageProvider.PEXELS, query, [query])
+        assert cache.get(ImageProvider.PEXELS, "a") is None
+        assert cache.get(ImageProvider.PEXELS, "c").urls == ["c"]
+
+
+class TestStockImageSessionPool:
+    def test_session_is_reused_per_provider(self):
+        async def run_test():
+            pool = StockImageSessionPool()
+            await pool.start()
+            session = pool.get_session(ImageProvider.PEXELS)
+            assert pool.get_session(ImageProvider.PEXELS) is session
+            assert pool.get_session(ImageProvider.PIXABAY) is not session
+            await pool.close()
+            assert session.closed
+
+        asyncio.run(run_test())
+
+    def test_session_from_another_loop_is_closed(self):
+        pool = StockImageSessionPool()
+
+        async def get_session():
+            return pool.get_session(ImageProvider.PEXELS)
+
+        old_session = asyncio.run(get_session())
+
+        async def run_test():
+            session = pool.get_session(ImageProvider.PEXELS)
+            assert session is not old_session
+            await pool.close()
+            assert old_session.closed
+            assert session.closed
+
+        asyncio.run(run_test())
+
+
+class TestStockImageLookups:
+    def test_repeated_query_uses_cached_alternates(self, tmp_path):
+        async def run_test():
+            STOCK_IMAGE_SEARCH_CACHE.clear()
+            with patch.dict(os.environ, {"IMAGE_PROVIDER": "pexels"}):
+                service = ImageGenerationService(str(tmp_path))
+
+            service.search_images_on_pexels = AsyncMock(
+                return_value=["https://example.com/1.jpg", "https://example.com/2.jpg"]
+            )
+
+            first = await service.get_image_from_pexels("sunset over mountains")
+            second = await service.get_image_from_pexels("sunset over mountains")
+
+            assert first == "https://example.com/1.jpg"
+            assert second == "https://example.com/2.jpg"
+            service.search_images_on_pexels.assert_awaited_once()
+
+        asyncio.run(run_test())
@@ -0,0 +1,99 @@
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from models.user_config import UserConfig
+from utils import user_config as user_config_utils
+from utils.user_config import (
+    get_user_config,
+    invalidate_user_config_cache,
+    save_user_config,
+    update_env_with_user_config,
+)
+
+
+@pytest.fixture
+def user_config_path(tmp_path):
+    path = str(tmp_path / "user_config.json")
+    with patch.dict(os.environ, {"USER_CONFIG_PATH": path}):
+        for key in ("LLM", "OPENAI_API_KEY", "OPENAI_MODEL", "TOOL_CALLS"):
+            os.environ.pop(key, None)
+        invalidate_user_config_cache()
+        yield path
+    invalidate_user_config_cache()
+
+
+def write_config(path: str, config: dict):
+    with open(path, "w") as f:
+        json.dump(config, f)
+
+
+def test_user_config_is_parsed_once_while_file_is_unchanged(user_config_path):
+    write_config(user_config_path, {"LLM": "openai", "OPENAI_MODEL": "gpt-4.1"})
+
+    with patch.object(
+        user_config_utils.json, "load", wraps=json.load
+    ) as json_load:
+        for _ in range(5):
+            assert get_user_config().OPENAI_MODEL == "gpt-4.1"
+
+    assert json_load.call_count == 1
+
+
+def test_user_config_reloads_when_file_is_replaced(user_config_path):
+    write_config(user_config_path, {"LLM": "openai", "OPENAI_MODEL": "gpt-4.1"})
+    assert get_user_config().OPENAI_MODEL == "gpt-4.1"
+
+    # Same size and mtime, only the inode tells the files apart
+    stat = os.stat(user_config_path)
+    replacement_path = f"{user_config_path}.new"
+    write_config(replacement_path, {"LLM": "openai", "OPENAI_MODEL": "gpt-4.2"})
+    os.utime(replacement_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    os.replace(replacement_path, user_config_path)
+
+    assert get_user_config().OPENAI_MODEL == "gpt-4.2"
+
+
+def test_update_env_pushes_only_changed_values(user_config_path):
+    write_config(user_config_path, {"LLM": "openai", "OPENAI_API_KEY": "key-1"})
+
+    with patch.object(
+        user_config_utils.LLM_CLIENT_REGISTRY, "invalidate_stale"
+    ) as invalidate_stale:
+        update_env_with_user_config()
+        assert os.environ["OPENAI_API_KEY"] == "key-1"
+        assert invalidate_stale.call_count == 1
+
+        # Unchanged file, nothing is read or pushed
+        with patch.object(user_config_utils, "get_user_config") as get_config:
+            update_env_with_user_config()
+        get_config.assert_not_called()
+
+        # Forced update with the same values does not touch the env
+        with patch.object(user_config_utils, "set_llm_provider_env") as set_llm:
+            update_env_with_user_config(force=True)
+        set_llm.assert_not_called()
+        assert invalidate_stale.call_count == 1
+
+
+def test_save_user_config_updates_env(user_config_path):
+    write_config(user_config_path, {"LLM": "openai", "OPENAI_API_KEY": "key-1"})
+    update_env_with_user_config()
+
+    save_user_config(
+        UserConfig(LLM="openai", OPENAI_API_KEY="key-2", TOOL_CALLS=True)
+    )
+
+    assert os.environ["OPENAI_API_KEY"] == "key-2"
+    assert os.environ["TOOL_CALLS"] == "True"
+    assert get_user_config().OPENAI_API_KEY == "key-2"
+
+
+def test_missing_user_config_file_falls_back_to_env(user_config_path):
+    os.environ["OPENAI_MODEL"] = "from-env"
+    assert get_user_config().OPENAI_MODEL == "from-env"
+
+    write_config(user_config_path, {"OPENAI_MODEL": "from-file"})
+    assert get_user_config().OPENAI_MODEL == "from-file"
@@ -0,0 +1,23 @@
+import asyncio
+
+from services.warmup_service import WarmupService
+
+
+def test_warmup_service_reports_readiness():
+    def fail():
+        raise RuntimeError("no network")
+
+    async def run():
+        warmup_service = WarmupService([("ok", lambda: None), ("broken", fail)])
+        # Ready when warm-up is disabled
+        assert warmup_service.is_ready()
+
+        warmup_service.start()
+        assert not warmup_service.is_ready()
+        await warmup_service._task
+        return warmup_service.get_status()
+
+    status = asyncio.run(run())
+    assert status["ready"]
+    assert status["steps"] == {"ok": "done", "broken": "failed"}
+    assert status["errors"] == {"broken": "no network"}
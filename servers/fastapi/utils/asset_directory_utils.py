@@ -29,3 +29,53 @@ def get_uploads_directory():
     uploads_directory = os.path.join(app_data_dir, "uploads")
     os.makedirs(uploads_directory, exist_ok=True)
     return uploads_directory
+
+
+def get_asset_cache_directory():
+    app_data_dir = get_app_data_directory_env()
+    if not app_data_dir:
+        app_data_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "app_data"))
+
+    asset_cache_directory = os.path.join(app_data_dir, "cache", "assets")
+    os.makedirs(asset_cache_directory, exist_ok=True)
+    return asset_cache_directory
+
+
+def get_picture_cache_directory():
+    app_data_dir = get_app_data_directory_env()
+    if not app_data_dir:
+        app_data_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "app_data"))
+
+    picture_cache_directory = os.path.join(app_data_dir, "cache", "pictures")
+    os.makedirs(picture_cache_directory, exist_ok=True)
+    return picture_cache_directory
+
+
+def get_parsed_document_cache_directory():
+    app_data_dir = get_app_data_directory_env()
+    if not app_data_dir:
+        app_data_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "app_data"))
+
+    parsed_document_cache_directory = os.path.join(app_data_dir, "cache", "documents")
+    os.makedirs(parsed_document_cache_directory, exist_ok=True)
+    return parsed_document_cache_directory
+
+
+def get_image_generation_cache_directory():
+    app_data_dir = get_app_data_directory_env()
+    if not app_data_dir:
+        app_data_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "app_data"))
+
+    image_generation_cache_directory = os.path.join(app_data_dir, "cache", "images")
+    os.makedirs(image_generation_cache_directory, exist_ok=True)
+    return image_generation_cache_directory
+
+
+def get_icon_query_cache_path():
+    app_data_dir = get_app_data_directory_env()
+    if not app_data_dir:
+        app_data_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "app_data"))
+
+    cache_directory = os.path.join(app_data_dir, "cache")
+    os.makedirs(cache_directory, exist_ok=True)
+    return os.path.join(cache_directory, "icon_queries.npz")
@@ -1,16 +1,98 @@
 import asyncio
+import concurrent.futures
+import threading
 from typing import AsyncGenerator, Callable, Iterator, TypeVar
 
 T = TypeVar("T")
 
+# Number of items the producer thread may read ahead of the consumer
+DEFAULT_MAX_BUFFERED_ITEMS = 32
+
+# Seconds a blocked producer waits between checks that the consumer is still there
+PRODUCER_POLL_INTERVAL = 0.1
+
+_END_OF_ITERATION = object()
+
 
 def iterator_to_async(
     func: Callable[..., Iterator[T]],
+    max_buffered_items: int = DEFAULT_MAX_BUFFERED_ITEMS,
 ) -> Callable[..., AsyncGenerator[T, None]]:
+    """
+    Wraps a function returning a blocking iterator into an async generator.
+
+    The iterator is consumed by a dedicated producer thread which feeds a bounded
+    asyncio.Queue, so the event loop is never blocked while waiting for the next
+    item. The producer pauses once max_buffered_items are waiting to be consumed.
+    """
+
     async def wrapper(*args, **kwargs) -> AsyncGenerator[T, None]:
-        iterator = func(*args, **kwargs)
-        for item in iterator:
-            yield item
-            await asyncio.sleep(0)
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max_buffered_items)
+        stopped = threading.Event()
+
+        def put(item, error=None) -> bool:
+            put_item = queue.put((item, error))
+            try:
+                future = asyncio.run_coroutine_threadsafe(put_item, loop)
+            except RuntimeError:
+                # Event loop is closed, nobody is listening anymore
+                put_item.close()
+                return False
+
+            while True:
+                try:
+                    future.result(timeout=PRODUCER_POLL_INTERVAL)
+                    return True
+                except concurrent.futures.TimeoutError:
+                    # The consumer may be gone without reaching its finally,
+                    # e.g. its loop was closed with the generator still open
+                    if loop.is_closed():
+                        put_item.close()
+                        return False
+                    if stopped.is_set():
+                        future.cancel()
+                        return False
+
+        def produce():
+            iterator = None
+            try:
+                iterator = func(*args, **kwargs)
+                for item in iterator:
+                    if stopped.is_set() or not put(item):
+                        return
+            except BaseException as e:
+                if not stopped.is_set():
+                    put(_END_OF_ITERATION, e)
+                return
+            finally:
+                close = getattr(iterator, "close", None)
+                if close:
+                    try:
+                        close()
+                    except Exception:
+                        pass
+
+            if not stopped.is_set():
+                put(_END_OF_ITERATION)
+
+        producer = threading.Thread(
+            target=produce, name=f"iterator_to_async:{func.__name__}", daemon=True
+        )
+        producer.start()
+
+        try:
+            while True:
+                item, error = await queue.get()
+                if error is not None:
+                    raise error
+                if item is _END_OF_ITERATION:
+                    return
+                yield item
+        finally:
+            stopped.set()
+            # Unblock the producer if it is waiting for free space in the queue
+            while not queue.empty():
+                queue.get_nowait()
 
     return wrapper
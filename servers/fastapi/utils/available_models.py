@@ -1,8 +1,12 @@
-from anthropic import AsyncAnthropic
 from openai import AsyncOpenAI
-import google.generativeai as genai
 import traceback
 
+from utils.lazy_proxy import lazy_import
+
+# Imported on first use, these SDKs take over a second each to import
+anthropic = lazy_import("anthropic")
+genai = lazy_import("google.generativeai")
+
 
 async def list_available_openai_compatible_models(url: str, api_key: str) -> list[str]:
     client = AsyncOpenAI(api_key=api_key, base_url=url)
@@ -13,7 +17,7 @@ async def list_available_openai_compatible_models(url: str, api_key: str) -> lis
 
 
 async def list_available_anthropic_models(api_key: str) -> list[str]:
-    client = AsyncAnthropic(api_key=api_key)
+    client = anthropic.AsyncAnthropic(api_key=api_key)
     return list(map(lambda x: x.id, (await client.models.list(limit=50)).data))
 
 
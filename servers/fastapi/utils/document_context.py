@@ -0,0 +1,153 @@
+import asyncio
+import math
+from typing import List, Optional
+
+from models.document_chunk import DocumentChunk
+from models.document_context import DocumentContext
+from services.score_based_chunker import ScoreBasedChunker
+from utils.get_env import get_document_context_max_tokens_env
+from utils.parsers import parse_int_or_none
+
+# Rough average for English text with the tokenizers of the supported models
+CHARS_PER_TOKEN = 4
+
+DEFAULT_DOCUMENT_CONTEXT_MAX_TOKENS = 24000
+
+# Leftover budget below this is not worth a trimmed section
+MIN_TRIMMED_SECTION_TOKENS = 64
+
+DOCUMENT_SEPARATOR = "\n\n"
+
+
+def estimate_tokens(text: str) -> int:
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def get_document_context_max_tokens() -> Optional[int]:
+    """Returns the token budget of the documents context, None when unlimited."""
+    max_tokens = parse_int_or_none(get_document_context_max_tokens_env())
+    if max_tokens is None:
+        return DEFAULT_DOCUMENT_CONTEXT_MAX_TOKENS
+    return max_tokens if max_tokens > 0 else None
+
+
+def trim_to_tokens(text: str, max_tokens: int) -> str:
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    if len(text) <= max_chars:
+        return text
+
+    text = text[:max_chars]
+    # End on a line, or at least a word, when one is close enough
+    for separator in ("\n", " "):
+        index = text.rfind(separator)
+        if index > max_chars // 2:
+            return text[:index].rstrip()
+    return text.rstrip()
+
+
+def get_document_sections(text: str) -> List[DocumentChunk]:
+    """
+    Splits a markdown document into its heading sections, scored by
+    ScoreBasedChunker. Text before the first heading is kept as a section
+    that always ranks first.
+    """
+    chunker = ScoreBasedChunker()
+    heading_offsets = chunker.get_heading_offsets(text)
+    headings = [heading for heading, _, _ in heading_offsets]
+    heading_scores = chunker.score_headings(headings)
+    sections = chunker.get_chunks_from_headings(
+        text, headings, heading_scores, len(headings), heading_offsets
+    )
+
+    preamble = (text[: heading_offsets[0][1]] if heading_offsets else text).strip()
+    if preamble:
+        sections.insert(
+            0,
+            DocumentChunk(
+                heading="", content=preamble, heading_index=-1, score=math.inf
+            ),
+        )
+    return sections
+
+
+def get_section_text(section: DocumentChunk) -> str:
+    if not section.heading:
+        return section.content
+    return f"{section.heading}\n{section.content}".strip()
+
+
+def fit_document_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Keeps the best scored sections of the document that fit in max_tokens,
+    trimming one more into the leftover budget, in document order.
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return text
+
+    sections = get_document_sections(text)
+    section_texts = [get_section_text(section) for section in sections]
+    # Counting the separator keeps the joined text within budget
+    section_tokens = [
+        estimate_tokens(section_text + DOCUMENT_SEPARATOR)
+        for section_text in section_texts
+    ]
+    ranked = sorted(range(len(sections)), key=lambda i: (-sections[i].score, i))
+
+    selected = {}
+    remaining = max_tokens
+    for i in ranked:
+        if section_tokens[i] <= remaining:
+            selected[i] = section_texts[i]
+            remaining -= section_tokens[i]
+
+    skipped = [i for i in ranked if i not in selected]
+    if skipped and remaining >= MIN_TRIMMED_SECTION_TOKENS:
+        selected[skipped[0]] = trim_to_tokens(
+            section_texts[skipped[0]], remaining - 1
+        )
+
+    return DOCUMENT_SEPARATOR.join(selected[i] for i in sorted(selected))
+
+
+def get_document_budgets(document_tokens: List[int], max_tokens: int) -> List[int]:
+    """Splits max_tokens evenly, handing what short documents leave to longer ones."""
+    budgets = [0] * len(document_tokens)
+    remaining = max_tokens
+    by_size = sorted(range(len(document_tokens)), key=lambda i: document_tokens[i])
+    for position, i in enumerate(by_size):
+        budgets[i] = min(document_tokens[i], remaining // (len(by_size) - position))
+        remaining -= budgets[i]
+    return budgets
+
+
+def build_document_context(
+    documents: List[str], max_tokens: Optional[int] = None
+) -> DocumentContext:
+    """Joins the parsed documents, keeping their best sections within max_tokens."""
+    documents = [document for document in documents if document]
+    document_tokens = [estimate_tokens(document) for document in documents]
+    total_tokens = estimate_tokens(DOCUMENT_SEPARATOR.join(documents))
+
+    if max_tokens is not None and total_tokens > max_tokens:
+        # One token per separator between the documents
+        budgets = get_document_budgets(
+            document_tokens, max(0, max_tokens - len(documents))
+        )
+        documents = [
+            fit_document_to_tokens(document, budget)
+            for document, budget in zip(documents, budgets)
+        ]
+
+    text = DOCUMENT_SEPARATOR.join(document for document in documents if document)
+    return DocumentContext(
+        text=text,
+        tokens=estimate_tokens(text),
+        document_tokens=total_tokens,
+        max_tokens=max_tokens,
+    )
+
+
+async def get_document_context(documents: List[str]) -> DocumentContext:
+    return await asyncio.to_thread(
+        build_document_context, documents, get_document_context_max_tokens()
+    )
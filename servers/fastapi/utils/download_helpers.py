@@ -1,7 +1,7 @@
 import asyncio
 import os
 import mimetypes
-from typing import List, Optional
+from typing import Dict, List, Optional
 from urllib.parse import urlparse
 import ssl
 import certifi
@@ -10,69 +10,143 @@ import aiohttp
 
 import uuid
 
+from services.asset_download_cache import AssetDownloadCache
+
 CHUNK_SIZE = 1024 * 1024  # 1MB
 
+# Max simultaneous connections to a single host while downloading
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 8
+
+
+def get_filename_from_response(url: str, response: aiohttp.ClientResponse) -> str:
+    """
+    Uses the url path when it has an extension, otherwise the GET response
+    headers, so no separate HEAD request is needed.
+    """
+    filename = os.path.basename(urlparse(url).path)
+    if filename and "." in filename:
+        return filename
+
+    content_disposition = response.headers.get("Content-Disposition", "")
+    if "filename=" in content_disposition:
+        return os.path.basename(
+            content_disposition.split("filename=")[1].split(";")[0].strip("\"' ")
+        )
+
+    content_type = response.headers.get("Content-Type", "")
+    if content_type:
+        extension = mimetypes.guess_extension(content_type.split(";")[0].strip())
+        if extension:
+            return f"{uuid.uuid4()}{extension}"
+
+    return filename or str(uuid.uuid4())
+
+
+def _open_new_file(download_directory: str, filename: str):
+    save_path = os.path.join(download_directory, filename)
+    try:
+        return save_path, open(save_path, "xb")
+    except FileExistsError:
+        # Different urls may end with the same file name
+        save_path = os.path.join(download_directory, f"{uuid.uuid4()}-{filename}")
+        return save_path, open(save_path, "xb")
+
 
 async def download_file(
-    session: aiohttp.ClientSession, url: str, download_directory: str
+    session: aiohttp.ClientSession,
+    url: str,
+    download_directory: str,
+    cache: Optional[AssetDownloadCache] = None,
 ) -> Optional[str]:
     try:
-        os.makedirs(download_directory, exist_ok=True)
-
-        parsed_url = urlparse(url)
-        filename = os.path.basename(parsed_url.path)
-
-        if not filename or "." not in filename:
-            async with aiohttp.ClientSession(trust_env=True) as session:
-                async with session.head(url) as response:
-                    if response.status == 200:
-                        content_disposition = response.headers.get(
-                            "Content-Disposition", ""
-                        )
-                        if "filename=" in content_disposition:
-                            filename = content_disposition.split("filename=")[1].strip(
-                                "\"'"
-                            )
-                        else:
-                            content_type = response.headers.get("Content-Type", "")
-                            if content_type:
-                                extension = mimetypes.guess_extension(
-                                    content_type.split(";")[0]
-                                )
-                                if extension:
-                                    filename = f"{uuid.uuid4()}{extension}"
-
-        filename = filename or str(uuid.uuid4())
-        save_path = os.path.join(download_directory, filename)
-
-        async with aiohttp.ClientSession(trust_env=True) as session:
-            async with session.get(url) as response:
-                if response.status == 200:
-                    with open(save_path, "wb") as file:
-                        async for chunk in response.content.iter_chunked(8192):
-                            file.write(chunk)
-                    print(f"File downloaded successfully: {save_path}")
+        await asyncio.to_thread(os.makedirs, download_directory, exist_ok=True)
+
+        cached = await asyncio.to_thread(cache.get, url) if cache else None
+        if cached and cached.is_fresh():
+            save_path = await asyncio.to_thread(
+                cache.copy_to, cached, download_directory
+            )
+            if save_path:
+                return save_path
+
+        async with session.get(
+            url, headers=cached.get_revalidation_headers() if cached else None
+        ) as response:
+            if response.status == 304 and cached:
+                save_path = await asyncio.to_thread(
+                    cache.copy_to, cached, download_directory, response.headers
+                )
+                if save_path:
                     return save_path
-                else:
-                    print(f"Failed to download file. HTTP status: {response.status}")
-                    return None
+                # Evicted while revalidating, download it again
+                return await download_file(session, url, download_directory)
+
+            if response.status != 200:
+                print(f"Failed to download file. HTTP status: {response.status}")
+                return None
+
+            filename = get_filename_from_response(url, response)
+            save_path, file = await asyncio.to_thread(
+                _open_new_file, download_directory, filename
+            )
+            try:
+                async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                    await asyncio.to_thread(file.write, chunk)
+            finally:
+                await asyncio.to_thread(file.close)
+
+        if cache:
+            await asyncio.to_thread(cache.put, url, save_path, response.headers)
+
+        print(f"File downloaded successfully: {save_path}")
+        return save_path
 
     except Exception as e:
         print(f"Error downloading file from {url}: {e}")
         return None
 
 
+def create_download_session(
+    max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+) -> aiohttp.ClientSession:
+    ssl_context = ssl.create_default_context(cafile=certifi.where())
+    connector = aiohttp.TCPConnector(
+        ssl=ssl_context, limit_per_host=max_connections_per_host
+    )
+    return aiohttp.ClientSession(connector=connector, trust_env=True)
+
+
 async def download_files(
-    urls: List[str], download_directory: str
+    urls: List[str],
+    download_directory: str,
+    session: Optional[aiohttp.ClientSession] = None,
+    cache: Optional[AssetDownloadCache] = None,
 ) -> List[Optional[str]]:
+    """
+    Downloads urls over one pooled session, each distinct url only once.
+    Returns the saved path (or None on failure) for every url in order.
+    Urls found in cache are served from disk or revalidated.
+    """
     print(f"Starting download of {len(urls)} files to {download_directory}")
 
-    ssl_context = ssl.create_default_context(cafile=certifi.where())
-    connector = aiohttp.TCPConnector(ssl=ssl_context)
+    unique_urls = list(dict.fromkeys(urls))
+
+    if session:
+        paths = await asyncio.gather(
+            *[download_file(session, url, download_directory, cache)
+            for url in unique_urls]
+        )
+    else:
+        async with create_download_session() as session:
+            paths = await asyncio.gather(
+                *[
+                    download_file(session, url, download_directory, cache)
+                    for url in unique_urls
+                ]
+            )
 
-    async with aiohttp.ClientSession(connector=connector) as session:
-        tasks = [download_file(session, url, download_directory) for url in urls]
-        results = await asyncio.gather(*tasks)
+    downloaded: Dict[str, Optional[str]] = dict(zip(unique_urls, paths))
+    results = [downloaded[url] for url in urls]
 
     successful_downloads = [res for res in results if res is not None]
     print(
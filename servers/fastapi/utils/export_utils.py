@@ -1,7 +1,7 @@
 import json
 import os
 import aiohttp
-from typing import Literal
+from typing import Literal, Optional
 import uuid
 from fastapi import HTTPException
 from pathvalidate import sanitize_filename
@@ -15,7 +15,10 @@ import uuid
 
 
 async def export_presentation(
-    presentation_id: uuid.UUID, title: str, export_as: Literal["pptx", "pdf"]
+    presentation_id: uuid.UUID,
+    title: str,
+    export_as: Literal["pptx", "pdf"],
+    image_dpi: Optional[int] = None,
 ) -> PresentationAndPath:
     if export_as == "pptx":
 
@@ -36,7 +39,7 @@ async def export_presentation(
         # Create PPTX file using the converted model
         pptx_model = PptxPresentationModel(**pptx_model_data)
         temp_dir = TEMP_FILE_SERVICE.create_temp_dir()
-        pptx_creator = PptxPresentationCreator(pptx_model, temp_dir)
+        pptx_creator = PptxPresentationCreator(pptx_model, temp_dir, image_dpi=image_dpi)
         await pptx_creator.create_ppt()
 
         export_directory = get_exports_directory()
@@ -1,4 +1,7 @@
+import hashlib
+from functools import lru_cache
 import os
+import shutil
 from typing import BinaryIO
 import uuid
 
@@ -42,3 +45,29 @@ def set_file_ext(file_path: str, ext: str) -> str:
     if get_file_ext_or_none(file_path):
         return f"{os.path.splitext(file_path)[0]}{ext}"
     return f"{file_path}{ext}"
+
+
+@lru_cache(maxsize=1024)
+def _get_file_hash(path: str, mtime_ns: int, size: int) -> str:
+    file_hash = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            file_hash.update(block)
+    return file_hash.hexdigest()
+
+
+def get_file_hash(path: str) -> str:
+    """Returns the sha256 of the file content, memoized while the file is unchanged."""
+    stat = os.stat(path)
+    return _get_file_hash(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+def link_or_copy_file(source: str, destination: str):
+    """
+    Hard links source to destination, falling back to a copy across devices.
+    Removing either path later never affects the other one.
+    """
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copyfile(source, destination)
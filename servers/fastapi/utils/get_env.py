@@ -116,3 +116,118 @@ def get_dall_e_3_quality_env():
 # Gpt Image 1.5 Quality
 def get_gpt_image_1_5_quality_env():
     return os.getenv("GPT_IMAGE_1_5_QUALITY")
+
+
+# Max concurrent slide content LLM calls per process
+def get_slide_content_concurrency_env():
+    return os.getenv("SLIDE_CONTENT_CONCURRENCY")
+
+
+# Max size of the generated images cache, 0 disables it
+def get_image_generation_cache_max_size_mb_env():
+    return os.getenv("IMAGE_GENERATION_CACHE_MAX_SIZE_MB")
+
+
+# Max size of the downloaded export assets cache, 0 disables it
+def get_asset_download_cache_max_size_mb_env():
+    return os.getenv("ASSET_DOWNLOAD_CACHE_MAX_SIZE_MB")
+
+
+# Worker processes used to build PPTX exports, 0 runs them in a thread
+def get_pptx_export_workers_env():
+    return os.getenv("PPTX_EXPORT_WORKERS")
+
+
+# Worker processes used to parse uploaded documents, 0 runs them in a thread
+def get_document_parsing_workers_env():
+    return os.getenv("DOCUMENT_PARSING_WORKERS")
+
+
+# Load the document parsers during startup warm-up, off unless set to true
+def get_document_parsing_prewarm_env():
+    return os.getenv("DOCUMENT_PARSING_PREWARM")
+
+
+# Token budget of the uploaded documents passed to outline generation, 0 for no limit
+def get_document_context_max_tokens_env():
+    return os.getenv("DOCUMENT_CONTEXT_MAX_TOKENS")
+
+
+# Token budget of the source document passages added to each slide prompt, 0 disables them
+def get_slide_document_context_max_tokens_env():
+    return os.getenv("SLIDE_DOCUMENT_CONTEXT_MAX_TOKENS")
+
+
+# Number of source document passages retrieved for each slide
+def get_slide_document_context_top_k_env():
+    return os.getenv("SLIDE_DOCUMENT_CONTEXT_TOP_K")
+
+
+# Max size of the parsed documents cache, 0 disables it
+def get_parsed_document_cache_max_size_mb_env():
+    return os.getenv("PARSED_DOCUMENT_CACHE_MAX_SIZE_MB")
+
+
+# Worker processes used to render PDF pages, 0 runs them in a thread
+def get_pdf_rendering_workers_env():
+    return os.getenv("PDF_RENDERING_WORKERS")
+
+
+# Resolution PDF pages are rendered at for slide screenshots
+def get_pdf_rendering_dpi_env():
+    return os.getenv("PDF_RENDERING_DPI")
+
+
+# Max width and height in pixels of rendered PDF pages, unset keeps the DPI size
+def get_pdf_rendering_max_size_env():
+    return os.getenv("PDF_RENDERING_MAX_SIZE")
+
+
+# Long-lived LibreOffice workers converting PPTX uploads to PDF
+def get_libreoffice_workers_env():
+    return os.getenv("LIBREOFFICE_WORKERS")
+
+
+# Conversions after which a LibreOffice worker is restarted
+def get_libreoffice_max_jobs_per_worker_env():
+    return os.getenv("LIBREOFFICE_MAX_JOBS_PER_WORKER")
+
+
+# Seconds a single LibreOffice conversion may take before its worker is killed
+def get_libreoffice_conversion_timeout_env():
+    return os.getenv("LIBREOFFICE_CONVERSION_TIMEOUT")
+
+
+# Start the LibreOffice workers during startup warm-up, off unless set to true
+def get_libreoffice_prewarm_env():
+    return os.getenv("LIBREOFFICE_PREWARM")
+
+
+# Max size of the transformed export pictures cache, 0 disables it
+def get_picture_transform_cache_max_size_mb_env():
+    return os.getenv("PICTURE_TRANSFORM_CACHE_MAX_SIZE_MB")
+
+
+# Resolution PPTX export pictures are resampled to, unset embeds them at full size
+def get_pptx_export_image_dpi_env():
+    return os.getenv("PPTX_EXPORT_IMAGE_DPI")
+
+
+# Icon search index, chroma (default) or numpy (in memory)
+def get_icon_search_backend_env():
+    return os.getenv("ICON_SEARCH_BACKEND")
+
+
+# Icon queries whose embeddings and results are kept in memory, 0 disables it
+def get_icon_query_cache_max_entries_env():
+    return os.getenv("ICON_QUERY_CACHE_MAX_ENTRIES")
+
+
+# Keep the icon query cache on disk across restarts
+def get_icon_query_cache_persist_env():
+    return os.getenv("ICON_QUERY_CACHE_PERSIST")
+
+
+# Preload heavy services in the background on startup, off unless set to true
+def get_startup_warmup_env():
+    return os.getenv("STARTUP_WARMUP")
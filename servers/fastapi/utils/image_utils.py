@@ -1,5 +1,7 @@
-from typing import List
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
+import numpy as np
 from PIL import Image, ImageDraw
 
 from models.pptx_models import PptxObjectFitEnum, PptxObjectFitModel
@@ -256,3 +258,171 @@ def fit_image(
         return image.resize((width, height), Image.LANCZOS)
 
     return image
+
+
+@lru_cache(maxsize=64)
+def _get_corner_circle(radius: int) -> np.ndarray:
+    # Drawn exactly like round_image_corners so the edges match pixel for pixel
+    circle = Image.new("L", (radius * 2, radius * 2), 0)
+    draw = ImageDraw.Draw(circle)
+    draw.ellipse((0, 0, radius * 2 - 1, radius * 2 - 1), fill=255)
+    return np.asarray(circle) == 0
+
+
+def _get_rounded_corners(
+    width: int, height: int, radii: List[int]
+) -> List[Tuple[Tuple[int, int, int, int], np.ndarray]]:
+    """
+    Returns (box, outside) for every rounded corner, where outside marks the
+    pixels of the box that round_image_corners makes transparent.
+    """
+    if len(radii) != 4:
+        raise ValueError(
+            "Image Border Radius - radii must contain exactly 4 values for each corner"
+        )
+
+    max_radius = min(width // 2, height // 2)
+    corners = []
+    for i, radius in enumerate([min(radius, max_radius) for radius in radii]):
+        if radius <= 0:
+            continue
+        outside = _get_corner_circle(radius)
+        if i == 0:  # top-left
+            corners.append(((0, 0, radius, radius), outside[:radius, :radius]))
+        elif i == 1:  # top-right
+            corners.append(
+                ((width - radius, 0, width, radius), outside[:radius, radius:])
+            )
+        elif i == 2:  # bottom-right
+            corners.append(
+                (
+                    (width - radius, height - radius, width, height),
+                    outside[radius:, radius:],
+                )
+            )
+        else:  # bottom-left
+            corners.append(
+                ((0, height - radius, radius, height), outside[radius:, :radius])
+            )
+    return corners
+
+
+def _get_circle_mask(width: int, height: int) -> np.ndarray:
+    # Same ellipse as create_circle_image
+    mask = Image.new("L", (width, height), 0)
+    draw = ImageDraw.Draw(mask)
+    center_x = width // 2
+    center_y = height // 2
+    radius = min(width, height) // 2
+    draw.ellipse(
+        (
+            center_x - radius,
+            center_y - radius,
+            center_x + radius,
+            center_y + radius,
+        ),
+        fill=255,
+    )
+    return np.asarray(mask) != 0
+
+
+def transform_image(
+    image: Image.Image,
+    width: int,
+    height: int,
+    clip: bool = False,
+    object_fit: Optional[PptxObjectFitModel] = None,
+    border_radius: Optional[List[int]] = None,
+    circle: bool = False,
+    invert: bool = False,
+    opacity: Optional[float] = None,
+) -> Image.Image:
+    """
+    Produces the same pixels as applying round_image_corners, fit_image or
+    clip_image, round_image_corners, create_circle_image, invert_image and
+    set_image_opacity in that order.
+
+    Resizing and cropping still go through PIL. Corner rounding before the
+    resize only touches the corner boxes, and all masking, inversion and
+    opacity happen in one pass over a NumPy array instead of full size masks,
+    composites and per pixel Python loops.
+    """
+    image = image.convert("RGBA")
+
+    # Rounding before the resize matters for contain, where corners stay visible
+    if border_radius:
+        for box, outside in _get_rounded_corners(*image.size, border_radius):
+            corner = np.array(image.crop(box))
+            corner[..., 3][outside] = 0
+            image.paste(Image.fromarray(corner, "RGBA"), box[:2])
+
+    if object_fit:
+        image = fit_image(image, width, height, object_fit)
+    elif clip:
+        image = clip_image(image, width, height)
+
+    if not (border_radius or circle or invert or opacity):
+        return image
+
+    pixels = np.array(image.convert("RGBA"))
+    alpha = pixels[..., 3]
+
+    if border_radius:
+        for (left, top, right, bottom), outside in _get_rounded_corners(
+            image.width, image.height, border_radius
+        ):
+            alpha[top:bottom, left:right][outside] = 0
+
+    if circle:
+        np.multiply(
+            pixels,
+            _get_circle_mask(image.width, image.height)[..., None],
+            out=pixels,
+            casting="unsafe",
+        )
+
+    if invert:
+        # Fully transparent pixels become (0, 0, 0, 0)
+        visible = (alpha != 0)[..., None]
+        rgb = pixels[..., :3]
+        np.subtract(255, rgb, out=rgb)
+        np.multiply(rgb, visible, out=rgb, casting="unsafe")
+
+    if opacity:
+        opacity = max(0.0, min(1.0, opacity))
+        opacity_lut = np.array([int(x * opacity) for x in range(256)], np.uint8)
+        pixels[..., 3] = opacity_lut[alpha]
+
+    return Image.fromarray(pixels, "RGBA")
+
+
+def has_transparency(image: Image.Image) -> bool:
+    if image.mode == "P":
+        return "transparency" in image.info
+    if image.mode in ("RGBA", "LA", "PA", "La", "RGBa"):
+        return image.getchannel("A").getextrema()[0] < 255
+    return "transparency" in image.info
+
+
+def downscale_image(image: Image.Image, width: int, height: int) -> Image.Image:
+    """
+    Resamples each axis of the image down to at most width x height pixels.
+    Pictures are stretched to their box when embedded, so the aspect ratio
+    doesn't need to be kept.
+    """
+    size = (min(image.width, max(1, width)), min(image.height, max(1, height)))
+    if size == image.size:
+        return image
+    if image.mode not in ("RGB", "RGBA", "L", "LA"):
+        image = image.convert("RGBA" if has_transparency(image) else "RGB")
+    return image.resize(size, Image.LANCZOS)
+
+
+def get_picture_format(image: Image.Image) -> str:
+    """
+    JPEG for photos, PNG for pictures with transparency and for flat graphics
+    (logos, charts, icons) with at most 256 colors, which JPEG would blur.
+    """
+    if has_transparency(image) or image.getcolors(256) is not None:
+        return "PNG"
+    return "JPEG"
@@ -0,0 +1,53 @@
+import importlib
+import threading
+from typing import Callable, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class LazyProxy(Generic[T]):
+    """
+    Stands in for a singleton that is expensive to build. The instance is
+    created by factory on first attribute access, or ahead of time by calling
+    get(), e.g. from the startup warm-up task. Thread safe.
+    """
+
+    def __init__(self, factory: Callable[[], T]):
+        object.__setattr__(self, "_factory", factory)
+        object.__setattr__(self, "_instance", None)
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    def get(self) -> T:
+        instance: Optional[T] = self._instance
+        if instance is None:
+            with self._lock:
+                instance = self._instance
+                if instance is None:
+                    instance = self._factory()
+                    object.__setattr__(self, "_instance", instance)
+        return instance
+
+    def is_initialized(self) -> bool:
+        return self._instance is not None
+
+    def __getattr__(self, name: str):
+        return getattr(self.get(), name)
+
+    def __setattr__(self, name: str, value):
+        setattr(self.get(), name, value)
+
+    def __delattr__(self, name: str):
+        delattr(self.get(), name)
+
+    def __repr__(self) -> str:
+        return f"LazyProxy({getattr(self._factory, '__name__', self._factory)})"
+
+
+def lazy_import(module_name: str):
+    """Returns a proxy of the module that imports it on first attribute access."""
+
+    def import_module():
+        return importlib.import_module(module_name)
+
+    import_module.__name__ = module_name
+    return LazyProxy(import_module)
@@ -4,6 +4,7 @@ from models.llm_message import LLMSystemMessage, LLMUserMessage
 from models.presentation_layout import SlideLayoutModel
 from models.presentation_outline_model import SlideOutlineModel
 from services.llm_client import LLMClient
+from services.llm_concurrency_limiter import SLIDE_CONTENT_LIMITER
 from utils.llm_client_error_handler import handle_llm_client_exceptions
 from utils.llm_provider import get_model
 from utils.schema_utils import add_field_in_schema, remove_fields_from_schema
@@ -64,8 +65,10 @@ def get_system_prompt(
     """
 
 
-def get_user_prompt(outline: str, language: str):
-    return f"""
+def get_user_prompt(
+    outline: str, language: str, document_context: Optional[str] = None
+):
+    user_prompt = f"""
         ## Current Date and Time
         {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
 
@@ -78,6 +81,14 @@ def get_user_prompt(outline: str, language: str):
         ## Slide Outline
         {outline}
     """
+    if not document_context:
+        return user_prompt
+
+    return f"""{user_prompt}
+        ## Source Document Excerpts
+        Use facts and figures from these excerpts where they support the outline.
+        {document_context}
+    """
 
 
 def get_messages(
@@ -86,6 +97,7 @@ def get_messages(
     tone: Optional[str] = None,
     verbosity: Optional[str] = None,
     instructions: Optional[str] = None,
+    document_context: Optional[str] = None,
 ):
 
     return [
@@ -93,7 +105,7 @@ def get_messages(
             content=get_system_prompt(tone, verbosity, instructions),
         ),
         LLMUserMessage(
-            content=get_user_prompt(outline, language),
+            content=get_user_prompt(outline, language, document_context),
         ),
     ]
 
@@ -105,7 +117,12 @@ async def get_slide_content_from_type_and_outline(
     tone: Optional[str] = None,
     verbosity: Optional[str] = None,
     instructions: Optional[str] = None,
+    document_context: Optional[str] = None,
 ):
+    """
+    document_context holds the source document passages retrieved for the
+    slide, see get_slide_document_contexts.
+    """
     client = LLMClient()
     model = get_model()
 
@@ -126,17 +143,20 @@ async def get_slide_content_from_type_and_outline(
     )
 
     try:
-        response = await client.generate_structured(
-            model=model,
-            messages=get_messages(
-                outline.content,
-                language,
-                tone,
-                verbosity,
-                instructions,
-            ),
-            response_format=response_schema,
-            strict=False,
+        response = await SLIDE_CONTENT_LIMITER.run(
+            lambda: client.generate_structured(
+                model=model,
+                messages=get_messages(
+                    outline.content,
+                    language,
+                    tone,
+                    verbosity,
+                    instructions,
+                    document_context,
+                ),
+                response_format=response_schema,
+                strict=False,
+            )
         )
         return response
 
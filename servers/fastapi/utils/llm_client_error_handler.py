@@ -1,11 +1,14 @@
 from fastapi import HTTPException
-from anthropic import APIError as AnthropicAPIError
 from openai import APIError as OpenAIAPIError
 from google.genai.errors import APIError as GoogleAPIError
 import traceback
 
 
 def handle_llm_client_exceptions(e: Exception) -> HTTPException:
+    # Imported here as anthropic takes seconds to import and is only needed
+    # to classify errors
+    from anthropic import APIError as AnthropicAPIError
+
     traceback.print_exc()
     if isinstance(e, OpenAIAPIError):
         return HTTPException(status_code=500, detail=f"OpenAI API error: {e.message}")
@@ -3,21 +3,34 @@ from typing import List, Tuple
 from models.image_prompt import ImagePrompt
 from models.sql.image_asset import ImageAsset
 from models.sql.slide import SlideModel
-from services.icon_finder_service import ICON_FINDER_SERVICE
+from services.icon_finder_service import get_icon_finder_service
 from services.image_generation_service import ImageGenerationService
 from utils.asset_directory_utils import get_images_directory
 from utils.dict_utils import get_dict_at_path, get_dict_paths_with_key, set_dict_at_path
 
 
+async def search_icons_many(queries: List[str]) -> List[List[str]]:
+    icon_finder_service = await get_icon_finder_service()
+    return await icon_finder_service.search_icons_many(queries)
+
+
 async def process_slide_and_fetch_assets(
     image_generation_service: ImageGenerationService,
     slide: SlideModel,
+    fetch_icons: bool = True,
 ) -> List[ImageAsset]:
+    """
+    Generates the images of the slide and resolves its icons, unless fetch_icons
+    is False, in which case the caller resolves them in a batch with
+    process_slides_and_fetch_icons.
+    """
 
     async_tasks = []
 
     image_paths = get_dict_paths_with_key(slide.content, "__image_prompt__")
-    icon_paths = get_dict_paths_with_key(slide.content, "__icon_query__")
+    icon_paths = (
+        get_dict_paths_with_key(slide.content, "__icon_query__") if fetch_icons else []
+    )
 
     for image_path in image_paths:
         __image_prompt__parent = get_dict_at_path(slide.content, image_path)
@@ -29,13 +42,15 @@ async def process_slide_and_fetch_assets(
             )
         )
 
-    for icon_path in icon_paths:
-        __icon_query__parent = get_dict_at_path(slide.content, icon_path)
-        async_tasks.append(
-            ICON_FINDER_SERVICE.search_icons(__icon_query__parent["__icon_query__"])
-        )
+    icon_queries = [
+        get_dict_at_path(slide.content, icon_path)["__icon_query__"]
+        for icon_path in icon_paths
+    ]
+    async_tasks.append(search_icons_many(icon_queries))
 
     results = await asyncio.gather(*async_tasks)
+    # Icon results of all queries come last, as a single list
+    results = results[:-1] + results[-1]
     results.reverse()
 
     return_assets = []
@@ -62,6 +77,27 @@ async def process_slide_and_fetch_assets(
     return return_assets
 
 
+async def process_slides_and_fetch_icons(slides: List[SlideModel]):
+    """
+    Resolves the icons of all slides with one batched search, which mutates
+    the slides.
+    """
+    icon_dicts = []
+    for slide in slides:
+        for icon_path in get_dict_paths_with_key(slide.content, "__icon_query__"):
+            icon_dicts.append(get_dict_at_path(slide.content, icon_path))
+
+    icon_results = await search_icons_many(
+        [icon_dict["__icon_query__"] for icon_dict in icon_dicts]
+    )
+    for icon_dict, icon_result in zip(icon_dicts, icon_results):
+        if icon_result and len(icon_result) > 0:
+            icon_dict["__icon_url__"] = icon_result[0]
+        else:
+            # Fallback to placeholder if no icon found
+            icon_dict["__icon_url__"] = "/static/icons/placeholder.svg"
+
+
 async def process_old_and_new_slides_and_fetch_assets(
     image_generation_service: ImageGenerationService,
     old_slide_content: dict,
@@ -105,8 +141,8 @@ async def process_old_and_new_slides_and_fetch_assets(
     async_image_fetch_tasks = []
     new_images_fetch_status = []
 
-    # Creates async tasks for fetching new icons
-    async_icon_fetch_tasks = []
+    # Collects queries of new icons to fetch them in one batch
+    new_icon_queries = []
     new_icons_fetch_status = []
 
     # Creates async tasks for fetching new images
@@ -140,13 +176,13 @@ async def process_old_and_new_slides_and_fetch_assets(
             new_icons_fetch_status.append(False)
             continue
 
-        async_icon_fetch_tasks.append(
-            ICON_FINDER_SERVICE.search_icons(new_icon["__icon_query__"])
-        )
+        new_icon_queries.append(new_icon["__icon_query__"])
         new_icons_fetch_status.append(True)
 
-    new_images = await asyncio.gather(*async_image_fetch_tasks)
-    new_icons = await asyncio.gather(*async_icon_fetch_tasks)
+    new_images, new_icons = await asyncio.gather(
+        asyncio.gather(*async_image_fetch_tasks),
+        search_icons_many(new_icon_queries),
+    )
 
     # list of new assets
     new_assets = []
@@ -162,9 +198,11 @@ async def process_old_and_new_slides_and_fetch_assets(
                 image_url = fetched_image
             new_image_dicts[i]["__image_url__"] = image_url
 
-    for i, new_icon in enumerate(new_icons):
-        if new_icons_fetch_status[i]:
-            icon_result = new_icons[i]
+    # Results only cover the fetched icons
+    new_icons = iter(new_icons)
+    for i, fetch_status in enumerate(new_icons_fetch_status):
+        if fetch_status:
+            icon_result = next(new_icons)
             if icon_result and len(icon_result) > 0:
                 new_icon_dicts[i]["__icon_url__"] = icon_result[0]
             else:
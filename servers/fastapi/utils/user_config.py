@@ -1,7 +1,10 @@
 import os
 import json
+import threading
+from typing import Callable, List, Optional, Tuple
 
 from models.user_config import UserConfig
+from services.llm_client_registry import LLM_CLIENT_REGISTRY
 from utils.get_env import (
     get_anthropic_api_key_env,
     get_anthropic_model_env,
@@ -58,24 +61,69 @@ from utils.set_env import (
 )
 
 
-def get_user_config():
+def get_user_config_path() -> str:
     user_config_path = get_user_config_path_env()
 
     if not user_config_path:
         app_data_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "app_data"))
         user_config_path = os.path.join(app_data_dir, "user_config.json")
-        # print(f"USER_CONFIG_PATH not set, using default: {user_config_path}")
 
+    return user_config_path
+
+
+def _get_user_config_file_signature(user_config_path: str) -> tuple:
+    try:
+        stat = os.stat(user_config_path)
+    except OSError:
+        return (user_config_path, None)
+    return (user_config_path, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+_USER_CONFIG_CACHE_LOCK = threading.Lock()
+# Signature of the user config file -> config parsed from it
+_USER_CONFIG_FILE_CACHE: Optional[Tuple[tuple, UserConfig]] = None
+# Signature of the user config file last pushed to the environment
+_USER_CONFIG_ENV_SIGNATURE: Optional[tuple] = None
+
+
+def invalidate_user_config_cache():
+    global _USER_CONFIG_FILE_CACHE, _USER_CONFIG_ENV_SIGNATURE
+
+    with _USER_CONFIG_CACHE_LOCK:
+        _USER_CONFIG_FILE_CACHE = None
+        _USER_CONFIG_ENV_SIGNATURE = None
+
+
+def load_user_config_file(user_config_path: Optional[str] = None) -> UserConfig:
+    """
+    Returns the config saved in the user config file, parsed again only when
+    the file's inode, mtime or size changes.
+    """
+    global _USER_CONFIG_FILE_CACHE
+
+    user_config_path = user_config_path or get_user_config_path()
+    signature = _get_user_config_file_signature(user_config_path)
+    with _USER_CONFIG_CACHE_LOCK:
+        if _USER_CONFIG_FILE_CACHE and _USER_CONFIG_FILE_CACHE[0] == signature:
+            return _USER_CONFIG_FILE_CACHE[1]
 
     existing_config = UserConfig()
     try:
-        if user_config_path and os.path.exists(user_config_path):
+        if signature[1] is not None:
             with open(user_config_path, "r") as f:
                 existing_config = UserConfig(**json.load(f))
     except Exception:
         print("Error while loading user config")
         pass
 
+    with _USER_CONFIG_CACHE_LOCK:
+        _USER_CONFIG_FILE_CACHE = (signature, existing_config)
+    return existing_config
+
+
+def get_user_config():
+    existing_config = load_user_config_file()
+
     return UserConfig(
         LLM=existing_config.LLM or get_llm_provider_env(),
         OPENAI_API_KEY=existing_config.OPENAI_API_KEY or get_openai_api_key_env(),
@@ -127,67 +175,120 @@ def get_user_config():
     )
 
 
-def update_env_with_user_config():
-    user_config = get_user_config()
-    if user_config.LLM:
-        set_llm_provider_env(user_config.LLM)
-    if user_config.OPENAI_API_KEY:
-        set_openai_api_key_env(user_config.OPENAI_API_KEY)
-    if user_config.OPENAI_MODEL:
-        set_openai_model_env(user_config.OPENAI_MODEL)
-    if user_config.GOOGLE_API_KEY:
-        set_google_api_key_env(user_config.GOOGLE_API_KEY)
-    if user_config.GOOGLE_MODEL:
-        set_google_model_env(user_config.GOOGLE_MODEL)
-    if user_config.ANTHROPIC_API_KEY:
-        set_anthropic_api_key_env(user_config.ANTHROPIC_API_KEY)
-    if user_config.ANTHROPIC_MODEL:
-        set_anthropic_model_env(user_config.ANTHROPIC_MODEL)
-    if user_config.OLLAMA_URL:
-        set_ollama_url_env(user_config.OLLAMA_URL)
-    if user_config.OLLAMA_MODEL:
-        set_ollama_model_env(user_config.OLLAMA_MODEL)
-    if user_config.CUSTOM_LLM_URL:
-        set_custom_llm_url_env(user_config.CUSTOM_LLM_URL)
-    if user_config.CUSTOM_LLM_API_KEY:
-        set_custom_llm_api_key_env(user_config.CUSTOM_LLM_API_KEY)
-    if user_config.CUSTOM_MODEL:
-        set_custom_model_env(user_config.CUSTOM_MODEL)
-    if user_config.DISABLE_IMAGE_GENERATION is not None:
-        set_disable_image_generation_env(str(user_config.DISABLE_IMAGE_GENERATION))
-    if user_config.IMAGE_PROVIDER:
-        set_image_provider_env(user_config.IMAGE_PROVIDER)
-    if user_config.PIXABAY_API_KEY:
-        set_pixabay_api_key_env(user_config.PIXABAY_API_KEY)
-    if user_config.PEXELS_API_KEY:
-        set_pexels_api_key_env(user_config.PEXELS_API_KEY)
-    if user_config.COMFYUI_URL:
-        set_comfyui_url_env(user_config.COMFYUI_URL)
-    if user_config.COMFYUI_WORKFLOW:
-        set_comfyui_workflow_env(user_config.COMFYUI_WORKFLOW)
-    if user_config.DALL_E_3_QUALITY:
-        set_dall_e_3_quality_env(user_config.DALL_E_3_QUALITY)
-    if user_config.GPT_IMAGE_1_5_QUALITY:
-        set_gpt_image_1_5_quality_env(user_config.GPT_IMAGE_1_5_QUALITY)
-    if user_config.TOOL_CALLS is not None:
-        set_tool_calls_env(str(user_config.TOOL_CALLS))
-    if user_config.DISABLE_THINKING is not None:
-        set_disable_thinking_env(str(user_config.DISABLE_THINKING))
-    if user_config.EXTENDED_REASONING is not None:
-        set_extended_reasoning_env(str(user_config.EXTENDED_REASONING))
-    if user_config.WEB_GROUNDING is not None:
-        set_web_grounding_env(str(user_config.WEB_GROUNDING))
+def _get_user_config_env_values(
+    user_config: UserConfig,
+) -> List[Tuple[Callable, Callable, Optional[str]]]:
+    """Returns (getter, setter, value) of every env variable set from the config."""
 
+    def optional_bool(value: Optional[bool]) -> Optional[str]:
+        return str(value) if value is not None else None
 
-def save_user_config(user_config: UserConfig):
-    user_config_path = get_user_config_path_env()
+    return [
+        (get_llm_provider_env, set_llm_provider_env, user_config.LLM),
+        (get_openai_api_key_env, set_openai_api_key_env, user_config.OPENAI_API_KEY),
+        (get_openai_model_env, set_openai_model_env, user_config.OPENAI_MODEL),
+        (get_google_api_key_env, set_google_api_key_env, user_config.GOOGLE_API_KEY),
+        (get_google_model_env, set_google_model_env, user_config.GOOGLE_MODEL),
+        (
+            get_anthropic_api_key_env,
+            set_anthropic_api_key_env,
+            user_config.ANTHROPIC_API_KEY,
+        ),
+        (
+            get_anthropic_model_env,
+            set_anthropic_model_env,
+            user_config.ANTHROPIC_MODEL,
+        ),
+        (get_ollama_url_env, set_ollama_url_env, user_config.OLLAMA_URL),
+        (get_ollama_model_env, set_ollama_model_env, user_config.OLLAMA_MODEL),
+        (get_custom_llm_url_env, set_custom_llm_url_env, user_config.CUSTOM_LLM_URL),
+        (
+            get_custom_llm_api_key_env,
+            set_custom_llm_api_key_env,
+            user_config.CUSTOM_LLM_API_KEY,
+        ),
+        (get_custom_model_env, set_custom_model_env, user_config.CUSTOM_MODEL),
+        (
+            get_disable_image_generation_env,
+            set_disable_image_generation_env,
+            optional_bool(user_config.DISABLE_IMAGE_GENERATION),
+        ),
+        (get_image_provider_env, set_image_provider_env, user_config.IMAGE_PROVIDER),
+        (
+            get_pixabay_api_key_env,
+            set_pixabay_api_key_env,
+            user_config.PIXABAY_API_KEY,
+        ),
+        (get_pexels_api_key_env, set_pexels_api_key_env, user_config.PEXELS_API_KEY),
+        (get_comfyui_url_env, set_comfyui_url_env, user_config.COMFYUI_URL),
+        (
+            get_comfyui_workflow_env,
+            set_comfyui_workflow_env,
+            user_config.COMFYUI_WORKFLOW,
+        ),
+        (
+            get_dall_e_3_quality_env,
+            set_dall_e_3_quality_env,
+            user_config.DALL_E_3_QUALITY,
+        ),
+        (
+            get_gpt_image_1_5_quality_env,
+            set_gpt_image_1_5_quality_env,
+            user_config.GPT_IMAGE_1_5_QUALITY,
+        ),
+        (get_tool_calls_env, set_tool_calls_env, optional_bool(user_config.TOOL_CALLS)),
+        (
+            get_disable_thinking_env,
+            set_disable_thinking_env,
+            optional_bool(user_config.DISABLE_THINKING),
+        ),
+        (
+            get_extended_reasoning_env,
+            set_extended_reasoning_env,
+            optional_bool(user_config.EXTENDED_REASONING),
+        ),
+        (
+            get_web_grounding_env,
+            set_web_grounding_env,
+            optional_bool(user_config.WEB_GROUNDING),
+        ),
+    ]
 
-    if not user_config_path:
-        app_data_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "app_data"))
-        user_config_path = os.path.join(app_data_dir, "user_config.json")
+
+def update_env_with_user_config(force: bool = False):
+    """
+    Pushes the user config to the environment. Does nothing while the user
+    config file is unchanged since the last update, unless forced, and only
+    sets the variables whose value changed.
+    """
+    global _USER_CONFIG_ENV_SIGNATURE
+
+    signature = _get_user_config_file_signature(get_user_config_path())
+    if not force and signature == _USER_CONFIG_ENV_SIGNATURE:
+        return
+
+    changed = False
+    for get_env, set_env, value in _get_user_config_env_values(get_user_config()):
+        if value and get_env() != value:
+            set_env(value)
+            changed = True
+
+    if changed:
+        # Pooled LLM clients are bound to the credentials they were created with
+        LLM_CLIENT_REGISTRY.invalidate_stale()
+
+    with _USER_CONFIG_CACHE_LOCK:
+        _USER_CONFIG_ENV_SIGNATURE = signature
+
+
+def save_user_config(user_config: UserConfig):
+    user_config_path = get_user_config_path()
+    if not get_user_config_path_env():
         print(f"USER_CONFIG_PATH not set, using default for saving: {user_config_path}")
 
     with open(user_config_path, "w") as f:
         f.write(user_config.model_dump_json(indent=2))
-    
-    update_env_with_user_config()
+
+    # The file may be rewritten within the mtime resolution with the same size
+    invalidate_user_config_cache()
+    update_env_with_user_config(force=True)
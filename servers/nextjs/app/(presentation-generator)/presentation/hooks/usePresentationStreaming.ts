@@ -30,7 +30,7 @@ export const usePresentationStreaming = (
       trackEvent(MixpanelEvent.Presentation_Stream_API_Call);
 
       eventSource = new EventSource(
-        `/api/v1/ppt/presentation/stream/${presentationId}`
+        `/api/v1/ppt/presentation/stream/${presentationId}?out_of_order=true`
       );
 
       eventSource.addEventListener("response", (event) => {
@@ -48,10 +48,14 @@ export const usePresentationStreaming = (
                   partialData.slides.length !== previousSlidesLength.current &&
                   partialData.slides.length > 0
                 ) {
+                  // Slides arrive as they finish, keep them in deck order
+                  const slides = [...partialData.slides].sort(
+                    (a: any, b: any) => a.index - b.index
+                  );
                   dispatch(
                     setPresentationData({
                       ...partialData,
-                      slides: partialData.slides,
+                      slides,
                     })
                   );
                   previousSlidesLength.current = partialData.slides.length;